@@ -0,0 +1,382 @@
+"""
+Module Name: Benchmark_Migration.py
+
+Description:
+This is a local benchmark of Data_Migration.Start, without Databricks, Azure or Google:
+1.) Fake_DBUtils        => Secrets, File System, Notebook Context and Library of dbutils
+2.) Local_Migration     => Data_Migration on the local filesystem (file://) instead of abfss://,
+                           a synthetic GA4 source and a stubbed JDBC sink as the Destination Zone
+3.) Benchmark_Migration => Runs the Lineage DS => LZ => RZ => BL => SL => GL => DZ
+                           for each dataset size and reports the throughput per layer
+
+Usage:
+python Benchmark_Migration.py --rows 1000000 10000000 100000000 --cardinality 1000
+python Benchmark_Migration.py --rows 1000000 --layers DS LZ RZ BL --root /tmp/DM_Benchmark
+python Benchmark_Migration.py --rows 1000000 --dz-type SQLServer/Bulk --dz-mode upsert
+
+Requirements:
+* pyspark and a Java runtime
+* delta-spark for the Delta layers (BL, SL, GL); without it they are written as parquet
+
+Tips:
+* The synthetic GA4 source is generated by Spark (spark.range), the real API paging
+  is not part of the DS ::> LZ figures
+* The Destination Zone runs the real write_Database (partitioning, bulk copy, staging,
+  upsert and retries) into Spark's noop sink, the SQL Server statements are only recorded,
+  so the GL ::> DZ figures exclude the database itself
+* Run the same sizes before and after a change to compare the Rows/Second per layer
+
+Author: Erwin Bernard Talento
+Email: etalento.contractor@xxx.xxx
+"""
+
+class Fake_Value:
+    # ======== Stand-in of the Scala Option returned by the Notebook Context
+    def __init__ (
+            self,
+            arg_Value
+        ):
+        self._Value = arg_Value
+
+    def get (
+            self
+        ):
+        return self._Value
+
+class Fake_DBUtils:
+    # ======== Stand-in of the dbutils used by Data_Migration
+    def __init__ (
+            self,
+            arg_Secrets = None
+        ):
+        from types import SimpleNamespace
+        self._Secrets = arg_Secrets or {}
+        vContext = SimpleNamespace(
+            notebookPath = lambda: Fake_Value("/Local/Benchmark_Migration"),
+            userName = lambda: Fake_Value("benchmark")
+        )
+        self.secrets = SimpleNamespace(get = self.get_Secret)
+        self.fs = SimpleNamespace(ls = self.list_Path)
+        self.library = SimpleNamespace(restartPython = lambda: None)
+        self.notebook = SimpleNamespace(
+            exit = lambda arg_Value: None,
+            entry_point = SimpleNamespace(
+                getDbutils = lambda: SimpleNamespace(
+                    notebook = lambda: SimpleNamespace(
+                        getContext = lambda: vContext
+                    )
+                )
+            )
+        )
+
+    def get_Secret (
+            self,
+            scope,
+            key
+        ):
+        # ======== Any secret that is not given resolves to its own Key
+        return self._Secrets.get((scope, key), key)
+
+    def list_Path (
+            self,
+            arg_Path
+        ):
+        import os
+        vPath = arg_Path.replace("file://", "", 1)
+        if not os.path.isdir(vPath):
+            raise FileNotFoundError(arg_Path)
+        return os.listdir(vPath)
+
+class Benchmark_Migration:
+
+    App = {
+        "Metadata" : {
+            "Name" : "Benchmark_Migration",
+            "Version" : 1.00
+        },
+        "Config" : {
+            "Module" : "Data_Migration.py",
+            "Root" : "/tmp/DM_Benchmark",
+            "MediaType" : "GA4",
+            "MediaClass" : "Bench_GA4",
+            "Rows" : [1000000, 10000000, 100000000],
+            # ======== Distinct Source / Medium values of the synthetic GA4 source
+            "Cardinality" : 1000,
+            "Days" : 365,
+            "Lineage" : ["DS", "LZ", "RZ", "BL", "SL", "GL", "DZ"],
+            "DZ" : {
+                "Type" : "SQLServer", # or "SQLServer/Bulk"
+                "Mode" : "overwrite" # "overwrite", "append" or "upsert"
+            },
+            "Spark" : {
+                "spark.master" : "local[*]",
+                "spark.sql.shuffle.partitions" : "64",
+                "spark.driver.memory" : "8g"
+            }
+        }
+    }
+
+    def __init__ (
+            self,
+            arg_Config = None
+        ):
+        # ======== Local Spark session, fake dbutils and the Data_Migration classes
+        import copy
+        # ======== Each instance gets its own copy, the class-level defaults stay untouched
+        self._Config = copy.deepcopy(self.App["Config"])
+        if arg_Config is not None:
+            self._Config.update(arg_Config)
+        self._Results = []
+        self._Spark = self.get_Spark()
+        self._Module = self.load_Module()
+        return
+
+    def get_Spark (
+            self
+        ):
+        from pyspark.sql import SparkSession
+        vBuilder = SparkSession.builder.appName(self.App["Metadata"]["Name"])
+        for vKey, vValue in self._Config["Spark"].items():
+            vBuilder = vBuilder.config(vKey, vValue)
+        try:
+            # ======== Delta Lake for the BL, SL and GL layers
+            from delta import configure_spark_with_delta_pip
+            vBuilder = vBuilder \
+                .config("spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension") \
+                .config("spark.sql.catalog.spark_catalog", "org.apache.spark.sql.delta.catalog.DeltaCatalog")
+            self._isDelta = True
+            return configure_spark_with_delta_pip(vBuilder).getOrCreate()
+        except ImportError:
+            self._isDelta = False
+            return vBuilder.getOrCreate()
+
+    def load_Module (
+            self
+        ):
+        # ======== Execute Data_Migration.py with the notebook globals it expects
+        # The notebook defines Data_Specs and Shared_MainLib before Data_Migration
+        vSource = open(self._Config["Module"]).read()
+        vSpecs = vSource.index("class Data_Specs:")
+        vMigration = vSource.index("class Data_Migration (")
+        vModule = {
+            "__name__" : "Data_Migration",
+            "spark" : self._Spark,
+            "dbutils" : Fake_DBUtils(),
+            "display" : lambda arg_DataFrame: arg_DataFrame.show(20, truncate = False)
+        }
+        exec(compile(vSource[vSpecs:], self._Config["Module"], "exec"), vModule)
+        exec(compile(vSource[vMigration:vSpecs], self._Config["Module"], "exec"), vModule)
+        vModule["Local_Migration"] = self.get_LocalMigration(vModule["Data_Migration"])
+        return vModule
+
+    def get_LocalMigration (
+            self,
+            arg_DataMigration
+        ):
+        vConfig = self._Config
+        vSpark = self._Spark
+
+        class Local_Migration (arg_DataMigration):
+            # ======== Data_Migration with local stand-ins for Azure Blob, GA4 and SQL Server
+            BenchRows = 0
+
+            def get_AzureDFS (
+                    self,
+                    arg_AccountScope,
+                    arg_AccountKey,
+                    arg_ContainerScope,
+                    arg_ContainerKey,
+                    arg_StoragePath
+                ):
+                # ======== Local directory in place of abfss://<container>@<account>.dfs.core.windows.net
+                self.reset_Status("FailedDFS", arg_StoragePath)
+                vPath_Domain = f'file://{vConfig["Root"]}/Blob'
+                if isinstance(arg_StoragePath, list):
+                    self._ReturnValue = [f"{vPath_Domain}/{vPath}" for vPath in arg_StoragePath]
+                else:
+                    self._ReturnValue = f"{vPath_Domain}/{arg_StoragePath}"
+                self.DFS_Path = self._ReturnValue
+                self._ReturnStatus = True
+                return self._ReturnStatus
+
+            def pull_GA4API (
+                    self,
+                    arg_Credentials,
+                    arg_PropertyID,
+                    arg_StartDate,
+                    arg_EndDate,
+                    arg_Dimensions,
+                    arg_Metrics,
+                    arg_Offset,
+                    arg_Limit,
+                    arg_Filter = None
+                ):
+                # ======== Synthetic GA4 report of Rows rows, all values as strings like the API (date as yyyyMMdd)
+                from pyspark.sql.functions import (
+                    col,
+                    lit,
+                    array,
+                    concat,
+                    date_add,
+                    to_date,
+                    element_at,
+                    date_format
+                )
+                self.reset_Status("FailedGA4Pull")
+                try:
+                    vCountries = array(*[lit(vCountry) for vCountry in ["CA", "NZ", "US", "GB", "AU", "PH", "DE", "FR"]])
+                    vMediums = array(*[lit(vMedium) for vMedium in ["organic", "cpc", "referral", "email", "(none)"]])
+                    retVal = vSpark.range(self.BenchRows).select(
+                        date_format(
+                            date_add(to_date(lit(arg_StartDate)), (col("id") % vConfig["Days"]).cast("int")),
+                            "yyyyMMdd"
+                        ).alias("date"),
+                        element_at(vCountries, (col("id") % 8 + 1).cast("int")).alias("countryId"),
+                        concat(
+                            lit("source"),
+                            (col("id") % vConfig["Cardinality"]).cast("string"),
+                            lit(" / "),
+                            element_at(vMediums, (col("id") % 5 + 1).cast("int"))
+                        ).alias("sourceMedium"),
+                        ((col("id") * 7919) % 97).cast("string").alias("sessions")
+                    )
+                    self._TotalRows = self.BenchRows
+                    self._TotalColumns = len(retVal.columns)
+                    self._ColumnNames = retVal.columns
+                    self._ReturnValue = retVal
+                    self._ReturnStatus = True
+                except Exception as ExceptionError:
+                    self._Exception = ExceptionError
+                return self._ReturnStatus
+
+            def read_Watermark (
+                    self,
+                    arg_URL,
+                    arg_DBUser,
+                    arg_DBPass,
+                    arg_Driver,
+                    arg_DBTable,
+                    arg_Column
+                ):
+                # ======== No watermark, the first upsert of a table takes the first load path, the next ones MERGE
+                is_TargetExists = arg_DBTable in self.BenchTables
+                self.BenchTables.add(arg_DBTable)
+                return None, is_TargetExists
+
+            def exec_Database (
+                    self,
+                    arg_URL,
+                    arg_DBUser,
+                    arg_DBPass,
+                    arg_Driver,
+                    arg_Statements
+                ):
+                # ======== The staged rows went to the noop sink, the statements are recorded instead of run
+                self.reset_Status("FailedDBExec")
+                self.BenchStatements.extend(arg_Statements)
+                self._ReturnStatus = True
+                return self._ReturnStatus
+
+        return Local_Migration
+
+    def set_Config (
+            self,
+            arg_Migration
+        ):
+        # ======== Benchmark Media Class and local switches on the shared configuration
+        import copy
+        vMedia = arg_Migration.AppConfig["Media"][self._Config["MediaType"]]
+        vMediaClass = copy.deepcopy(vMedia["Class"]["Demo_GA4"])
+        vMediaClass["Schema"]["Transformation"] = {
+            "Filter" : vMediaClass["Schema"]["Transformation"]["Filter"],
+            "Sort" : vMediaClass["Schema"]["Transformation"]["Sort"]
+        }
+        vMedia["Class"][self._Config["MediaClass"]] = vMediaClass
+        # ======== Stubbed JDBC sink, write_Database still plans, partitions, stages and retries
+        vProvider = vMedia["Stage"]["DZ"]["Provider"]
+        vProvider["Type"] = self._Config["DZ"]["Type"]
+        vProvider["Format"] = "noop"
+        vProvider["Bulk"]["Format"] = "noop"
+        vProvider["Write"]["Mode"] = self._Config["DZ"]["Mode"]
+        if self._isDelta is False:
+            for vLayer in ["BL", "SL", "GL"]:
+                vMedia["Stage"][vLayer]["Provider"]["Format"] = "parquet"
+        arg_Migration.AppConfig["Main"]["Switchboard"]["CatalogWrite"] = False
+        arg_Migration.AppConfig["Main"]["Switchboard"]["ActivityStat"] = False
+        arg_Migration.AppConfig["Main"]["Switchboard"]["DebugMode"] = False
+        arg_Migration.AppConfig["Main"]["Switchboard"]["SilentMode"] = True
+        arg_Migration.LibConfig["Main"]["Switchboard"]["CloudLog"] = False
+        # ======== The synthetic GA4 source needs no Google client
+        arg_Migration.LibConfig["Main"]["Dependencies"]["GA4"] = {}
+        arg_Migration.LibConfig["Main"]["Switchboard"]["FileLog"] = False
+        arg_Migration.LibConfig["Main"]["Switchboard"]["SilentMode"] = True
+        return True
+
+    def Run (
+            self
+        ):
+        import time
+        vMigration = self._Module["Local_Migration"]()
+        self.set_Config(vMigration)
+        vLineage = self._Config["Lineage"]
+        for vRows in self._Config["Rows"]:
+            vMigration.BenchRows = vRows
+            vMigration.BenchTables = set()
+            vMigration.BenchStatements = []
+            for vSource, vTarget in zip(vLineage, vLineage[1:]):
+                vStart = time.perf_counter()
+                vMigration.Start(self._Config["MediaType"], self._Config["MediaClass"], vSource, vTarget)
+                vSeconds = time.perf_counter() - vStart
+                vResponse = vMigration.App["Response"]
+                vResult = {
+                    "Rows" : vRows,
+                    "Hop" : f"{vSource} ::> {vTarget}",
+                    "Success" : vResponse["Success"],
+                    "Seconds" : round(vSeconds, 3),
+                    "RowsPerSecond" : round(vResponse["Schema"]["Rows"]["GrossTotal"] / vSeconds) if vSeconds else None,
+                    "Stages" : vResponse["Header"]["App"]["Statistics"].get("Stages", {})
+                }
+                self._Results.append(vResult)
+                self.show_Result(vResult)
+                if vResponse["Success"] is False:
+                    print(f'      Error ::> {vResponse["Failure"]["Message"]["Exception"]}')
+                    break
+        return self._Results
+
+    def show_Result (
+            self,
+            arg_Result
+        ):
+        vStages = ", ".join(f'{vStage} {vSpan.get("Seconds")}s' for vStage, vSpan in arg_Result["Stages"].items())
+        print(
+            f'{format(arg_Result["Rows"], ","):>13} rows ::> {arg_Result["Hop"]:<9} '
+            f'{"OK" if arg_Result["Success"] else "FAILED":<6} {arg_Result["Seconds"]:>9}s '
+            f'{format(arg_Result["RowsPerSecond"] or 0, ","):>12} rows/s  [{vStages}]'
+        )
+
+if __name__ == "__main__":
+    import json
+    import argparse
+    vParser = argparse.ArgumentParser(description = "Local throughput benchmark of Data_Migration")
+    vParser.add_argument("--rows", type = int, nargs = "+", default = Benchmark_Migration.App["Config"]["Rows"])
+    vParser.add_argument("--cardinality", type = int, default = Benchmark_Migration.App["Config"]["Cardinality"])
+    vParser.add_argument("--layers", nargs = "+", default = Benchmark_Migration.App["Config"]["Lineage"])
+    vParser.add_argument("--root", default = Benchmark_Migration.App["Config"]["Root"])
+    vParser.add_argument("--dz-type", default = Benchmark_Migration.App["Config"]["DZ"]["Type"], choices = ["SQLServer", "SQLServer/Bulk"])
+    vParser.add_argument("--dz-mode", default = Benchmark_Migration.App["Config"]["DZ"]["Mode"], choices = ["overwrite", "append", "upsert"])
+    vParser.add_argument("--output", default = None, help = "Write the results as JSON")
+    vArgs = vParser.parse_args()
+    vBenchmark = Benchmark_Migration({
+        "Rows" : vArgs.rows,
+        "Cardinality" : vArgs.cardinality,
+        "Lineage" : vArgs.layers,
+        "Root" : vArgs.root,
+        "DZ" : {
+            "Type" : vArgs.dz_type,
+            "Mode" : vArgs.dz_mode
+        }
+    })
+    vResults = vBenchmark.Run()
+    if vArgs.output is not None:
+        with open(vArgs.output, "w") as vFile:
+            json.dump(vResults, vFile, indent = 4, default = str)
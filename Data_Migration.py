@@ -57,6 +57,19 @@ class Data_Migration (Data_Specs, Shared_MainLib):
             # save the Exception of SharedLib if existing
             vSharedLibException = self.clean_Exception()
             self._DataAttributes = ["Metrics", "Dimensions"]
+            self._ChainLineage = False
+            self._Handoff = None
+            self._Worker = False
+            # ======== Pristine Response of the session, restored on every Start
+            if getattr(Data_Migration, "_ResponseTemplate", None) is None:
+                import copy
+                Data_Migration._ResponseTemplate = copy.deepcopy(self.App["Response"])
+            self._DatedSubDirs = {"y/m/d", "y/m-d", "y-m-d"}
+            # ======== Media Classes with their own case in the Transformation Area - Adding Columns
+            # Their source scan is not pruned, the columns they read are only known to their code
+            self._CodedClasses = {
+                "GA4" : {"Page_Metrics", "Demo_GA4"}
+            }
             # ======== Transfer the traits to Common Library
             if arg_Datahouse is not None:
                 self.App["Metadata"]["Datahouse"] = arg_Datahouse
@@ -82,7 +95,9 @@ class Data_Migration (Data_Specs, Shared_MainLib):
             arg_MediaType,
             arg_MediaClass,
             arg_Source,
-            arg_Target = 'Auto'
+            arg_Target = 'Auto',
+            arg_StartDate = None,
+            arg_EndDate = None
         ):
         TraceMsg = None
         vStartSuccess = False
@@ -100,14 +115,31 @@ class Data_Migration (Data_Specs, Shared_MainLib):
             vCompleteCaller = f'{arg_MediaType}\\{arg_MediaClass} {self.App["Request"]["Caller"]} - {vCallerSource} ::> {vCallerTarget}'
         except Exception:
             vCompleteCaller =  vCallerUnknown
+        vPrunedColumns = set()
+        # ======== Secret lookups of this run only, other instances and workers keep their own
+        self._SecretStats = {
+            "Hits" : 0,
+            "Misses" : 0
+        }
+        is_ChangeFeed = False
+        is_HandedOff = False
+        is_DryRun = False
         # ======== Import the traceback module for error handling
         import traceback
+        import copy
         try:
+            # ======== A reused session keeps the Response of the previous Start
+            self.App["Response"] = copy.deepcopy(self._ResponseTemplate)
             self._TotalRows = 0
             self._AddedColumns = 0
             self._PurgedColumns = 0
             self._UpdatedColumns = 0
             self._RenamedColumns = 0
+            self._TargetStats = {}
+            self._SourceVersion = None
+            self._Spans = {}
+            is_DryRun = self.AppConfig["Main"]["Switchboard"]["DryRun"]
+            self.LibConfig["Main"]["Switchboard"]["DryRun"] = is_DryRun
             is_ErrorSimulated = False
             is_MigrationError = False
             self._MediaType = arg_MediaType
@@ -139,7 +171,8 @@ class Data_Migration (Data_Specs, Shared_MainLib):
             self.App["Response"]["Header"]["App"]["Environment"] = self._Environment
             self.App["Response"]["Header"]["App"]["Mode"] = {
                 "Test" : self.AppConfig["Main"]["Switchboard"]["TestMode"],
-                "Debug" : self.AppConfig["Main"]["Switchboard"]["DebugMode"]
+                "Debug" : self.AppConfig["Main"]["Switchboard"]["DebugMode"],
+                "DryRun" : is_DryRun
             }
             # ======== Get the notebook path
             vAppPath = dbutils.notebook.entry_point.getDbutils().notebook().getContext().notebookPath().get()
@@ -229,30 +262,8 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                 vCallerTarget = self.AppConfig["Main"]["Data"]["Label"][self._Target]
                 vCallerSource = self.AppConfig["Main"]["Data"]["Label"][self._Source]
                 vCompleteCaller = f'{arg_MediaType}\\{arg_MediaClass} {self.App["Request"]["Caller"]} - {vCallerSource} ::> {vCallerTarget}'
-            from pyspark.sql.functions import (
-                col,
-                lit,
-                sha2,
-                split,
-                count,
-                concat,
-                concat_ws,
-                substring,
-                date_format,
-                collect_list,
-                regexp_extract,
-                regexp_replace,
-                sum as spark_sum,
-                current_timestamp
-            )
-            from pyspark.sql import (
-                Row,
-                SparkSession
-            )
-            from pyspark.sql.types import (
-                LongType,
-                TimestampType
-            )
+            SparkSession = self.get_Import("pyspark.sql", "SparkSession")
+            StorageLevel = self.get_Import("pyspark", "StorageLevel")
             # ======== Show the module name, version, datahouse and its environment
             self.show_Info("Module", f'{self.App["Metadata"]["Name"]} v{self.App["Metadata"]["Version"]}', "blue")
             self.show_Info("Datahouse", f'{self.App["Metadata"]["Datahouse"]}', "blue")
@@ -260,6 +271,31 @@ class Data_Migration (Data_Specs, Shared_MainLib):
             vAppConfigMediaClass = self.AppConfig["Media"][self._MediaType]["Class"][self._MediaClass]
             vAppConfigStageSource = self.AppConfig["Media"][self._MediaType]["Stage"][self._Source]
             vSchemaTransformation = vAppConfigMediaClass["Schema"]["Transformation"]
+            # ======== Check the date range before any path is built
+            if arg_StartDate is not None or arg_EndDate is not None:
+                if arg_StartDate is None:
+                    raise MigrationError(
+                        self.show_ErrorMsg("InvalidDateRange", f"EndDate {arg_EndDate} needs a StartDate")
+                    )
+                if vAppConfigStageSource["Provider"]["Type"] != "Azure/Blob" or \
+                    vAppConfigStageSource["Provider"].get("SubDir", {}).get("Path") not in self._DatedSubDirs:
+                    # ======== A full read would silently ignore the range
+                    raise MigrationError(
+                        self.show_ErrorMsg("InvalidDateRange", f"{self._Source} has no dated SubDir")
+                    )
+                if arg_EndDate is None:
+                    arg_EndDate = datetime.now().strftime('%Y-%m-%d')
+                try:
+                    vRangeStart = datetime.strptime(str(arg_StartDate), '%Y-%m-%d')
+                    vRangeEnd = datetime.strptime(str(arg_EndDate), '%Y-%m-%d')
+                except ValueError:
+                    raise MigrationError(
+                        self.show_ErrorMsg("InvalidDateRange", f"{arg_StartDate} - {arg_EndDate} is not YYYY-MM-DD")
+                    )
+                if vRangeStart > vRangeEnd:
+                    raise MigrationError(
+                        self.show_ErrorMsg("InvalidDateRange", f"{arg_StartDate} is after {arg_EndDate}")
+                    )
             # ======== Check if debug mode is enabled
             if self.AppConfig["Main"]["Switchboard"]["DebugMode"] is True:
                 # ======== Set debug directory path
@@ -290,6 +326,7 @@ class Data_Migration (Data_Specs, Shared_MainLib):
             self.App["Response"]["Header"]["App"]["Caller"]["MediaClass"] = self._MediaClass
             self.App["Response"]["Header"]["App"]["Caller"]["Source"] = self._Source
             self.App["Response"]["Header"]["App"]["Caller"]["Target"] = self._Target
+            self.App["Response"]["Header"]["App"]["Caller"]["DateRange"] = None
             # ======== Start a Spark session
             spark = SparkSession.builder.appName("Transfer_Data").config("spark.serializer", "org.apache.spark.serializer.KryoSerializer").getOrCreate()
             """
@@ -329,8 +366,34 @@ class Data_Migration (Data_Specs, Shared_MainLib):
             vTargetName = vMediaClassTarget
             if '/' in vTargetName:
                 vTargetName = vTargetName.replace('/', '_')
+            # ======== Is the source still in memory from the previous hop?
+            vHandoffKey = (self._MediaType, self._MediaClass, self._Source)
+            if self._Handoff is not None and self._Handoff["Key"] == vHandoffKey:
+                vSourceType = "Memory"
+            else:
+                vSourceType = vAppConfigStageSource["Provider"]["Type"]
+            if is_DryRun is True and vSourceType.startswith("API/"):
+                # ======== An API source only exists once it is pulled
+                raise MigrationError(
+                    self.show_ErrorMsg("InvalidDryRun", vSourceType)
+                )
+            # ======== A display-only run reads no more than the previewed rows
+            vPreview = None
+            if self._Target == "Read" and self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is True:
+                vPreview = self.AppConfig["Main"]["Preview"]
             # ======== Read Source
-            match vAppConfigStageSource["Provider"]["Type"]:
+            self.start_Span("Source")
+            match vSourceType:
+                case "Memory":
+                    # ======== Written layer of the previous hop, no re-read from the Blob
+                    vSourceLoc = f"Memory ::> {self._Handoff['Location']}"
+                    self.reset_Status("FailedSourceRead")
+                    self._ReturnValue = self._Handoff["Data"]
+                    self._TotalColumns = len(self._ReturnValue.columns)
+                    self._ColumnNames = self._ReturnValue.columns
+                    self._ReturnStatus = True
+                    self._Handoff = None
+
                 # case "API/FB":
                     # ╔════════════════════════════════════════════╗
                     # ║ Data Source (Media Type) & other use cases ║
@@ -342,14 +405,11 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                     #     vAssortedData = self._ReturnValue
 
                 case "API/GA4":
-                    try:
-                        %pip show google-analytics-data > /dev/null 2>&1
-                    except Exception as ExceptionError:
-                        self.show_Info("Installing", "Google Analytics")
-                        %pip install --upgrade google-analytics-data > /dev/null 2>&1
-                        %pip install --upgrade google-auth > /dev/null 2>&1
-                        %pip install --upgrade google-auth-oauthlib > /dev/null 2>&1
-                        %pip install --upgrade google-auth-httplib2 > /dev/null 2>&1
+                    # ======== Google Analytics client has to be a cluster library
+                    if self.check_Dependencies("GA4") is False:
+                        raise MigrationError(
+                            self.show_ErrorMsg()
+                        )
                     # ======== Check if StartDate is not set
                     if vAppConfigMediaClass["API"]["StartDate"] is None:
                         # ======== Incremental
@@ -368,35 +428,35 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                     # ======== Populate GA4 credentials from Vault
                     vSourceAccountAPI = vAppConfigStageSource["Provider"]["Account"]
                     vSourceSecretAPI = vAppConfigStageSource["Secret"]
-                    vX509 = dbutils.secrets.get(
-                        scope=vSourceSecretAPI["URLx509"]["Scope"], 
-                        key=vSourceSecretAPI["URLx509"]["Key"]
+                    vX509 = self.get_Secret(
+                        arg_Scope=vSourceSecretAPI["URLx509"]["Scope"], 
+                        arg_Key=vSourceSecretAPI["URLx509"]["Key"]
                     )
                     vCredentials = {
                         "type": vSourceAccountAPI["Type"], 
                         "auth_uri": vSourceAccountAPI["URL_Auth"], 
                         "token_uri": vSourceAccountAPI["URL_Token"], 
                         "auth_provider_x509_cert_url": vX509, 
-                        "project_id": dbutils.secrets.get(
-                                scope=vSourceSecretAPI["ProjectID"]["Scope"], 
-                                key=vSourceSecretAPI["ProjectID"]["Key"]
+                        "project_id": self.get_Secret(
+                                arg_Scope=vSourceSecretAPI["ProjectID"]["Scope"], 
+                                arg_Key=vSourceSecretAPI["ProjectID"]["Key"]
                             ), 
-                        "client_email": dbutils.secrets.get(
-                                scope=vSourceSecretAPI["ClientEmail"]["Scope"], 
-                                key=vSourceSecretAPI["ClientEmail"]["Key"]
+                        "client_email": self.get_Secret(
+                                arg_Scope=vSourceSecretAPI["ClientEmail"]["Scope"], 
+                                arg_Key=vSourceSecretAPI["ClientEmail"]["Key"]
                             ), 
-                        "client_id": dbutils.secrets.get(
-                                scope=vSourceSecretAPI["ClientID"]["Scope"], 
-                                key=vSourceSecretAPI["ClientID"]["Key"]
+                        "client_id": self.get_Secret(
+                                arg_Scope=vSourceSecretAPI["ClientID"]["Scope"], 
+                                arg_Key=vSourceSecretAPI["ClientID"]["Key"]
                             ), 
                         "client_x509_cert_url": vX509,
-                        "private_key_id": dbutils.secrets.get(
-                                scope=vSourceSecretAPI["PrivateKeyID"]["Scope"], 
-                                key=vSourceSecretAPI["PrivateKeyID"]["Key"]
+                        "private_key_id": self.get_Secret(
+                                arg_Scope=vSourceSecretAPI["PrivateKeyID"]["Scope"], 
+                                arg_Key=vSourceSecretAPI["PrivateKeyID"]["Key"]
                             ), 
-                        "private_key" : dbutils.secrets.get(
-                                scope=vSourceSecretAPI["PrivateKey"]["Scope"], 
-                                key=vSourceSecretAPI["PrivateKey"]["Key"]
+                        "private_key" : self.get_Secret(
+                                arg_Scope=vSourceSecretAPI["PrivateKey"]["Scope"], 
+                                arg_Key=vSourceSecretAPI["PrivateKey"]["Key"]
                             ).replace("\\n", "\n")
                     }
                     """
@@ -449,16 +509,83 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                     # ======== End of GA4 Block
 
                 case "Azure/Blob":
-                    # ======== Get full source location path
-                    # e.g., Google/GA4/LZ/GA4-Page_Daily-LZ
-                    vSourceLoc = self.get_MediaPath(
-                        vPath_ParentDir,
-                        self._MediaType,
-                        vMediaClassSource,
-                        self._Source,
-                        vAppConfigStageSource["Provider"]["SubDir"]["Path"],
-                        vAppConfigStageSource["Provider"]["SubDir"]["Extension"]
-                    )
+                    """
+                    ╔═════════════════════════════╗
+                    ║ PROPER USAGE of DATE RANGES ║
+                    ╚═════════════════════════════╝
+                    Reads every day of a dated SubDir ("y/m/d", "y/m-d", "y-m-d") in one scan
+                    Start("GA4", "Demo_GA4", "RZ", "Auto", "2025-01-01", "2025-01-07")
+                    Missing days are skipped; EndDate defaults to today
+                    """
+                    if arg_StartDate is not None:
+                        # ======== Get the source location path of each day, the range is checked above
+                        # e.g., Google/GA4/RZ/GA4-Page_Daily-RZ/2025/01/01
+                        vSourceLoc = self.get_MediaPaths(
+                            vPath_ParentDir,
+                            self._MediaType,
+                            vMediaClassSource,
+                            self._Source,
+                            vAppConfigStageSource["Provider"]["SubDir"]["Path"],
+                            vAppConfigStageSource["Provider"]["SubDir"]["Extension"],
+                            arg_StartDate,
+                            arg_EndDate
+                        )
+                        if not vSourceLoc:
+                            raise MigrationError(
+                                self.show_ErrorMsg("InvalidDateRange", f"{arg_StartDate} - {arg_EndDate}")
+                            )
+                        self.App["Response"]["Header"]["App"]["Caller"]["DateRange"] = f"{arg_StartDate} - {arg_EndDate}"
+                    else:
+                        # ======== Get full source location path
+                        # e.g., Google/GA4/LZ/GA4-Page_Daily-LZ
+                        vSourceLoc = self.get_MediaPath(
+                            vPath_ParentDir,
+                            self._MediaType,
+                            vMediaClassSource,
+                            self._Source,
+                            vAppConfigStageSource["Provider"]["SubDir"]["Path"],
+                            vAppConfigStageSource["Provider"]["SubDir"]["Extension"]
+                        )
+                    # ======== Columns that are dropped anyway are not read from the Blob
+                    vPrunedColumns = self.get_PrunedColumns(vAppConfigMediaClass)
+                    """
+                    ╔══════════════════════════════╗
+                    ║ PROPER USAGE of CHANGE FEEDS ║
+                    ╚══════════════════════════════╝
+                    "Stage" : {
+                        "SL" : {
+                            "Provider" : {
+                                "Format" : "delta",
+                                "ChangeFeed" : True, # Written with Change Data Feed, read as changes only
+                        "GL" : {
+                            "Provider" : {
+                                "Write" : {
+                                    "Mode" : "merge" # Merged on the "Upsert" Keys of the Media Class
+                    The last processed version is kept per Media Class and Target in the Audit Catalog
+                    """
+                    is_ChangeFeed = vAppConfigStageSource["Provider"]["Format"] == "delta" and \
+                        vAppConfigStageSource["Provider"].get("ChangeFeed") is True and \
+                        self._Target != "Read"
+                    vLastVersion = None
+                    if is_ChangeFeed is True:
+                        vAppConfigStageTarget = self.AppConfig["Media"][self._MediaType]["Stage"][self._Target]
+                        if vAppConfigStageTarget["Provider"]["Write"]["Mode"] == "overwrite":
+                            # ======== Overwriting with the changes only would lose the unchanged rows
+                            raise MigrationError(
+                                self.show_ErrorMsg("InvalidChangeFeed", f"{self._Source} ::> {self._Target}")
+                            )
+                        if vAppConfigStageTarget["Provider"]["Write"]["Mode"] == "merge" and \
+                            not vAppConfigMediaClass.get("Upsert", {}).get("Keys"):
+                            # ======== Merging the changes needs the keys of the rows
+                            raise MigrationError(
+                                self.show_ErrorMsg("MissingUpsertKeys", f"{self._MediaClass} ::> {self._Target}")
+                            )
+                        vLastVersion = self.get_DeltaVersion(
+                            self._MediaType,
+                            self._MediaClass,
+                            self._Source,
+                            self._Target
+                        )
                     # ======== Read Blob
                     self.read_AzureBlob(
                             vAppConfigStageSource["Secret"]["StorageAccount"]["Scope"],
@@ -466,12 +593,20 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                             vAppConfigStageSource["Secret"]["StorageContainer"]["Scope"],
                             vAppConfigStageSource["Secret"]["StorageContainer"]["Key"],
                             vSourceLoc,
-                            vAppConfigStageSource["Provider"]
+                            vAppConfigStageSource["Provider"],
+                            vPrunedColumns,
+                            is_ChangeFeed,
+                            vLastVersion,
+                            vPreview,
+                            vAppConfigMediaClass.get("Upsert", {}).get("Keys")
                         )
 
                 case _:
                     self.reset_Status("InvalidSourceType")
 
+            if isinstance(vSourceLoc, list):
+                # ======== Show the first and last day of a date range
+                vSourceLoc = f"{vSourceLoc[0]} .. {vSourceLoc[-1]}"
             # ======== Check if read operation was successful
             if self._ReturnStatus is False:
                 # ======== Failed Source Reading
@@ -484,561 +619,35 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                 self.show_Info("Source", f"{vSourceLoc} ::> Successful")
                 # ======== Retrieve the returned data
                 vAssortedData = self._ReturnValue
-                if self._TotalRows == 0:
+                # ======== Cache the source only when more than one Spark action will scan it
+                vStorageLevel = self.AppConfig["Main"]["Data"]["StorageLevel"]
+                if vStorageLevel is not None and is_DryRun is False and self.get_PlannedActions(vAppConfigMediaClass) > 1:
+                    vAssortedData.persist(getattr(StorageLevel, vStorageLevel))
+                    self.show_Info("Persisted", f"Source ::> {vStorageLevel}")
+                if self._TotalRows == 0 and is_DryRun is False:
+                    # ======== Deferred count of a filtered or limited read, it also fills the cache above
                     self._TotalRows = vAssortedData.count()
+                self.end_Span("Source", self._TotalRows, vAssortedData)
+                vSourceData = vAssortedData
                 self.App["Response"]["Schema"]["Rows"]["GrossTotal"] = self._TotalRows
-                # ======== Do we need to run Data Quality Checks?
-                if self._Target != "Read" and \
-                    self.AppConfig["Main"]["Switchboard"]["QualityCheck"] is True and \
-                    vAppConfigMediaClass["Schema"]["Quality"]["Duplicates"]["Remove"] is True and \
-                    vAppConfigMediaClass["Schema"]["Quality"]["Duplicates"]["Fields"] and \
-                    self._TotalRows != 0:
-                    # ╔════════════════════════════════════════════╗
-                    # ║ Data Quality Check - Remove Duplicate Rows ║
-                    # ╚════════════════════════════════════════════╝
-                    vDupliFields = vAppConfigMediaClass["Schema"]["Quality"]["Duplicates"]["Fields"]
-                    vIncludedColumns = [col for col in vAssortedData.columns if not col.startswith("Row_")]
-                    vDuplicateData = vAssortedData.select(*vIncludedColumns)
-                    """
-                    ╔═════════════════════════════════════════╗
-                    ║ PROPER USAGE of DROPPING DUPLICATE ROWS ║
-                    ╚═════════════════════════════════════════╝
-                    "Media" : {
-                        "<MediaType>" : {
-                            "Class" : {
-                                "<MediaClass>" : {
-                                    "Schema" : {
-                                        "Quality" : {
-                                            "Duplicates" : {
-                                                "Remove" : False,
-                                                "Fields" : {"*"}
-                                                
-                                                <OR>
-
-                                                "Fields" : {
-                                                    "Column1", 
-                                                    "Column2", 
-                                                    "etc."
-                                                }
-                    """
-                    if "*" in vDupliFields:
-                        vDuplicateData = vDuplicateData.dropDuplicates()
-                    else:
-                        vDupliList = list(vDupliFields)
-                        vDuplicateData = vDuplicateData.dropDuplicates(vDupliList)
-                    vNetTotalRows = vDuplicateData.count()
-                    vDuplicateRows = self._TotalRows - vNetTotalRows
-                    # ======== Check if any duplicates were found
-                    if "*" in vDupliFields:
-                        if vDuplicateRows == 0:
-                            self.show_Info("QC Check", f"No Rows Removed for All Columns ::> Zero (0) Duplicate Rows Found", "yellow")
-                        else:
-                            self.show_Info("QC Check", f"Removed Duplicate Rows for All Columns ::> {vDuplicateRows}", "yellow")
-                            vAssortedData = vDuplicateData
-                    else:
-                        vDupliCommaList = ", ".join(vDupliList)
-                        if vDuplicateRows == 0:
-                            self.show_Info("QC Check", f"No Rows Removed for [{vDupliCommaList}] ::> Zero (0) Duplicate Rows Found", "yellow")
-                        else:
-                            self.show_Info("QC Check", f"Removed Duplicate Rows for [{vDupliCommaList}] ::> {vDuplicateRows}", "yellow")
-                            vAssortedData = vDuplicateData
-                    self.App["Response"]["Schema"]["Rows"]["NetTotal"] = vNetTotalRows
-                    self.App["Response"]["Schema"]["Rows"]["Duplicates"] = vDuplicateRows
-                else:
-                    self.App["Response"]["Schema"]["Rows"]["NetTotal"] = self._TotalRows
-                    self.App["Response"]["Schema"]["Rows"]["Duplicates"] = 0
-                if self._Target != "Read" and self.AppConfig["Main"]["Switchboard"]["QualityCheck"] is True and self._TotalRows != 0:
-                    """
-                    ╔═══════════════════════════════════════════════════════════════════════════════╗
-                    ║ PROPER USAGE of QUALITY CHECK, CASTING DATA TYPES, RENAMING & DROPPING FIELDS ║
-                    ╚═══════════════════════════════════════════════════════════════════════════════╝
-                    "Media" : {
-                        "<MediaType>" : {
-                            "Class" : {
-                                "<MediaClass>" : {
-                                    "Schema" : {
-                                        "Dimensions" : {
-                                            "countryId" : {
-                                                "Type" : "string",
-                                                "Drop" : False,
-                                                "Rename" : "RK-MediumCountry",
-                                                "Quality" : {
-                                                    "Null", "Blank", "Unique", "UserDefined:alphanumeric"
-                                                }
-                                            },
-                                        },
-                                        "Metrics" : {
-                                            "sessions" : {
-                                                "Type" : "integer",
-                                                "Drop" : False,
-                                                "Rename" : "Sessions",
-                                                "Quality" : {
-                                                    "Null", "Blank", "Unique", "UserDefined:alphanumeric"
-                                                }
-                                            },
-                                        }
-                    """
-                    # ======== Scour each attribute
-                    for vAttribute in self._DataAttributes:
-                        # ======== Scour each column
-                        # The original field name will be changed in the SL & GL data layers
-                        for vColumn, vColumnSpecs in vAppConfigMediaClass["Schema"][vAttribute].items():
-                            # ======== Check if column exists
-                            if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                # ======== Column is existing
-                                if "Quality" in vColumnSpecs:
-                                    for vQualityCheck in vColumnSpecs["Quality"]:
-                                        match vQualityCheck:
-                                            case "Null":
-                                                # ╔═══════════════════════════╗
-                                                # ║ Data Quality Check - Null ║
-                                                # ╚═══════════════════════════╝
-                                                vNullCount = vAssortedData.filter(col(vColumn).isNull()).count()
-                                                vNullPercentage = (vNullCount / self._TotalRows) * 100
-                                                self.App["Response"]["Schema"]["Quality"]["Null"] = {
-                                                    vColumn : {
-                                                        "Count" : vNullCount,
-                                                        "Percentage" : vNullPercentage
-                                                    }
-                                                }
-                                                if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
-                                                    self.show_Info("QC Check", f"Field [{vColumn}] ::> Null Count = {vNullCount} ({vNullPercentage:.2f}%)", "yellow")
-                                                            
-                                            case "Blank":
-                                                # ╔════════════════════════════╗
-                                                # ║ Data Quality Check - Blank ║
-                                                # ╚════════════════════════════╝
-                                                vWhitespaceCount = vAssortedData.filter(col(vColumn).rlike(r"^\s+$")).count()
-                                                vBlankCount = vAssortedData.filter(col(vColumn) == "").count() + vWhitespaceCount
-                                                vBlankPercentage = (vBlankCount / self._TotalRows) * 100
-                                                self.App["Response"]["Schema"]["Quality"]["Blank"] = {
-                                                    vColumn : {
-                                                        "Count" : vBlankCount,
-                                                        "Percentage" : vBlankPercentage
-                                                    }
-                                                }
-                                                if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
-                                                    self.show_Info("QC Check", f"Field [{vColumn}] ::> Blank/Whitespace Count = {vBlankCount} ({vBlankPercentage:.2f}%)", "yellow")
-                                                
-                                            case "Unique":
-                                                # ╔═══════════════════════════════╗
-                                                # ║ Data Quality Check - Distinct ║
-                                                # ╚═══════════════════════════════╝
-                                                vDistinctCount = vAssortedData.select(vColumn).distinct().count()
-                                                vDistinctPercentage = (vDistinctCount / self._TotalRows) * 100
-                                                self.App["Response"]["Schema"]["Quality"]["Unique"] = {
-                                                    vColumn : {
-                                                        "Count" : vDistinctCount,
-                                                        "Percentage" : vDistinctPercentage
-                                                    }
-                                                }
-                                                if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
-                                                    self.show_Info("QC Check", f"Field [{vColumn}] ::> Unique Count = {vDistinctCount} ({vDistinctPercentage:.2f}%)", "yellow")
-                                                vDuplicateCount = self._TotalRows - vDistinctCount
-                                                vDuplicatePercentage = (vDuplicateCount / self._TotalRows) * 100
-                                                self.App["Response"]["Schema"]["Quality"]["Duplicate"] = {
-                                                    vColumn : {
-                                                        "Count" : vDuplicateCount,
-                                                        "Percentage" : vDuplicatePercentage
-                                                    }
-                                                }
-                                                if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
-                                                    self.show_Info("QC Check", f"Field [{vColumn}] ::> Duplicate Count = {vDuplicateCount} ({vDuplicatePercentage:.2f}%)", "yellow")
-
-                                            case _:
-                                                if ':' in vQualityCheck:
-                                                    # ╔═══════════════════════════════════╗
-                                                    # ║ Data Quality Check - User Defined ║
-                                                    # ╚═══════════════════════════════════╝
-                                                    vDefinedName, vDEName = vQualityCheck.split(':')
-                                                    if vDEName in self.AppConfig["Main"]["Data"]["Expressions"] and vDefinedName == "UserDefined":
-                                                        vDefinedExpressions = self.AppConfig["Main"]["Data"]["Expressions"][vDEName]
-                                                        vDefinedCount = vAssortedData.filter(col(vColumn).rlike(vDefinedExpressions)).count()
-                                                        vDefinedPercentage = (vDefinedCount / self._TotalRows) * 100
-                                                        self.App["Response"]["Schema"]["Quality"]["UserDefined"] = {
-                                                            vDEName : {
-                                                                vColumn : {
-                                                                    "Count" : vDefinedCount,
-                                                                    "Percentage" : vDefinedPercentage
-                                                                }
-                                                            }
-                                                        }
-                                                        if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
-                                                            self.show_Info("QC Check", f"Field [{vColumn}] ::> User-Defined [{vDEName}] Count = {vDefinedCount} ({vDefinedPercentage:.2f}%)", "yellow")
-                # ======== Do we need to run the integrity check?
-                if self.AppConfig["Main"]["Switchboard"]["IntegrityCheck"] is True and self._TotalRows != 0:
-                    # ╔══════════════════════╗
-                    # ║ Data Integrity Check ║
-                    # ╚══════════════════════╝
-                    # This should be placed before the transformation to eliminate
-                    # the false warning that Raw Zone is not equal to Bronze Layer
-                    self.show_Info("Integrity", "Generating data integrity checksum")
-                    # ======== Concatenate all columns into a single string for each row
-                    vIncludedColumns = [col for col in vAssortedData.columns if not col.startswith("Row_")]
-                    vAssortedData = vAssortedData.withColumn(
-                            "Row_Concat", concat_ws("||", *vIncludedColumns)
-                        )
-                    # ======== Sort to get the consistent checksum
-                    vAssortedData = vAssortedData.orderBy(
-                            vAssortedData["Row_Concat"].asc()
-                        )
-                    # ======== Compute SHA-256 hash for each row
-                    vAssortedData = vAssortedData.withColumn(
-                            "Row_Checksum", sha2(col("Row_Concat"), 256)
-                        )
-                    # ======== Aggregate all row hashes into a single checksum
-                    vChecksumConcat = vAssortedData.agg(
-                            concat_ws("", collect_list("Row_Checksum")).alias("ConcatenatedChecksums")
-                        ).collect()[0]["ConcatenatedChecksums"]
-                    import hashlib
-                    vDataChecksum = hashlib.sha256(vChecksumConcat.encode()).hexdigest()
-                    # ======== Delete temporary column
-                    vAssortedData = vAssortedData.drop("Row_Concat")
-                    self.show_Info("Checksum", vDataChecksum, "cyan")
-                    self.App["Response"]["Schema"]["Integrity"]["Checksum"] = vDataChecksum
-                    self.App["Response"]["Schema"]["Integrity"]["Hash"] = "SHA-256"
-                else:
-                    self.App["Response"]["Schema"]["Integrity"]["Checksum"] = None
-                # ======== Check if we need to transform the Source
-                if self.AppConfig["Main"]["Data"]["Transformer"] == self._Source and self._Target != "Read":
-                    # ======== Start of Transformation
-                    # ╔═══════════════════════════════════╗
-                    # ║ Transformation Area - Filter Data ║
-                    # ╚═══════════════════════════════════╝
-                    if "Filter" in vSchemaTransformation and vSchemaTransformation["Filter"]:
-                        """
-                        ╔═══════════════════════════════╗
-                        ║ PROPER USAGE of SCHEMA FILTER ║
-                        ╚═══════════════════════════════╝
-                        "Media" : {
-                            "<MediaType>" : {
-                                "Class" : {
-                                    "<MediaClass>" : {
-                                        "Schema" : {
-                                            "Transformation" : {
-                                                "Filter" : {
-                                                    "OR" : {
-                                                        "!=" : {
-                                                            "Age" : {
-                                                                20,
-                                                                40
-                                                            }
-                                                        }
-                                                    },
-                                                    "AND" : {
-                                                        "==" : {
-                                                            "City" : {
-                                                                "Lipa City",
-                                                                "Batangas City"
-                                                            }
-                                                        }
-                                                    }
-                                                }
-                                            }
-                        """
-                        vExpression = None
-                        vDisplayPath = None
-                        vDisplayValue = None
-                        for vLogicalOperand, vComparisons in vSchemaTransformation["Filter"].items():
-                            for vComparisonOperand, vConditions in vComparisons.items():
-                                for vColName, vCondition in vConditions.items():
-                                    if self.is_ColumnExists(vAssortedData, vColName) is True:
-                                        for vColValue in vCondition:
-                                            is_ValidOperand = True
-                                            match vComparisonOperand:
-                                                case "==":
-                                                    if vColValue is None or vColValue == "Null":
-                                                        vCondition = (col(vColName).isNull())
-                                                    else:
-                                                        vCondition = (col(vColName) == vColValue)
-
-                                                case "!=":
-                                                    if vColValue is None or vColValue == "Null":
-                                                        vCondition = (col(vColName).isNotNull())
-                                                    else:
-                                                        vCondition = (col(vColName) != vColValue)
-
-                                                case ">":
-                                                    if vColValue == "":
-                                                        vColValue = 0
-                                                    vCondition = (col(vColName) > vColValue)
-
-                                                case ">=":
-                                                    if vColValue == "":
-                                                        vColValue = 0
-                                                    vCondition = (col(vColName) >= vColValue)
-
-                                                case "<":
-                                                    if vColValue == "":
-                                                        vColValue = 0
-                                                    vCondition = (col(vColName) < vColValue)
-
-                                                case "<=":
-                                                    if vColValue == "":
-                                                        vColValue = 0
-                                                    vCondition = (col(vColName) <= vColValue)
-
-                                                case _:
-                                                    is_ValidOperand = False
-
-                                            if vColValue is None or vColValue == "Null":
-                                                vDisplayValue = "Null"
-                                            elif vColValue == "":
-                                                vDisplayValue = "Blank"
-                                            else:
-                                                vDisplayValue = vColValue
-                                            vDisplayExpression = f"{vColName} {vComparisonOperand} {vDisplayValue}"
-                                            if vDisplayPath is None:
-                                                vDisplayPath = vDisplayExpression
-                                            else:
-                                                if vLogicalOperand == "OR":
-                                                    vDisplayPath = f"{vDisplayPath} OR {vDisplayExpression}"
-                                                elif vLogicalOperand == "AND":
-                                                    vDisplayPath = f"{vDisplayPath} AND {vDisplayExpression}"
-                                            if vExpression is None:
-                                                vExpression = vCondition
-                                            else:
-                                                if vLogicalOperand == "OR":
-                                                    vExpression = vExpression | vCondition
-                                                elif vLogicalOperand == "AND":
-                                                    vExpression = vExpression & vCondition
-                        vOldTotalRows = self._TotalRows
-                        vAssortedData = vAssortedData.filter(vExpression)
-                        vNewTotalRows = vAssortedData.count()
-                        vFilteredRows = vOldTotalRows - vNewTotalRows
-                        self.App["Response"]["Schema"]["Rows"]["NetTotal"] = vNewTotalRows
-                        self.App["Response"]["Schema"]["Rows"]["Filtered"] = vFilteredRows
-                        self.show_Info("Filter", f" WHERE {vDisplayPath} ::> Successful", "yellow")
-                        self.show_Info("Filter", f" Removed Rows ::> {format(vFilteredRows, ',')}", "yellow")
-                        self.show_Info("Filter", f" Net Total Rows ::> {format(vNewTotalRows, ',')}", "yellow")
-                    # ╔══════════════════════════════════════╗
-                    # ║ Transformation Area - Update Columns ║
-                    # ╚══════════════════════════════════════╝
-                    if self._MediaType == "GA4":
-                        vColumn = "date"
-                        if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                            # ======== Column existing, then Update Column to YYYY-MM-DD
-                            vAssortedData = vAssortedData.withColumn(
-                                "date",
-                                concat_ws(
-                                    "-",
-                                    substring("date", 1, 4),  # Extract year
-                                    substring("date", 5, 2),  # Extract month
-                                    substring("date", 7, 2)   # Extract day
-                                )
-                            )
-                            # ======== Is it successful?
-                            if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                if self._UpdatedColumns == 0:
-                                    self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Updated"] = set()
-                                self._UpdatedColumns += 1
-                                self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Updated"].add(vColumn)
-                                self.App["Response"]["Schema"]["Columns"]["Metrics"]["Updated"] = self._UpdatedColumns
-                                self.show_Info("Updated Col", f"{vColumn} ::> Successful", "yellow")
-                            else:
-                                self.show_Info("Updated Col", f"{vColumn} ::> Failed", "red")
-                        else:
-                            # ======== Column is not existing
-                            self.show_Info("Updated Col", f"{vColumn} ::> Failed (Not Existing)", "red")
-                    # ╔══════════════════════════════════════╗
-                    # ║ Transformation Area - Set Data Types ║
-                    # ╚══════════════════════════════════════╝
-                    # ======== Scour each attribute
-                    for vAttribute in self._DataAttributes:
-                        # ======== Scour each column
-                        for vColumn, vColumnSpecs in vAppConfigMediaClass["Schema"][vAttribute].items():
-                            # ======== Set Dimension Data Types based from the Configuration
-                            vTypeSet = vColumnSpecs["Type"]
-                            self.set_SparkType(vTypeSet)
-                            if self._ReturnStatus is True:
-                                vDataType = self._ReturnValue
-                                if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                    # ======== Dimension is existing
-                                    vAssortedData = vAssortedData.withColumn(
-                                            vColumn, col(vColumn).cast(vDataType)
-                                        )
-                                    self.show_Info("Set Type", f"[{vColumn}] ::> '{vTypeSet}' ::> Successful", "yellow")
-                                else:
-                                    self.show_Info("Set Type", f"[{vColumn}] ::> Not Existing", "red")
-                    # ╔══════════════════════════════════════╗
-                    # ║ Transformation Area - Adding Columns ║
-                    # ╚══════════════════════════════════════╝
-                    match self._MediaType:
-                        case "GA4":
-                            match self._MediaClass:
-                                case "Page_Metrics":
-                                    # ╔══════════════╗
-                                    # ║  Add Column  ║
-                                    # ╚══════════════╝
-                                    vColumn = "Engagement_Rate"
-                                    if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                        # ======== Column is already existing
-                                        self.show_Info("Added Col", f"{vColumn} ::> Failed (Existing)", "red")
-                                    else:
-                                        # ======== Column Not existing, then Add New Column
-                                        vAssortedData = vAssortedData.withColumn(
-                                            vColumn,
-                                            (col("engagedSessions") / col("sessions")).cast("float")
-                                        )
-                                        # ======== Is it successful?
-                                        if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                            if self._AddedColumns == 0:
-                                                self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"] = set()
-                                            self._AddedColumns += 1
-                                            self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"].add(vColumn)
-                                            self.App["Response"]["Schema"]["Columns"]["Metrics"]["Added"] = self._AddedColumns
-                                            self.show_Info("Added Col", f"{vColumn} ::> Successful", "yellow")
-                                        else:
-                                            self.show_Info("Added Col", f"{vColumn} ::> Failed", "red")
-
-                                case "Demo_GA4":
-                                    # ╔══════════════╗
-                                    # ║  Add Column  ║
-                                    # ╚══════════════╝
-                                    vColumn = "Medium_Source-Traffic"
-                                    if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                        # ======== Column is already existing
-                                        self.show_Info("Added Col", f"{vColumn} ::> Failed (Existing)", "red")
-                                    else:
-                                        # ======== Column Not existing, then Add New Column
-                                        vAssortedData = vAssortedData.withColumn(
-                                                vColumn, split(col("sourceMedium"), " / ").getItem(0)
-                                            )
-                                        # ======== Is it successful?
-                                        if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                            if self._AddedColumns == 0:
-                                                self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"] = set()
-                                            self._AddedColumns += 1
-                                            self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"].add(vColumn)
-                                            self.App["Response"]["Schema"]["Columns"]["Metrics"]["Added"] = self._AddedColumns
-                                            self.show_Info("Added Col", f"{vColumn} ::> Successful", "yellow")
-                                        else:
-                                            self.show_Info("Added Col", f"{vColumn} ::> Failed", "red")
-                                    # ╔══════════════╗
-                                    # ║  Add Column  ║
-                                    # ╚══════════════╝
-                                    vColumn = "Medium_Source-Name"
-                                    if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                        # ======== Column is already existing
-                                        self.show_Info("Added Col", f"{vColumn} ::> Failed (Existing)", "red")
-                                    else:
-                                        # ======== Column Not existing, then Add New Column
-                                        vAssortedData = vAssortedData.withColumn(
-                                                vColumn, split(col("sourceMedium"), " / ").getItem(1)
-                                            )
-                                        # ======== Is it successful?
-                                        if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                            self._AddedColumns += 1
-                                            self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"].add(vColumn)
-                                            self.App["Response"]["Schema"]["Columns"]["Metrics"]["Added"] = self._AddedColumns
-                                            self.show_Info("Added Col", f"{vColumn} ::> Successful", "yellow")
-                                        else:
-                                            self.show_Info("Added Col", f"{vColumn} ::> Failed", "red")
-
-                                case _:
-                                    pass
-
-
-                        case "UA":
-                            pass
-
-                        case _:
-                            self.reset_Status("InvalidTargetMedia")
-                    
-                    # ╔════════════════════════════════════════╗
-                    # ║ Transformation Area - Dropping Columns ║
-                    # ╚════════════════════════════════════════╝
-                    # ======== Scour each attribute
-                    for vAttribute in self._DataAttributes:
-                        # ======== Scour each column
-                        for vColumn, vColumnSpecs in vAppConfigMediaClass["Schema"][vAttribute].items():
-                            if "Drop" in vColumnSpecs and vColumnSpecs["Drop"] is True:
-                                if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                    # ======== Column is existing, then Delete the Column
-                                    vAssortedData = vAssortedData.drop(vColumn)
-                                    if self.is_ColumnExists(vAssortedData, vColumn) is True:
-                                        self.show_Info("Deleted Col", f"{vColumn} ::> Failed", "red")
-                                    else:
-                                        if self._PurgedColumns == 0:
-                                            self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Purged"] = set()
-                                        self._PurgedColumns += 1
-                                        self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Purged"].add(vColumn)
-                                        self.App["Response"]["Schema"]["Columns"]["Metrics"]["Purged"] = self._PurgedColumns
-                                        self.show_Info("Deleted Col", f"{vColumn} ::> Successful", "yellow")
-                                else:
-                                    self.show_Info("Deleted Col", f"{vColumn} ::> Failed (Not Existing)", "red")
-                    # ╔═══════════════════════════════╗
-                    # ║ Transformation Area - Sorting ║
-                    # ╚═══════════════════════════════╝
-                    is_Sorted = False
-                    if "Sort" in vSchemaTransformation and vSchemaTransformation["Sort"]:
-                        """
-                        ╔════════════════════════════════════════════╗
-                        ║ PROPER USAGE of SORTING by MULTIPLE FIELDS ║
-                        ╚════════════════════════════════════════════╝
-                        "Media" : {
-                            "<MediaType>" : {
-                                "Class" : {
-                                    "<MediaClass>" : {
-                                        "Schema" : {
-                                            "Transformation" : {
-                                                "Sort" : {
-                                                    "Field1" : "ASC",
-                                                    "Field2" : "DESC"
-                                                }
-                                            }
-                        """
-                        vSortColumns = []
-                        for vSortField, vSortOrder in vSchemaTransformation["Sort"].items():
-                            if vSortOrder.upper() == "ASC":
-                                vSortColumns.append(vAssortedData[vSortField].asc())
-                                self.show_Info("Sorted By", f"{vSortField} ::> Ascending", "yellow")
-                                is_Sorted = True
-                            elif vSortOrder.upper() == "DESC":
-                                vSortColumns.append(vAssortedData[vSortField].desc())
-                                self.show_Info("Sorted By", f"{vSortField} ::> Descending", "yellow")
-                                is_Sorted = True
-                    if is_Sorted is True:
-                        # ======== Transfer the Sorted Data
-                        vDataLoad = vAssortedData.orderBy(*vSortColumns)
-                    else:
-                        # ======== No Sorting happened
-                        vDataLoad = vAssortedData
-                    # ╔════════════════════════════════════════╗
-                    # ║ Transformation Area - Renaming Columns ║
-                    # ╚════════════════════════════════════════╝
-                    # Renaming should be at the end of transformation stage
-                    for vAttribute in self._DataAttributes:
-                        # ======== Scour each column
-                        for vColumn, vColumnSpecs in vAppConfigMediaClass["Schema"][vAttribute].items():
-                            if "Rename" in vColumnSpecs and vColumnSpecs["Rename"] is not None:
-                                vNewName = vColumnSpecs["Rename"]
-                                if self.is_ColumnExists(vDataLoad, vColumn) is True:
-                                    # ======== Column is existing, then Rename the Column
-                                    vDataLoad = vDataLoad.withColumnRenamed(vColumn, vNewName)
-                                    if self.is_ColumnExists(vDataLoad, vColumn) is True:
-                                        self.show_Info("Renamed Col", f"{vColumn} to '{vNewName}' ::> Failed", "red")
-                                    else:
-                                        self._RenamedColumns += 1
-                                        self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Renamed"][vColumn] = vNewName
-                                        self.App["Response"]["Schema"]["Columns"]["Metrics"]["Renamed"] = self._RenamedColumns
-                                        self.show_Info("Renamed Col", f"{vColumn} to '{vNewName}' ::> Successful", "yellow")
-                                else:
-                                    self.show_Info("Renamed Col", f"{vColumn} ::> Failed (Not Existing)", "red")
-                    # ╔═══════════════════════╗
-                    # ║ End of Transformation ║
-                    # ╚═══════════════════════╝
-                    if self._ReturnStatus is not True:
-                        raise MigrationError(
-                            self.show_ErrorMsg()
-                        )
-
-                else:
-                    # ======== No transformation
-                    vDataLoad = vAssortedData
+                vAssortedData, vDataLoad = self.process_Data(
+                    vAssortedData,
+                    vAppConfigMediaClass,
+                    vPrunedColumns
+                )
                 vDataLoadCols = vDataLoad.columns
                 self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Total"] = vDataLoadCols
                 self.App["Response"]["Schema"]["Columns"]["Metrics"]["Total"] = len(vDataLoadCols)
+                if is_DryRun is True:
+                    # ======== Physical plan and estimated cost of the transfer
+                    vDryRun = self.get_DryRun(vSourceData, vDataLoad, vAppConfigMediaClass)
+                    self.App["Response"]["DryRun"] = vDryRun
+                    vInputBytes = "Unknown" if vDryRun["InputBytes"] is None else format(vDryRun["InputBytes"], ',')
+                    vPlanBytes = "Unknown" if vDryRun["PlanBytes"] is None else format(vDryRun["PlanBytes"], ',')
+                    self.show_Info("Dry Run", f'Input ::> {format(vDryRun["InputFiles"], ",")} files, {vInputBytes} bytes', "yellow")
+                    self.show_Info("Dry Run", f"Planned Scan ::> {vPlanBytes} bytes", "yellow")
+                    self.show_Info("Dry Run", f'Spark Actions ::> {vDryRun["Actions"]}', "yellow")
+                    self.show_Info("Dry Run", f'Shuffles ::> {vDryRun["Shuffles"]}', "yellow")
                 # ╔══════════════════════════════════╗
                 # ║ End of Successful Source Reading ║
                 # ╚══════════════════════════════════╝
@@ -1048,9 +657,15 @@ class Data_Migration (Data_Specs, Shared_MainLib):
             # ╔═══════════════╗
             # ║ Transfer Area ║
             # ╚═══════════════╝
+            # ======== Location of the written layer, the Catalog will be registered on top of it
+            vCatalogLocation = None
+            vCatalogFormat = "delta"
             if self._Target == "Read":
                 # ======== No target destination
                 self.show_Info("Target", "Skipped")
+            elif is_DryRun is True:
+                # ======== Planned only, nothing is written
+                self.show_Info("Target", "Skipped ::> Dry Run")
             else:
                 vCallerSource = self.AppConfig["Main"]["Data"]["Label"][self._Source]
                 if self._Source == "DS":
@@ -1069,51 +684,34 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                 # ║ Audit Row Trails ║
                 # ╚══════════════════╝
                 # This will overwrite the Pipeline Audit Trail if there is a Target and run directly.
-                vAssortedData = vAssortedData.withColumn(
-                        "Row_Inserted-On", 
-                        date_format(
-                                current_timestamp(), "yyyy-MM-dd HH:mm:ss"
-                            ).cast(TimestampType())
-                    ).withColumn(
-                        "Row_Inserted-By", 
-                        lit(vPipelineCaller)
-                    ).withColumn(
-                        "Row_Updated-On", 
-                        date_format(
-                                current_timestamp(), "yyyy-MM-dd HH:mm:ss"
-                            ).cast(TimestampType())
-                    ).withColumn(
-                        "Row_Updated-By", 
-                        lit(vPipelineCaller)
-                     )
-                # ======== Reorder columns and put Audit columns at the end
-                vRegularColumns = [col for col in vAssortedData.columns if not col.startswith("Row_")]
-                vAuditColumns = [col for col in vAssortedData.columns if col.startswith("Row_")]
-                vOrderedColumns = vRegularColumns + vAuditColumns
-                vAssortedData = vAssortedData.select(vOrderedColumns)
+                vAssortedData = self.set_AuditColumns(vAssortedData, vPipelineCaller)
                 is_ValidTarget = True
                 vAppConfigStageTarget = self.AppConfig["Media"][self._MediaType]["Stage"][self._Target]
+                self.start_Span("Write")
                 match vAppConfigStageTarget["Provider"]["Type"]:
-                    case "SQLServer":
+                    case "SQLServer" | "SQLServer/Bulk":
                         # ======== Populate SQL Server credentials from Vault
-                        vDBServer = dbutils.secrets.get(
-                                scope=vAppConfigStageTarget["Secret"]["DB_Server"]["Scope"], 
-                                key=vAppConfigStageTarget["Secret"]["DB_Server"]["Key"]
+                        vDBServer = self.get_Secret(
+                                arg_Scope=vAppConfigStageTarget["Secret"]["DB_Server"]["Scope"], 
+                                arg_Key=vAppConfigStageTarget["Secret"]["DB_Server"]["Key"]
                             )
-                        vDBName = dbutils.secrets.get(
-                                scope=vAppConfigStageTarget["Secret"]["DB_Name"]["Scope"], 
-                                key=vAppConfigStageTarget["Secret"]["DB_Name"]["Key"]
+                        vDBName = self.get_Secret(
+                                arg_Scope=vAppConfigStageTarget["Secret"]["DB_Name"]["Scope"], 
+                                arg_Key=vAppConfigStageTarget["Secret"]["DB_Name"]["Key"]
                             )
-                        vDBUser = dbutils.secrets.get(
-                                scope=vAppConfigStageTarget["Secret"]["DB_User"]["Scope"], 
-                                key=vAppConfigStageTarget["Secret"]["DB_User"]["Key"]
+                        vDBUser = self.get_Secret(
+                                arg_Scope=vAppConfigStageTarget["Secret"]["DB_User"]["Scope"], 
+                                arg_Key=vAppConfigStageTarget["Secret"]["DB_User"]["Key"]
                             ) 
-                        vDBPass = dbutils.secrets.get(
-                                scope=vAppConfigStageTarget["Secret"]["DB_Pass"]["Scope"], 
-                                key=vAppConfigStageTarget["Secret"]["DB_Pass"]["Key"]
+                        vDBPass = self.get_Secret(
+                                arg_Scope=vAppConfigStageTarget["Secret"]["DB_Pass"]["Scope"], 
+                                arg_Key=vAppConfigStageTarget["Secret"]["DB_Pass"]["Key"]
                             )
                         vDBTable = f'{vAppConfigStageTarget["Provider"]["Schema"]}.[{self._MediaType}-{vTargetName}]'
                         vTargetLoc = vDBTable
+                        if self.AppConfig["Main"]["Switchboard"]["CatalogWrite"] is True:
+                            # ======== Catalog is written from the same data, avoid recomputing the lineage
+                            vDataLoad.persist(StorageLevel.MEMORY_AND_DISK)
                         # ======== Write GA4 Data on the SQL Server
                         self.write_Database (
                                 vDataLoad,
@@ -1122,7 +720,9 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                                 vDBUser,
                                 vDBPass,
                                 vDBTable,
-                                vAppConfigStageTarget["Provider"]
+                                vAppConfigStageTarget["Provider"],
+                                self.App["Response"]["Schema"]["Rows"]["NetTotal"],
+                                vAppConfigMediaClass.get("Upsert")
                             )
 
                     case "Azure/Blob":
@@ -1135,6 +735,12 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                             vAppConfigStageTarget["Provider"]["SubDir"]["Path"],
                             vAppConfigStageTarget["Provider"]["SubDir"]["Extension"]
                         )
+                        # ======== Only a full overwrite leaves the layer equal to the written data
+                        is_HandedOff = self._ChainLineage is True and \
+                            vAppConfigStageTarget["Provider"]["Write"]["Mode"] == "overwrite"
+                        if is_HandedOff is True:
+                            # ======== The write fills the cache, the next hop reads it from memory
+                            vDataLoad.persist(getattr(StorageLevel, self.AppConfig["Main"]["Data"]["StorageLevel"] or "MEMORY_AND_DISK"))
                         # ======== Write Blob
                         self.write_AzureBlob(
                                 vDataLoad,
@@ -1143,17 +749,42 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                                 vAppConfigStageTarget["Secret"]["StorageContainer"]["Scope"],
                                 vAppConfigStageTarget["Secret"]["StorageContainer"]["Key"],
                                 vTargetLoc,
-                                vAppConfigStageTarget["Provider"]
+                                vAppConfigStageTarget["Provider"],
+                                vAppConfigMediaClass.get("Upsert", {}).get("Keys")
                             )
+                        if self._ReturnStatus is True:
+                            vCatalogLocation = self.DFS_Path
+                            vCatalogFormat = vAppConfigStageTarget["Provider"]["Format"]
+                            if is_HandedOff is True:
+                                self._Handoff = {
+                                    "Key" : (self._MediaType, self._MediaClass, self._Target),
+                                    "Location" : vTargetLoc,
+                                    "Data" : vDataLoad
+                                }
 
                     case _:
                         is_ValidTarget = False
                         self.reset_Status("InvalidTargetType")
 
+                self.App["Response"]["Target"]["Statistics"] = self._TargetStats
+                self.end_Span("Write", self.App["Response"]["Schema"]["Rows"]["NetTotal"], vDataLoad, self._ReturnStatus)
                 # ======== Check if write operation was successful
                 if is_ValidTarget is True:
                     if self._ReturnStatus is True:
                         self.show_Info("Target", f"{vTargetLoc} ::> Successful")
+                        if is_ChangeFeed is True and self._SourceVersion is not None:
+                            # ======== Next run reads the changes after this version
+                            if self.set_DeltaVersion(
+                                    self._MediaType,
+                                    self._MediaClass,
+                                    self._Source,
+                                    self._Target,
+                                    self._SourceVersion
+                                ) is True:
+                                self.show_Info("Version", f"{self._Source} ::> {self._SourceVersion}")
+                            else:
+                                # ======== The next run reads these changes again
+                                self.show_Info("Version", f"{self._Source} ::> {self._SourceVersion} Not Recorded ({self.clean_Exception()})", "red")
                     else:
                         self.show_Info("Target", f"{vTargetLoc} ::> Failed", "red")
                 else:
@@ -1161,14 +792,18 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                         self.show_ErrorMsg()
                     )
             # ======== Write to Catalog ["LZ", "RZ", "BL", "SL", "GL", "DZ"]
-            if self._Target != "Read" and self.AppConfig["Main"]["Switchboard"]["CatalogWrite"] is True: 
+            if self._Target != "Read" and is_DryRun is False and self.AppConfig["Main"]["Switchboard"]["CatalogWrite"] is True: 
                 # ======== Define catalog table path
                 vCatalogTable = f"{vPath_ParentDir}.`{self._MediaType}-{vTargetName}-{self._Target}`"
                 # ======== Create Catalog table
+                self.start_Span("Catalog")
                 self.write_Catalog(
                     vDataLoad,
-                    vCatalogTable
+                    vCatalogTable,
+                    vCatalogLocation,
+                    vCatalogFormat
                 )
+                self.end_Span("Catalog", arg_Completed = self._ReturnStatus)
                 if self._ReturnStatus is True:
                     # ======== Successful Catalog Write
                     self.show_Info("Catalog", f"{vCatalogTable} ::> Successful")
@@ -1177,15 +812,21 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                     self.show_Info("Catalog", f"{vCatalogTable} ::> Failed", "red")
             # ======== Check if display table switch is enabled
             vDisplayPath = f"{vPath_ParentDir}/{self._MediaType}/{self._MediaClass}"
-            if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is True:
+            if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is True and is_DryRun is False:
                 # ======== Display the assorted data, which will be sorted by the Module:Transform_Data in Silver Layer
-                display(vDataLoad)
+                self.start_Span("Display")
+                display(vDataLoad.limit(self.AppConfig["Main"]["Preview"]["Rows"]))
+                self.end_Span("Display")
                 # ======== Successfuly display
                 self.show_Info("Displayed", f"{vDisplayPath} ::> Successful")
             else:
                 # ======== Skipped display
                 self.show_Info("Displayed", f"{vDisplayPath} ::> Skipped")
-            vDataLoad.unpersist()
+            # ======== The handed-off layer stays cached for the next hop, also when it is the source itself
+            if self._Handoff is None or self._Handoff["Data"] is not vDataLoad:
+                vDataLoad.unpersist()
+            if self._Handoff is None or self._Handoff["Data"] is not vSourceData:
+                vSourceData.unpersist()
         # ======== Handle specific for this module
         except MigrationError as MigrationErrorMsg:
             is_MigrationError = True
@@ -1212,6 +853,14 @@ class Data_Migration (Data_Specs, Shared_MainLib):
             vEndDT = datetime.now()
             self.App["Response"]["Header"]["App"]["Statistics"]["Ended"] = self.get_PHdatetime(vEndDT)
             self.App["Response"]["Header"]["App"]["Statistics"]["Duration"] = str(vEndDT - vStartDT)
+            # ======== Wall time, rows and estimated bytes of each stage, unfinished stages are closed as not completed
+            for vStage in [vStage for vStage, vSpan in self._Spans.items() if "Seconds" not in vSpan]:
+                self.end_Span(vStage, arg_Completed = False)
+            # ======== Spark jobs, tasks, shuffle and spill triggered by each stage
+            self.get_SparkMetrics()
+            self.App["Response"]["Header"]["App"]["Statistics"]["Stages"] = self._Spans
+            # ======== Secret lookups of this run answered by the cache
+            self.App["Response"]["Header"]["App"]["Statistics"]["Secrets"] = dict(self._SecretStats)
             if vStartSuccess is False:
                 self.App["Response"]["Status"] = 404
                 self.App["Response"]["Failure"]["Message"]["Display"] = None
@@ -1258,6 +907,7 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                     self.show_Info("Transfer", "Failed", "red")
                 # ======== Is Pipeline Activity Status enabled?
                 if is_ActivityStat is True:
+                    self.flush_Shipper()
                     dbutils.notebook.exit("Failure")
             else:
                 self.App["Response"]["Status"] = 200
@@ -1270,47 +920,811 @@ class Data_Migration (Data_Specs, Shared_MainLib):
                     dbutils
                 )
                 # ======== Successful Operation
-                if self._Target == "Read":
+                if is_DryRun is True:
+                    self.show_Info("Dry Run", "Successful", "green")
+                elif self._Target == "Read":
                     self.show_Info("Reading", "Successful", "green")
                 else:
                     self.show_Info("Transfer", "Successful", "green")
                 # ======== Is Pipeline Activity Status enabled?
                 if is_ActivityStat is True:
+                    self.flush_Shipper()
                     dbutils.notebook.exit("Success")
-            dbutils.library.restartPython()
+            if self._ChainLineage is False and self._Worker is False:
+                self.restart_Python()
             # ======== Check if this is a Testing Run
             if self.AppConfig["Main"]["Switchboard"]["TestMode"] is True:
                 return vStartSuccess
             else:
                 return None
 
+    def process_Data (
+            self,
+            arg_DataFrame,
+            arg_ConfigMediaClass,
+            arg_PrunedColumns = set()
+        ):
+        # ======== Run the Quality Checks, Integrity Check and Transformation on the source data
+        # Returns the assorted data and the data to be loaded on the target
+        col = self.get_Import("pyspark.sql.functions", "col")
+        sha2 = self.get_Import("pyspark.sql.functions", "sha2")
+        split = self.get_Import("pyspark.sql.functions", "split")
+        concat_ws = self.get_Import("pyspark.sql.functions", "concat_ws")
+        substring = self.get_Import("pyspark.sql.functions", "substring")
+        collect_list = self.get_Import("pyspark.sql.functions", "collect_list")
+        vAppConfigMediaClass = arg_ConfigMediaClass
+        vSchemaTransformation = vAppConfigMediaClass["Schema"]["Transformation"]
+        vPrunedColumns = arg_PrunedColumns
+        vAssortedData = arg_DataFrame
+        # ======== A Dry Run builds every step of the plan but runs none of the counting checks
+        is_DryRun = self.AppConfig["Main"]["Switchboard"]["DryRun"]
+        self.start_Span("Quality")
+        # ======== Do we need to run Data Quality Checks?
+        if self._Target != "Read" and \
+            self.AppConfig["Main"]["Switchboard"]["QualityCheck"] is True and \
+            vAppConfigMediaClass["Schema"]["Quality"]["Duplicates"]["Remove"] is True and \
+            vAppConfigMediaClass["Schema"]["Quality"]["Duplicates"]["Fields"] and \
+            (self._TotalRows != 0 or is_DryRun is True):
+            # ╔════════════════════════════════════════════╗
+            # ║ Data Quality Check - Remove Duplicate Rows ║
+            # ╚════════════════════════════════════════════╝
+            vDupliFields = vAppConfigMediaClass["Schema"]["Quality"]["Duplicates"]["Fields"]
+            vIncludedColumns = [col for col in vAssortedData.columns if not col.startswith("Row_")]
+            vDuplicateData = vAssortedData.select(*vIncludedColumns)
+            """
+            ╔═════════════════════════════════════════╗
+            ║ PROPER USAGE of DROPPING DUPLICATE ROWS ║
+            ╚═════════════════════════════════════════╝
+            "Media" : {
+                "<MediaType>" : {
+                    "Class" : {
+                        "<MediaClass>" : {
+                            "Schema" : {
+                                "Quality" : {
+                                    "Duplicates" : {
+                                        "Remove" : False,
+                                        "Fields" : {"*"}
+                                        
+                                        <OR>
+
+                                        "Fields" : {
+                                            "Column1", 
+                                            "Column2", 
+                                            "etc."
+                                        }
+            """
+            if "*" in vDupliFields:
+                vDuplicateData = vDuplicateData.dropDuplicates()
+            else:
+                vDupliList = list(vDupliFields)
+                vDuplicateData = vDuplicateData.dropDuplicates(vDupliList)
+            if is_DryRun is True:
+                # ======== Planned only, the duplicates are not counted
+                vAssortedData = vDuplicateData
+                self.show_Info("QC Check", "Remove Duplicate Rows ::> Planned", "yellow")
+                self.App["Response"]["Schema"]["Rows"]["NetTotal"] = self._TotalRows
+                self.App["Response"]["Schema"]["Rows"]["Duplicates"] = 0
+            else:
+                vNetTotalRows = vDuplicateData.count()
+                vDuplicateRows = self._TotalRows - vNetTotalRows
+                # ======== Check if any duplicates were found
+                if "*" in vDupliFields:
+                    if vDuplicateRows == 0:
+                        self.show_Info("QC Check", f"No Rows Removed for All Columns ::> Zero (0) Duplicate Rows Found", "yellow")
+                    else:
+                        self.show_Info("QC Check", f"Removed Duplicate Rows for All Columns ::> {vDuplicateRows}", "yellow")
+                        vAssortedData = vDuplicateData
+                else:
+                    vDupliCommaList = ", ".join(vDupliList)
+                    if vDuplicateRows == 0:
+                        self.show_Info("QC Check", f"No Rows Removed for [{vDupliCommaList}] ::> Zero (0) Duplicate Rows Found", "yellow")
+                    else:
+                        self.show_Info("QC Check", f"Removed Duplicate Rows for [{vDupliCommaList}] ::> {vDuplicateRows}", "yellow")
+                        vAssortedData = vDuplicateData
+                self.App["Response"]["Schema"]["Rows"]["NetTotal"] = vNetTotalRows
+                self.App["Response"]["Schema"]["Rows"]["Duplicates"] = vDuplicateRows
+        else:
+            self.App["Response"]["Schema"]["Rows"]["NetTotal"] = self._TotalRows
+            self.App["Response"]["Schema"]["Rows"]["Duplicates"] = 0
+        if self._Target != "Read" and self.AppConfig["Main"]["Switchboard"]["QualityCheck"] is True and self._TotalRows != 0 and is_DryRun is False:
+            """
+            ╔═══════════════════════════════════════════════════════════════════════════════╗
+            ║ PROPER USAGE of QUALITY CHECK, CASTING DATA TYPES, RENAMING & DROPPING FIELDS ║
+            ╚═══════════════════════════════════════════════════════════════════════════════╝
+            "Media" : {
+                "<MediaType>" : {
+                    "Class" : {
+                        "<MediaClass>" : {
+                            "Schema" : {
+                                "Dimensions" : {
+                                    "countryId" : {
+                                        "Type" : "string",
+                                        "Drop" : False,
+                                        "Rename" : "RK-MediumCountry",
+                                        "Quality" : {
+                                            "Null", "Blank", "Unique", "UserDefined:alphanumeric"
+                                        }
+                                    },
+                                },
+                                "Metrics" : {
+                                    "sessions" : {
+                                        "Type" : "integer",
+                                        "Drop" : False,
+                                        "Rename" : "Sessions",
+                                        "Quality" : {
+                                            "Null", "Blank", "Unique", "UserDefined:alphanumeric"
+                                        }
+                                    },
+                                }
+            """
+            # ======== Scour each attribute
+            for vAttribute in self._DataAttributes:
+                # ======== Scour each column
+                # The original field name will be changed in the SL & GL data layers
+                for vColumn, vColumnSpecs in vAppConfigMediaClass["Schema"][vAttribute].items():
+                    # ======== Check if column exists
+                    if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                        # ======== Column is existing
+                        if "Quality" in vColumnSpecs:
+                            for vQualityCheck in vColumnSpecs["Quality"]:
+                                match vQualityCheck:
+                                    case "Null":
+                                        # ╔═══════════════════════════╗
+                                        # ║ Data Quality Check - Null ║
+                                        # ╚═══════════════════════════╝
+                                        vNullCount = vAssortedData.filter(col(vColumn).isNull()).count()
+                                        vNullPercentage = (vNullCount / self._TotalRows) * 100
+                                        self.App["Response"]["Schema"]["Quality"]["Null"] = {
+                                            vColumn : {
+                                                "Count" : vNullCount,
+                                                "Percentage" : vNullPercentage
+                                            }
+                                        }
+                                        if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
+                                            self.show_Info("QC Check", f"Field [{vColumn}] ::> Null Count = {vNullCount} ({vNullPercentage:.2f}%)", "yellow")
+                                                    
+                                    case "Blank":
+                                        # ╔════════════════════════════╗
+                                        # ║ Data Quality Check - Blank ║
+                                        # ╚════════════════════════════╝
+                                        vBlankCount = vAssortedData.filter((col(vColumn) == "") | col(vColumn).rlike(r"^\s+$")).count()
+                                        vBlankPercentage = (vBlankCount / self._TotalRows) * 100
+                                        self.App["Response"]["Schema"]["Quality"]["Blank"] = {
+                                            vColumn : {
+                                                "Count" : vBlankCount,
+                                                "Percentage" : vBlankPercentage
+                                            }
+                                        }
+                                        if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
+                                            self.show_Info("QC Check", f"Field [{vColumn}] ::> Blank/Whitespace Count = {vBlankCount} ({vBlankPercentage:.2f}%)", "yellow")
+                                        
+                                    case "Unique":
+                                        # ╔═══════════════════════════════╗
+                                        # ║ Data Quality Check - Distinct ║
+                                        # ╚═══════════════════════════════╝
+                                        vDistinctCount = vAssortedData.select(vColumn).distinct().count()
+                                        vDistinctPercentage = (vDistinctCount / self._TotalRows) * 100
+                                        self.App["Response"]["Schema"]["Quality"]["Unique"] = {
+                                            vColumn : {
+                                                "Count" : vDistinctCount,
+                                                "Percentage" : vDistinctPercentage
+                                            }
+                                        }
+                                        if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
+                                            self.show_Info("QC Check", f"Field [{vColumn}] ::> Unique Count = {vDistinctCount} ({vDistinctPercentage:.2f}%)", "yellow")
+                                        vDuplicateCount = self._TotalRows - vDistinctCount
+                                        vDuplicatePercentage = (vDuplicateCount / self._TotalRows) * 100
+                                        self.App["Response"]["Schema"]["Quality"]["Duplicate"] = {
+                                            vColumn : {
+                                                "Count" : vDuplicateCount,
+                                                "Percentage" : vDuplicatePercentage
+                                            }
+                                        }
+                                        if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
+                                            self.show_Info("QC Check", f"Field [{vColumn}] ::> Duplicate Count = {vDuplicateCount} ({vDuplicatePercentage:.2f}%)", "yellow")
+
+                                    case _:
+                                        if ':' in vQualityCheck:
+                                            # ╔═══════════════════════════════════╗
+                                            # ║ Data Quality Check - User Defined ║
+                                            # ╚═══════════════════════════════════╝
+                                            vDefinedName, vDEName = vQualityCheck.split(':')
+                                            if vDEName in self.AppConfig["Main"]["Data"]["Expressions"] and vDefinedName == "UserDefined":
+                                                vDefinedExpressions = self.AppConfig["Main"]["Data"]["Expressions"][vDEName]
+                                                vDefinedCount = vAssortedData.filter(col(vColumn).rlike(vDefinedExpressions)).count()
+                                                vDefinedPercentage = (vDefinedCount / self._TotalRows) * 100
+                                                self.App["Response"]["Schema"]["Quality"]["UserDefined"] = {
+                                                    vDEName : {
+                                                        vColumn : {
+                                                            "Count" : vDefinedCount,
+                                                            "Percentage" : vDefinedPercentage
+                                                        }
+                                                    }
+                                                }
+                                                if self.AppConfig["Main"]["Switchboard"]["DisplayTable"] is False:
+                                                    self.show_Info("QC Check", f"Field [{vColumn}] ::> User-Defined [{vDEName}] Count = {vDefinedCount} ({vDefinedPercentage:.2f}%)", "yellow")
+        self.end_Span("Quality", self._TotalRows)
+        self.start_Span("Integrity")
+        # ======== Do we need to run the integrity check?
+        if self.AppConfig["Main"]["Switchboard"]["IntegrityCheck"] is True and self._TotalRows != 0 and is_DryRun is False:
+            # ╔══════════════════════╗
+            # ║ Data Integrity Check ║
+            # ╚══════════════════════╝
+            # This should be placed before the transformation to eliminate
+            # the false warning that Raw Zone is not equal to Bronze Layer
+            self.show_Info("Integrity", "Generating data integrity checksum")
+            # ======== Concatenate all columns into a single string for each row
+            vIncludedColumns = [col for col in vAssortedData.columns if not col.startswith("Row_")]
+            vAssortedData = vAssortedData.withColumn(
+                    "Row_Concat", concat_ws("||", *vIncludedColumns)
+                )
+            # ======== Sort to get the consistent checksum
+            vAssortedData = vAssortedData.orderBy(
+                    vAssortedData["Row_Concat"].asc()
+                )
+            # ======== Compute SHA-256 hash for each row
+            vAssortedData = vAssortedData.withColumn(
+                    "Row_Checksum", sha2(col("Row_Concat"), 256)
+                )
+            # ======== Aggregate all row hashes into a single checksum
+            vChecksumConcat = vAssortedData.agg(
+                    concat_ws("", collect_list("Row_Checksum")).alias("ConcatenatedChecksums")
+                ).collect()[0]["ConcatenatedChecksums"]
+            import hashlib
+            vDataChecksum = hashlib.sha256(vChecksumConcat.encode()).hexdigest()
+            # ======== Delete temporary column
+            vAssortedData = vAssortedData.drop("Row_Concat")
+            self.show_Info("Checksum", vDataChecksum, "cyan")
+            self.App["Response"]["Schema"]["Integrity"]["Checksum"] = vDataChecksum
+            self.App["Response"]["Schema"]["Integrity"]["Hash"] = "SHA-256"
+        else:
+            self.App["Response"]["Schema"]["Integrity"]["Checksum"] = None
+        self.end_Span("Integrity")
+        self.start_Span("Transform")
+        # ======== Check if we need to transform the Source
+        if self.AppConfig["Main"]["Data"]["Transformer"] == self._Source and self._Target != "Read":
+            # ======== Start of Transformation
+            # ╔═══════════════════════════════════╗
+            # ║ Transformation Area - Filter Data ║
+            # ╚═══════════════════════════════════╝
+            if "Filter" in vSchemaTransformation and vSchemaTransformation["Filter"]:
+                """
+                ╔═══════════════════════════════╗
+                ║ PROPER USAGE of SCHEMA FILTER ║
+                ╚═══════════════════════════════╝
+                "Media" : {
+                    "<MediaType>" : {
+                        "Class" : {
+                            "<MediaClass>" : {
+                                "Schema" : {
+                                    "Transformation" : {
+                                        "Filter" : {
+                                            "OR" : {
+                                                "!=" : {
+                                                    "Age" : {
+                                                        20,
+                                                        40
+                                                    }
+                                                }
+                                            },
+                                            "AND" : {
+                                                "==" : {
+                                                    "City" : {
+                                                        "Lipa City",
+                                                        "Batangas City"
+                                                    }
+                                                }
+                                            }
+                                        }
+                                    }
+                """
+                vExpression = None
+                vDisplayPath = None
+                vDisplayValue = None
+                for vLogicalOperand, vComparisons in vSchemaTransformation["Filter"].items():
+                    for vComparisonOperand, vConditions in vComparisons.items():
+                        for vColName, vCondition in vConditions.items():
+                            if self.is_ColumnExists(vAssortedData, vColName) is True:
+                                for vColValue in vCondition:
+                                    is_ValidOperand = True
+                                    match vComparisonOperand:
+                                        case "==":
+                                            if vColValue is None or vColValue == "Null":
+                                                vCondition = (col(vColName).isNull())
+                                            else:
+                                                vCondition = (col(vColName) == vColValue)
+
+                                        case "!=":
+                                            if vColValue is None or vColValue == "Null":
+                                                vCondition = (col(vColName).isNotNull())
+                                            else:
+                                                vCondition = (col(vColName) != vColValue)
+
+                                        case ">":
+                                            if vColValue == "":
+                                                vColValue = 0
+                                            vCondition = (col(vColName) > vColValue)
+
+                                        case ">=":
+                                            if vColValue == "":
+                                                vColValue = 0
+                                            vCondition = (col(vColName) >= vColValue)
+
+                                        case "<":
+                                            if vColValue == "":
+                                                vColValue = 0
+                                            vCondition = (col(vColName) < vColValue)
+
+                                        case "<=":
+                                            if vColValue == "":
+                                                vColValue = 0
+                                            vCondition = (col(vColName) <= vColValue)
+
+                                        case _:
+                                            is_ValidOperand = False
+
+                                    if vColValue is None or vColValue == "Null":
+                                        vDisplayValue = "Null"
+                                    elif vColValue == "":
+                                        vDisplayValue = "Blank"
+                                    else:
+                                        vDisplayValue = vColValue
+                                    vDisplayExpression = f"{vColName} {vComparisonOperand} {vDisplayValue}"
+                                    if vDisplayPath is None:
+                                        vDisplayPath = vDisplayExpression
+                                    else:
+                                        if vLogicalOperand == "OR":
+                                            vDisplayPath = f"{vDisplayPath} OR {vDisplayExpression}"
+                                        elif vLogicalOperand == "AND":
+                                            vDisplayPath = f"{vDisplayPath} AND {vDisplayExpression}"
+                                    if vExpression is None:
+                                        vExpression = vCondition
+                                    else:
+                                        if vLogicalOperand == "OR":
+                                            vExpression = vExpression | vCondition
+                                        elif vLogicalOperand == "AND":
+                                            vExpression = vExpression & vCondition
+                vAssortedData = vAssortedData.filter(vExpression)
+                if is_DryRun is True:
+                    # ======== Planned only, the rows are not counted
+                    self.show_Info("Filter", f" WHERE {vDisplayPath} ::> Planned", "yellow")
+                else:
+                    vOldTotalRows = self._TotalRows
+                    vNewTotalRows = vAssortedData.count()
+                    vFilteredRows = vOldTotalRows - vNewTotalRows
+                    self.App["Response"]["Schema"]["Rows"]["NetTotal"] = vNewTotalRows
+                    self.App["Response"]["Schema"]["Rows"]["Filtered"] = vFilteredRows
+                    self.show_Info("Filter", f" WHERE {vDisplayPath} ::> Successful", "yellow")
+                    self.show_Info("Filter", f" Removed Rows ::> {format(vFilteredRows, ',')}", "yellow")
+                    self.show_Info("Filter", f" Net Total Rows ::> {format(vNewTotalRows, ',')}", "yellow")
+            # ╔══════════════════════════════════════╗
+            # ║ Transformation Area - Update Columns ║
+            # ╚══════════════════════════════════════╝
+            if self._MediaType == "GA4":
+                vColumn = "date"
+                if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                    # ======== Column existing, then Update Column to YYYY-MM-DD
+                    vAssortedData = vAssortedData.withColumn(
+                        "date",
+                        concat_ws(
+                            "-",
+                            substring("date", 1, 4),  # Extract year
+                            substring("date", 5, 2),  # Extract month
+                            substring("date", 7, 2)   # Extract day
+                        )
+                    )
+                    # ======== Is it successful?
+                    if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                        if self._UpdatedColumns == 0:
+                            self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Updated"] = set()
+                        self._UpdatedColumns += 1
+                        self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Updated"].add(vColumn)
+                        self.App["Response"]["Schema"]["Columns"]["Metrics"]["Updated"] = self._UpdatedColumns
+                        self.show_Info("Updated Col", f"{vColumn} ::> Successful", "yellow")
+                    else:
+                        self.show_Info("Updated Col", f"{vColumn} ::> Failed", "red")
+                else:
+                    # ======== Column is not existing
+                    self.show_Info("Updated Col", f"{vColumn} ::> Failed (Not Existing)", "red")
+            # ╔══════════════════════════════════════╗
+            # ║ Transformation Area - Set Data Types ║
+            # ╚══════════════════════════════════════╝
+            # ======== Scour each attribute
+            for vAttribute in self._DataAttributes:
+                # ======== Scour each column
+                for vColumn, vColumnSpecs in vAppConfigMediaClass["Schema"][vAttribute].items():
+                    # ======== Set Dimension Data Types based from the Configuration
+                    vTypeSet = vColumnSpecs["Type"]
+                    self.set_SparkType(vTypeSet)
+                    if self._ReturnStatus is True:
+                        vDataType = self._ReturnValue
+                        if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                            # ======== Dimension is existing
+                            vAssortedData = vAssortedData.withColumn(
+                                    vColumn, col(vColumn).cast(vDataType)
+                                )
+                            self.show_Info("Set Type", f"[{vColumn}] ::> '{vTypeSet}' ::> Successful", "yellow")
+                        else:
+                            self.show_Info("Set Type", f"[{vColumn}] ::> Not Existing", "red")
+            # ╔══════════════════════════════════════╗
+            # ║ Transformation Area - Adding Columns ║
+            # ╚══════════════════════════════════════╝
+            match self._MediaType:
+                case "GA4":
+                    match self._MediaClass:
+                        case "Page_Metrics":
+                            # ╔══════════════╗
+                            # ║  Add Column  ║
+                            # ╚══════════════╝
+                            vColumn = "Engagement_Rate"
+                            if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                                # ======== Column is already existing
+                                self.show_Info("Added Col", f"{vColumn} ::> Failed (Existing)", "red")
+                            else:
+                                # ======== Column Not existing, then Add New Column
+                                vAssortedData = vAssortedData.withColumn(
+                                    vColumn,
+                                    (col("engagedSessions") / col("sessions")).cast("float")
+                                )
+                                # ======== Is it successful?
+                                if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                                    if self._AddedColumns == 0:
+                                        self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"] = set()
+                                    self._AddedColumns += 1
+                                    self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"].add(vColumn)
+                                    self.App["Response"]["Schema"]["Columns"]["Metrics"]["Added"] = self._AddedColumns
+                                    self.show_Info("Added Col", f"{vColumn} ::> Successful", "yellow")
+                                else:
+                                    self.show_Info("Added Col", f"{vColumn} ::> Failed", "red")
+
+                        case "Demo_GA4":
+                            # ╔══════════════╗
+                            # ║  Add Column  ║
+                            # ╚══════════════╝
+                            vColumn = "Medium_Source-Traffic"
+                            if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                                # ======== Column is already existing
+                                self.show_Info("Added Col", f"{vColumn} ::> Failed (Existing)", "red")
+                            else:
+                                # ======== Column Not existing, then Add New Column
+                                vAssortedData = vAssortedData.withColumn(
+                                        vColumn, split(col("sourceMedium"), " / ").getItem(0)
+                                    )
+                                # ======== Is it successful?
+                                if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                                    if self._AddedColumns == 0:
+                                        self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"] = set()
+                                    self._AddedColumns += 1
+                                    self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"].add(vColumn)
+                                    self.App["Response"]["Schema"]["Columns"]["Metrics"]["Added"] = self._AddedColumns
+                                    self.show_Info("Added Col", f"{vColumn} ::> Successful", "yellow")
+                                else:
+                                    self.show_Info("Added Col", f"{vColumn} ::> Failed", "red")
+                            # ╔══════════════╗
+                            # ║  Add Column  ║
+                            # ╚══════════════╝
+                            vColumn = "Medium_Source-Name"
+                            if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                                # ======== Column is already existing
+                                self.show_Info("Added Col", f"{vColumn} ::> Failed (Existing)", "red")
+                            else:
+                                # ======== Column Not existing, then Add New Column
+                                vAssortedData = vAssortedData.withColumn(
+                                        vColumn, split(col("sourceMedium"), " / ").getItem(1)
+                                    )
+                                # ======== Is it successful?
+                                if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                                    self._AddedColumns += 1
+                                    self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Added"].add(vColumn)
+                                    self.App["Response"]["Schema"]["Columns"]["Metrics"]["Added"] = self._AddedColumns
+                                    self.show_Info("Added Col", f"{vColumn} ::> Successful", "yellow")
+                                else:
+                                    self.show_Info("Added Col", f"{vColumn} ::> Failed", "red")
+
+                        case _:
+                            pass
+
+
+                case "UA":
+                    pass
+
+                case _:
+                    self.reset_Status("InvalidTargetMedia")
+            
+            # ╔════════════════════════════════════════╗
+            # ║ Transformation Area - Dropping Columns ║
+            # ╚════════════════════════════════════════╝
+            # ======== Scour each attribute
+            for vAttribute in self._DataAttributes:
+                # ======== Scour each column
+                for vColumn, vColumnSpecs in vAppConfigMediaClass["Schema"][vAttribute].items():
+                    if "Drop" in vColumnSpecs and vColumnSpecs["Drop"] is True:
+                        if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                            # ======== Column is existing, then Delete the Column
+                            vAssortedData = vAssortedData.drop(vColumn)
+                            if self.is_ColumnExists(vAssortedData, vColumn) is True:
+                                self.show_Info("Deleted Col", f"{vColumn} ::> Failed", "red")
+                            else:
+                                if self._PurgedColumns == 0:
+                                    self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Purged"] = set()
+                                self._PurgedColumns += 1
+                                self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Purged"].add(vColumn)
+                                self.App["Response"]["Schema"]["Columns"]["Metrics"]["Purged"] = self._PurgedColumns
+                                self.show_Info("Deleted Col", f"{vColumn} ::> Successful", "yellow")
+                        elif vColumn in vPrunedColumns:
+                            # ======== Column was not read from the source
+                            if self._PurgedColumns == 0:
+                                self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Purged"] = set()
+                            self._PurgedColumns += 1
+                            self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Purged"].add(vColumn)
+                            self.App["Response"]["Schema"]["Columns"]["Metrics"]["Purged"] = self._PurgedColumns
+                            self.show_Info("Deleted Col", f"{vColumn} ::> Successful (Pruned at Scan)", "yellow")
+                        else:
+                            self.show_Info("Deleted Col", f"{vColumn} ::> Failed (Not Existing)", "red")
+            # ╔═══════════════════════════════╗
+            # ║ Transformation Area - Sorting ║
+            # ╚═══════════════════════════════╝
+            is_Sorted = False
+            if "Sort" in vSchemaTransformation and vSchemaTransformation["Sort"]:
+                """
+                ╔════════════════════════════════════════════╗
+                ║ PROPER USAGE of SORTING by MULTIPLE FIELDS ║
+                ╚════════════════════════════════════════════╝
+                "Media" : {
+                    "<MediaType>" : {
+                        "Class" : {
+                            "<MediaClass>" : {
+                                "Schema" : {
+                                    "Transformation" : {
+                                        "Sort" : {
+                                            "Field1" : "ASC",
+                                            "Field2" : "DESC"
+                                        }
+                                    }
+                """
+                vSortColumns = []
+                for vSortField, vSortOrder in vSchemaTransformation["Sort"].items():
+                    if vSortOrder.upper() == "ASC":
+                        vSortColumns.append(vAssortedData[vSortField].asc())
+                        self.show_Info("Sorted By", f"{vSortField} ::> Ascending", "yellow")
+                        is_Sorted = True
+                    elif vSortOrder.upper() == "DESC":
+                        vSortColumns.append(vAssortedData[vSortField].desc())
+                        self.show_Info("Sorted By", f"{vSortField} ::> Descending", "yellow")
+                        is_Sorted = True
+            if is_Sorted is True:
+                # ======== Transfer the Sorted Data
+                vDataLoad = vAssortedData.orderBy(*vSortColumns)
+            else:
+                # ======== No Sorting happened
+                vDataLoad = vAssortedData
+            # ╔════════════════════════════════════════╗
+            # ║ Transformation Area - Renaming Columns ║
+            # ╚════════════════════════════════════════╝
+            # Renaming should be at the end of transformation stage
+            for vAttribute in self._DataAttributes:
+                # ======== Scour each column
+                for vColumn, vColumnSpecs in vAppConfigMediaClass["Schema"][vAttribute].items():
+                    if "Rename" in vColumnSpecs and vColumnSpecs["Rename"] is not None:
+                        vNewName = vColumnSpecs["Rename"]
+                        if self.is_ColumnExists(vDataLoad, vColumn) is True:
+                            # ======== Column is existing, then Rename the Column
+                            vDataLoad = vDataLoad.withColumnRenamed(vColumn, vNewName)
+                            if self.is_ColumnExists(vDataLoad, vColumn) is True:
+                                self.show_Info("Renamed Col", f"{vColumn} to '{vNewName}' ::> Failed", "red")
+                            else:
+                                self._RenamedColumns += 1
+                                self.App["Response"]["Schema"]["Columns"]["Dimensions"]["Renamed"][vColumn] = vNewName
+                                self.App["Response"]["Schema"]["Columns"]["Metrics"]["Renamed"] = self._RenamedColumns
+                                self.show_Info("Renamed Col", f"{vColumn} to '{vNewName}' ::> Successful", "yellow")
+                        else:
+                            self.show_Info("Renamed Col", f"{vColumn} ::> Failed (Not Existing)", "red")
+            # ╔═══════════════════════╗
+            # ║ End of Transformation ║
+            # ╚═══════════════════════╝
+            if self._ReturnStatus is not True:
+                raise MigrationError(
+                    self.show_ErrorMsg()
+                )
+
+        else:
+            # ======== No transformation
+            vDataLoad = vAssortedData
+        self.end_Span("Transform", self.App["Response"]["Schema"]["Rows"]["NetTotal"], vDataLoad)
+        return vAssortedData, vDataLoad
+
+    def set_AuditColumns (
+            self,
+            arg_DataFrame,
+            arg_PipelineCaller
+        ):
+        # ======== Add the Audit Row Trails and put them at the end of the columns
+        lit = self.get_Import("pyspark.sql.functions", "lit")
+        date_format = self.get_Import("pyspark.sql.functions", "date_format")
+        current_timestamp = self.get_Import("pyspark.sql.functions", "current_timestamp")
+        TimestampType = self.get_Import("pyspark.sql.types", "TimestampType")
+        vDataFrame = arg_DataFrame.withColumn(
+                "Row_Inserted-On", 
+                date_format(
+                        current_timestamp(), "yyyy-MM-dd HH:mm:ss"
+                    ).cast(TimestampType())
+            ).withColumn(
+                "Row_Inserted-By", 
+                lit(arg_PipelineCaller)
+            ).withColumn(
+                "Row_Updated-On", 
+                date_format(
+                        current_timestamp(), "yyyy-MM-dd HH:mm:ss"
+                    ).cast(TimestampType())
+            ).withColumn(
+                "Row_Updated-By", 
+                lit(arg_PipelineCaller)
+             )
+        # ======== Reorder columns and put Audit columns at the end
+        vRegularColumns = [col for col in vDataFrame.columns if not col.startswith("Row_")]
+        vAuditColumns = [col for col in vDataFrame.columns if col.startswith("Row_")]
+        vOrderedColumns = vRegularColumns + vAuditColumns
+        return vDataFrame.select(vOrderedColumns)
+
+    def get_PlannedActions (
+            self,
+            arg_ConfigMediaClass
+        ):
+        # ======== Count the Spark actions that will scan the source in Start
+        vSwitchboard = self.AppConfig["Main"]["Switchboard"]
+        vSchemaTransformation = arg_ConfigMediaClass["Schema"]["Transformation"]
+        vActions = 0
+        if self._Target != "Read":
+            # ======== Target write
+            vActions += 1
+        if vSwitchboard["DisplayTable"] is True:
+            vActions += 1
+        if vSwitchboard["IntegrityCheck"] is True:
+            vActions += 1
+        if self._Target != "Read" and vSwitchboard["QualityCheck"] is True:
+            if arg_ConfigMediaClass["Schema"]["Quality"]["Duplicates"]["Remove"] is True:
+                vActions += 1
+            for vAttribute in self._DataAttributes:
+                for vColumnSpecs in arg_ConfigMediaClass["Schema"][vAttribute].values():
+                    if "Quality" in vColumnSpecs:
+                        vActions += len(vColumnSpecs["Quality"])
+        if self.AppConfig["Main"]["Data"]["Transformer"] == self._Source and self._Target != "Read":
+            if "Filter" in vSchemaTransformation and vSchemaTransformation["Filter"]:
+                vActions += 1
+        return vActions
+
+    def get_DryRun (
+            self,
+            arg_SourceData,
+            arg_DataLoad,
+            arg_ConfigMediaClass
+        ):
+        # ======== Print the physical plan and estimate the cost of the transfer, no Spark job is triggered
+        import re
+        arg_DataLoad.explain("formatted")
+        # ======== Input bytes from the file listings of the scanned directories
+        vInputFiles = arg_SourceData.inputFiles()
+        vDirectories = {}
+        for vFile in vInputFiles:
+            vDirectories.setdefault(vFile.rsplit("/", 1)[0], set()).add(vFile)
+        try:
+            vInputBytes = 0
+            for vDirectory, vFiles in vDirectories.items():
+                vInputBytes += sum(vFileInfo.size for vFileInfo in dbutils.fs.ls(vDirectory) if vFileInfo.path in vFiles)
+        except Exception:
+            vInputBytes = None
+        # ======== Every Exchange of the physical plan is a shuffle of the written data
+        vPhysicalPlan = arg_DataLoad._jdf.queryExecution().executedPlan().toString()
+        return {
+            "InputFiles" : len(vInputFiles),
+            "InputBytes" : vInputBytes,
+            "PlanBytes" : self.get_PlanBytes(arg_DataLoad),
+            # ======== Row count of the source and the actions planned after it
+            "Actions" : self.get_PlannedActions(arg_ConfigMediaClass) + 1,
+            "Shuffles" : len(re.findall(r"\bExchange\b", vPhysicalPlan))
+        }
+
+    def get_PrunedColumns (
+            self,
+            arg_ConfigMediaClass
+        ):
+        # ======== Columns to leave out of the source scan
+        vPrunedColumns = set()
+        # Only the Transformer drops columns, and the checksum needs every column of the source
+        if self.AppConfig["Main"]["Data"]["Transformer"] != self._Source or \
+            self._Target == "Read" or \
+            self.AppConfig["Main"]["Switchboard"]["IntegrityCheck"] is True or \
+            self._MediaClass in self._CodedClasses.get(self._MediaType, set()):
+            return vPrunedColumns
+        vSchema = arg_ConfigMediaClass["Schema"]
+        vSchemaTransformation = vSchema["Transformation"]
+        # ======== Columns still needed by the filter, sort, duplicates and new columns
+        vNeededColumns = set()
+        if "Filter" in vSchemaTransformation and vSchemaTransformation["Filter"]:
+            for vComparisons in vSchemaTransformation["Filter"].values():
+                for vConditions in vComparisons.values():
+                    vNeededColumns.update(vConditions.keys())
+        if "Sort" in vSchemaTransformation and vSchemaTransformation["Sort"]:
+            vNeededColumns.update(vSchemaTransformation["Sort"].keys())
+        if vSchema["Quality"]["Duplicates"]["Remove"] is True:
+            if "*" in vSchema["Quality"]["Duplicates"]["Fields"]:
+                # ======== Duplicates are matched on every column of the source
+                return vPrunedColumns
+            vNeededColumns.update(vSchema["Quality"]["Duplicates"]["Fields"])
+        if "New" in vSchemaTransformation:
+            for vOperations in vSchemaTransformation["New"].values():
+                for vSpecs in vOperations.values():
+                    for vField, vValue in vSpecs.items():
+                        vNeededColumns.add(vField)
+                        if isinstance(vValue, dict):
+                            vNeededColumns.update(vValue.keys())
+                        else:
+                            vNeededColumns.add(vValue)
+        for vAttribute in self._DataAttributes:
+            for vColumn, vColumnSpecs in vSchema[vAttribute].items():
+                # ======== Quality Checks run before the columns are dropped
+                if "Drop" in vColumnSpecs and vColumnSpecs["Drop"] is True and vColumn not in vNeededColumns and \
+                    "Quality" not in vColumnSpecs:
+                    vPrunedColumns.add(vColumn)
+        return vPrunedColumns
+
     def Read_TotalRows (
             self,
             arg_MediaType,
             arg_MediaClasses,
             arg_DataLayers
         ):
+        """
+        ╔════════════════════════════╗
+        ║ PROPER USAGE of TOTAL ROWS ║
+        ╚════════════════════════════╝
+        Counts the Blob layers of each Media Class from their metadata, without Start, e.g.,
+        DM.Read_TotalRows("GA4", ["Demo_GA4", "Page_Metrics"], ["BL", "SL", "GL"])
+        Delta layers are counted from the transaction log statistics and sized by DESCRIBE DETAIL,
+        Parquet layers are counted from the file footers. Other layers are listed as Skipped.
+        All the layers are counted concurrently up to Main.Parallel.MaxWorkers.
+        Returns a DataFrame of MediaClass, Layer, Format, Rows, Files, Bytes and Status
+        """
         is_Success = False
         from datetime import datetime
+        from concurrent.futures import ThreadPoolExecutor
         vStartDT = datetime.now()
         self.show_Info("Started", f"{self.get_PHdatetime(vStartDT)}")
-        for vMediaClass in arg_MediaClasses:
-            for vDataLayer in arg_DataLayers:
-                is_Success = False
-                self.LibConfig["Main"]["Switchboard"]["SilentMode"] = True
-                self.Start(arg_MediaType, vMediaClass, vDataLayer, "Read")
-                self.LibConfig["Main"]["Switchboard"]["SilentMode"] = False
-                if self.App["Response"]["Success"]:
-                    is_Success = True
-                    if self._TotalRows:
-                        self.show_Info("Total Rows", f"{arg_MediaType}\\{vMediaClass}\\{vDataLayer} ::> {format(self._TotalRows, ',')}")
-                else:
-                    self.show_Info("Error", self.App["Response"]["Failure"]["Message"]["Display"], "red")
-                    vException = self.App["Response"]["Failure"]["Message"]["Exception"]
-                    if vException is not None or not isinstance(vException, bool):
-                        self.show_Info("Exception", str(vException), "red")
-                    break
-            print('')
+        vCounts = []
+        vFutures = {}
+        vMaxWorkers = max(1, self.AppConfig["Main"]["Parallel"]["MaxWorkers"])
+        with ThreadPoolExecutor(max_workers = vMaxWorkers, thread_name_prefix = arg_MediaType) as vExecutor:
+            for vMediaClass in arg_MediaClasses:
+                for vDataLayer in arg_DataLayers:
+                    vConfigStage = self.AppConfig["Media"][arg_MediaType]["Stage"].get(vDataLayer, {})
+                    vFormat = vConfigStage.get("Provider", {}).get("Format")
+                    try:
+                        # ======== Paths are resolved in this thread, the library calls share their return state
+                        vLayerPath = self.get_LayerPath(arg_MediaType, vMediaClass, vDataLayer)
+                    except Exception as ExceptionError:
+                        self._Exception = ExceptionError
+                        vCounts.append((vMediaClass, vDataLayer, vFormat, None, None, None, "Failed"))
+                        self.show_Info("Total Rows", f"{arg_MediaType}\\{vMediaClass}\\{vDataLayer} ::> {self.clean_Exception()}", "red")
+                        continue
+                    if vLayerPath is None:
+                        vCounts.append((vMediaClass, vDataLayer, vFormat, None, None, None, "Skipped"))
+                        self.show_Info("Total Rows", f"{arg_MediaType}\\{vMediaClass}\\{vDataLayer} ::> Skipped", "yellow")
+                    else:
+                        vFutures[(vMediaClass, vDataLayer, vFormat)] = vExecutor.submit(self.get_LayerRows, vFormat, vLayerPath)
+            for (vMediaClass, vDataLayer, vFormat), vFuture in vFutures.items():
+                try:
+                    vLayerRows = vFuture.result()
+                    vCounts.append((vMediaClass, vDataLayer, vFormat, vLayerRows["Rows"], vLayerRows["Files"], vLayerRows["Bytes"], "Successful"))
+                    self.show_Info("Total Rows", f"{arg_MediaType}\\{vMediaClass}\\{vDataLayer} ::> {format(vLayerRows['Rows'], ',')}")
+                except Exception as ExceptionError:
+                    self._Exception = ExceptionError
+                    vCounts.append((vMediaClass, vDataLayer, vFormat, None, None, None, "Failed"))
+                    self.show_Info("Total Rows", f"{arg_MediaType}\\{vMediaClass}\\{vDataLayer} ::> {self.clean_Exception()}", "red")
+        is_Success = all(vCount[-1] != "Failed" for vCount in vCounts)
+        vTotalRows = spark.createDataFrame(
+            vCounts,
+            "MediaClass string, Layer string, Format string, Rows long, Files long, Bytes long, Status string"
+        )
         if is_Success is True:
             self.show_Info("Reading", "Successful", "green")
         else:
@@ -1323,7 +1737,7 @@ class Data_Migration (Data_Specs, Shared_MainLib):
         if self.AppConfig["Main"]["Switchboard"]["TestMode"] is True:
             return is_Success
         else:
-            return None
+            return vTotalRows
 
     def Read_Checksum (
             self,
@@ -1393,17 +1807,20 @@ class Data_Migration (Data_Specs, Shared_MainLib):
         from datetime import datetime
         vStartDT = datetime.now()
         self.show_Info("Started", f"{self.get_PHdatetime(vStartDT)}")
-        for vMediaClass in arg_MediaClasses:
+        def display_Class (arg_Worker, arg_MediaClass):
+            is_Success = False
             for vSourceLayer in arg_SourceLayers:
                 is_Success = False
-                self.AppConfig["Main"]["Switchboard"]["DebugMode"] = arg_isDebug
-                self.AppConfig["Main"]["Switchboard"]["DisplayTable"] = True
-                self.Start(arg_MediaType, vMediaClass, vSourceLayer, "Read")
+                arg_Worker.AppConfig["Main"]["Switchboard"]["DebugMode"] = arg_isDebug
+                arg_Worker.AppConfig["Main"]["Switchboard"]["DisplayTable"] = True
+                arg_Worker.Start(arg_MediaType, arg_MediaClass, vSourceLayer, "Read")
                 print('')
-                if self.App["Response"]["Success"]:
+                if arg_Worker.App["Response"]["Success"]:
                     is_Success = True
                 else:
                     break
+            return is_Success
+        is_Success = self.run_Classes(arg_MediaType, arg_MediaClasses, display_Class)
         if is_Success is True:
             self.show_Info("Display", "Successful", "green")
         else:
@@ -1428,16 +1845,30 @@ class Data_Migration (Data_Specs, Shared_MainLib):
         from datetime import datetime
         vStartDT = datetime.now()
         self.show_Info("Started", f"{self.get_PHdatetime(vStartDT)}")
-        for vMediaClass in arg_MediaClasses:
-            for vSource, vTarget in arg_Lineage.items():
-                is_Success = False
-                self.AppConfig["Main"]["Switchboard"]["DebugMode"] = True
-                self.Start(arg_MediaType, vMediaClass, vSource, vTarget)
-                print('')
-                if self.App["Response"]["Success"]:
-                    is_Success = True
-                else:
-                    break
+        # ======== Feed each written layer to the next hop from memory
+        self._ChainLineage = self.AppConfig["Main"]["Switchboard"]["ChainLineage"]
+        def transfer_Class (arg_Worker, arg_MediaClass):
+            is_Success = False
+            try:
+                for vSource, vTarget in arg_Lineage.items():
+                    is_Success = False
+                    arg_Worker.AppConfig["Main"]["Switchboard"]["DebugMode"] = True
+                    arg_Worker.Start(arg_MediaType, arg_MediaClass, vSource, vTarget)
+                    print('')
+                    if arg_Worker.App["Response"]["Success"]:
+                        is_Success = True
+                    else:
+                        break
+            finally:
+                # ======== Release the layer that was not consumed by a next hop
+                if arg_Worker._Handoff is not None:
+                    arg_Worker._Handoff["Data"].unpersist()
+                    arg_Worker._Handoff = None
+            return is_Success
+        try:
+            is_Success = self.run_Classes(arg_MediaType, arg_MediaClasses, transfer_Class)
+        finally:
+            self._ChainLineage = False
         if is_Success is True:
             self.show_Info("Transfer", "Successful", "green")
         else:
@@ -1452,6 +1883,602 @@ class Data_Migration (Data_Specs, Shared_MainLib):
         else:
             return None
 
+    def run_Classes (
+            self,
+            arg_MediaType,
+            arg_MediaClasses,
+            arg_Runner
+        ):
+        """
+        ╔═════════════════════════════╗
+        ║ PROPER USAGE of PARALLELISM ║
+        ╚═════════════════════════════╝
+        Runs arg_Runner(<Worker>, <MediaClass>) for each Media Class, e.g., the loop of Run_Transfer
+        "Main" : {
+            "Parallel" : {
+                "MaxWorkers" : 4,           # 1 runs the Media Classes in series on this instance
+                "Pool" : "Media",           # FAIR scheduler pool prefix, None for the default pool
+                "ContinueOnFailure" : True  # False stops at the first failed Media Class
+            }
+        }
+        Each worker is a copy of this instance with its own App, AppConfig and LibConfig,
+        so the Response and Switchboard of a Media Class are not shared with the others.
+        The outcome of every Media Class is aggregated in App["Response"]["Summary"].
+        """
+        import copy
+        from datetime import datetime
+        from concurrent.futures import (
+            ThreadPoolExecutor,
+            as_completed
+        )
+        vParallel = self.AppConfig["Main"]["Parallel"]
+        vMaxWorkers = max(1, min(vParallel["MaxWorkers"], len(arg_MediaClasses)))
+        vSummary = {
+            "MediaType" : arg_MediaType,
+            "Workers" : vMaxWorkers,
+            "Total" : len(arg_MediaClasses),
+            "Successful" : 0,
+            "Failed" : 0,
+            "Skipped" : 0,
+            "Classes" : {}
+        }
+
+        def run_Class (arg_Worker, arg_MediaClass):
+            vStartDT = datetime.now()
+            is_Success = False
+            # ======== Jobs of this thread are scheduled in the pool of its Media Class
+            if vMaxWorkers > 1 and vParallel["Pool"] is not None:
+                spark.sparkContext.setLocalProperty("spark.scheduler.pool", f'{vParallel["Pool"]}_{arg_MediaClass}')
+            try:
+                is_Success = arg_Runner(arg_Worker, arg_MediaClass) is True
+            except Exception as ExceptionError:
+                arg_Worker._Exception = ExceptionError
+                arg_Worker.show_Info("Exception", str(ExceptionError), "red")
+            finally:
+                if vMaxWorkers > 1 and vParallel["Pool"] is not None:
+                    spark.sparkContext.setLocalProperty("spark.scheduler.pool", None)
+            vEndDT = datetime.now()
+            return {
+                "Success" : is_Success,
+                "Started" : self.get_PHdatetime(vStartDT),
+                "Ended" : self.get_PHdatetime(vEndDT),
+                "Duration" : str(vEndDT - vStartDT),
+                "Failure" : None if is_Success else arg_Worker.App["Response"]["Failure"]["Message"]["Display"],
+                "Response" : arg_Worker.App["Response"]
+            }
+
+        if vMaxWorkers == 1:
+            # ======== Series: same instance, same behavior as a plain loop
+            for vMediaClass in arg_MediaClasses:
+                vSummary["Classes"][vMediaClass] = copy.deepcopy(run_Class(self, vMediaClass))
+                if vSummary["Classes"][vMediaClass]["Success"] is False and vParallel["ContinueOnFailure"] is False:
+                    break
+        else:
+            # ======== Parallel: a copy of the App state per Media Class
+            vFutures = {}
+            with ThreadPoolExecutor(max_workers = vMaxWorkers, thread_name_prefix = arg_MediaType) as vExecutor:
+                for vMediaClass in arg_MediaClasses:
+                    vFutures[vExecutor.submit(run_Class, self.get_Worker(), vMediaClass)] = vMediaClass
+                for vFuture in as_completed(vFutures):
+                    if vFuture.cancelled():
+                        # ======== Never started, counted as Skipped below
+                        continue
+                    vSummary["Classes"][vFutures[vFuture]] = vFuture.result()
+                    if vSummary["Classes"][vFutures[vFuture]]["Success"] is False and vParallel["ContinueOnFailure"] is False:
+                        # ======== Drop the Media Classes that have not started yet
+                        for vPending in vFutures:
+                            vPending.cancel()
+        for vMediaClass in arg_MediaClasses:
+            if vMediaClass not in vSummary["Classes"]:
+                vSummary["Skipped"] = vSummary["Skipped"] + 1
+            elif vSummary["Classes"][vMediaClass]["Success"] is True:
+                vSummary["Successful"] = vSummary["Successful"] + 1
+            else:
+                vSummary["Failed"] = vSummary["Failed"] + 1
+                self.show_Info("Failed", f'{arg_MediaType}\\{vMediaClass} ::> {vSummary["Classes"][vMediaClass]["Failure"]}', "red")
+        self.App["Response"]["Summary"] = vSummary
+        return vSummary["Successful"] == vSummary["Total"]
+
+    def get_Worker (
+            self
+        ):
+        # ======== Copy of this instance with its own App, AppConfig and LibConfig for a worker thread
+        import copy
+        vWorker = copy.copy(self)
+        vWorker.App = copy.deepcopy(self.App)
+        vWorker.AppConfig = copy.deepcopy(self.AppConfig)
+        vWorker.LibConfig = copy.deepcopy(self.LibConfig)
+        vWorker._Handoff = None
+        vWorker._SecretStats = {
+            "Hits" : 0,
+            "Misses" : 0
+        }
+        vWorker._Worker = True
+        return vWorker
+
+    def get_TaskGraph (
+            self,
+            arg_MediaType,
+            arg_MediaClasses,
+            arg_Lineage
+        ):
+        # ======== Hops as (MediaClass, Source) and the hops each of them waits for
+        vMerger = self.AppConfig["Main"]["Data"]["Merger"]
+        vGraph = {}
+        for vMediaClass in arg_MediaClasses:
+            for vSource in arg_Lineage:
+                vGraph[(vMediaClass, vSource)] = {
+                    (vMediaClass, vPrevSource) for vPrevSource, vPrevTarget in arg_Lineage.items()
+                    if vPrevTarget == vSource
+                }
+        # ======== The Merger hop of a Media Class also waits for the Merger layer of its merged classes
+        for vMediaClass in arg_MediaClasses:
+            vMerge = self.AppConfig["Media"][arg_MediaType]["Class"][vMediaClass].get("Merge", {})
+            if (vMediaClass, vMerger) in vGraph:
+                for vMergedClass in vMerge.get("Classes", set()):
+                    vGraph[(vMediaClass, vMerger)] |= {
+                        (vMergedClass, vPrevSource) for vPrevSource, vPrevTarget in arg_Lineage.items()
+                        if vPrevTarget == vMerger and (vMergedClass, vPrevSource) in vGraph
+                    }
+        return vGraph
+
+    def get_TaskOrder (
+            self,
+            arg_Graph
+        ):
+        # ======== Topological order of the Task Graph, None if it has a cycle
+        vWaiting = {vTask: set(vDeps) for vTask, vDeps in arg_Graph.items()}
+        vOrder = []
+        vReady = [vTask for vTask, vDeps in vWaiting.items() if not vDeps]
+        while vReady:
+            vTask = vReady.pop(0)
+            vOrder.append(vTask)
+            for vNext, vDeps in vWaiting.items():
+                if vTask in vDeps:
+                    vDeps.discard(vTask)
+                    if not vDeps:
+                        vReady.append(vNext)
+        if len(vOrder) != len(vWaiting):
+            return None
+        return vOrder
+
+    def get_TableName (
+            self,
+            arg_MediaType,
+            arg_MediaClass,
+            arg_DataLayer
+        ):
+        # ======== Media Class name of a layer, customized by Schema.Transformation.Table as in Start
+        vTable = self.AppConfig["Media"][arg_MediaType]["Class"][arg_MediaClass]["Schema"]["Transformation"].get("Table", {})
+        if "Name" in vTable and arg_DataLayer in vTable.get("Layers", set()):
+            return vTable["Name"]
+        return arg_MediaClass
+
+    def get_LayerPath (
+            self,
+            arg_MediaType,
+            arg_MediaClass,
+            arg_DataLayer
+        ):
+        # ======== Distributed File System Path of a Blob layer, None for the other layers
+        # Raises when the path of a Blob layer cannot be resolved
+        vConfigStage = self.AppConfig["Media"][arg_MediaType]["Stage"][arg_DataLayer]
+        if vConfigStage["Provider"]["Type"] != "Azure/Blob":
+            return None
+        vConfigMediaClass = self.AppConfig["Media"][arg_MediaType]["Class"][arg_MediaClass]
+        vMode = "Debug" if self.AppConfig["Main"]["Switchboard"]["DebugMode"] is True else "Live"
+        if "Directory" in self.AppConfig["Media"][arg_MediaType]["Common"]:
+            vPath_ParentDir = self.AppConfig["Media"][arg_MediaType]["Common"]["Directory"][vMode]
+        else:
+            vPath_ParentDir = vConfigMediaClass["Directory"][vMode]
+        vLayerLoc = self.get_MediaPath(
+            vPath_ParentDir,
+            arg_MediaType,
+            self.get_TableName(arg_MediaType, arg_MediaClass, arg_DataLayer),
+            arg_DataLayer,
+            vConfigStage["Provider"]["SubDir"]["Path"],
+            vConfigStage["Provider"]["SubDir"]["Extension"]
+        )
+        if self.get_AzureDFS(
+                vConfigStage["Secret"]["StorageAccount"]["Scope"],
+                vConfigStage["Secret"]["StorageAccount"]["Key"],
+                vConfigStage["Secret"]["StorageContainer"]["Scope"],
+                vConfigStage["Secret"]["StorageContainer"]["Key"],
+                vLayerLoc
+            ) is False:
+            raise Exception(f"{vLayerLoc} ::> {self.clean_Exception()}")
+        return self._ReturnValue
+
+    def get_LayerRows (
+            self,
+            arg_Format,
+            arg_LayerPath
+        ):
+        # ======== Row count of a layer from its metadata, the bare scan reads no column data
+        # Delta answers it from the numRecords statistics of the transaction log only when the
+        # metadata-only rewrite applies: Databricks, or Delta Lake 2.3+ with
+        # spark.databricks.delta.optimizeMetadataQuery.enabled (default) and statistics on every file.
+        # Older open source Delta, or files written without statistics, fall back to a file scan.
+        # Parquet and the other formats are counted from the file footers at best
+        vLayer = spark.read.format(arg_Format).load(arg_LayerPath)
+        if arg_Format == "delta":
+            vDetail = spark.sql(f"DESCRIBE DETAIL delta.`{arg_LayerPath}`").first()
+            vFiles = vDetail["numFiles"]
+            vBytes = vDetail["sizeInBytes"]
+        else:
+            vFiles = len(vLayer.inputFiles())
+            vBytes = None
+        return {
+            "Rows" : vLayer.count(),
+            "Files" : vFiles,
+            "Bytes" : vBytes
+        }
+
+    def get_LayerVersion (
+            self,
+            arg_MediaType,
+            arg_MediaClass,
+            arg_DataLayer
+        ):
+        # ======== Latest Delta version of a Blob layer, None if it cannot be told without reading it
+        try:
+            vConfigStage = self.AppConfig["Media"][arg_MediaType]["Stage"][arg_DataLayer]
+            if vConfigStage["Provider"]["Type"] != "Azure/Blob" or vConfigStage["Provider"]["Format"] != "delta":
+                return None
+            vLayerPath = self.get_LayerPath(arg_MediaType, arg_MediaClass, arg_DataLayer)
+            if vLayerPath is not None:
+                return spark.sql(f"DESCRIBE HISTORY delta.`{vLayerPath}` LIMIT 1").first()["version"]
+        except Exception as ExceptionError:
+            self._Exception = ExceptionError
+        return None
+
+    def Run_Graph (
+            self,
+            arg_MediaType,
+            arg_MediaClasses,
+            arg_Lineage
+        ):
+        """
+        ╔════════════════════════════╗
+        ║ PROPER USAGE of TASK GRAPH ║
+        ╚════════════════════════════╝
+        Runs every hop of the Lineage for each Media Class as a Task Graph, e.g.,
+        DM.Run_Graph("GA4", ["Demo_GA4", "Page_Metrics"], {"RZ": "BL", "BL": "SL", "SL": "GL"})
+        A hop waits for the hop that writes its Source; the Merger hop also waits for the classes it merges:
+        "Class" : {
+            "<MediaClass>" : {
+                "Merge" : {
+                    "Classes" : {"<Other MediaClass>"}
+        Ready hops run in parallel up to Main.Parallel.MaxWorkers.
+        A hop is skipped as Unchanged when the Delta versions of its inputs are the same
+        as on its last successful run; hops after a failed one are Blocked.
+        """
+        is_Success = False
+        from datetime import datetime
+        import zlib
+        from concurrent.futures import (
+            ThreadPoolExecutor,
+            wait,
+            FIRST_COMPLETED
+        )
+        vStartDT = datetime.now()
+        self.show_Info("Started", f"{self.get_PHdatetime(vStartDT)}")
+        vParallel = self.AppConfig["Main"]["Parallel"]
+        vMerger = self.AppConfig["Main"]["Data"]["Merger"]
+        vGraph = self.get_TaskGraph(arg_MediaType, arg_MediaClasses, arg_Lineage)
+        vOrder = self.get_TaskOrder(vGraph)
+        vState = {}
+        vFingerprints = {}
+
+        def run_Task (arg_Task):
+            vMediaClass, vSource = arg_Task
+            vTarget = arg_Lineage[vSource]
+            vWorker = self.get_Worker()
+            vWorker.AppConfig["Main"]["Switchboard"]["DebugMode"] = True
+            # ======== Fingerprint of the Delta versions this hop reads
+            vInputs = [(vMediaClass, vSource)]
+            if vSource == vMerger:
+                vMerge = self.AppConfig["Media"][arg_MediaType]["Class"][vMediaClass].get("Merge", {})
+                vInputs = vInputs + [(vMergedClass, vMerger) for vMergedClass in sorted(vMerge.get("Classes", set()))]
+            vVersions = [vWorker.get_LayerVersion(arg_MediaType, vInputClass, vInputLayer) for vInputClass, vInputLayer in vInputs]
+            vFingerprint = None
+            if None not in vVersions:
+                vFingerprint = zlib.crc32("|".join(
+                    f"{vInputClass}:{vInputLayer}={vVersion}" for (vInputClass, vInputLayer), vVersion in zip(vInputs, vVersions)
+                ).encode())
+                if vFingerprint == vWorker.get_DeltaVersion(arg_MediaType, vMediaClass, vSource, vTarget, "Fingerprints"):
+                    vWorker.show_Info("Unchanged", f"{arg_MediaType}\\{vMediaClass} ::> {vSource} ::> {vTarget}", "yellow")
+                    return "Unchanged"
+            if vParallel["Pool"] is not None:
+                spark.sparkContext.setLocalProperty("spark.scheduler.pool", f'{vParallel["Pool"]}_{vMediaClass}')
+            try:
+                vWorker.Start(arg_MediaType, vMediaClass, vSource, vTarget)
+                print('')
+            finally:
+                if vParallel["Pool"] is not None:
+                    spark.sparkContext.setLocalProperty("spark.scheduler.pool", None)
+            if vWorker.App["Response"]["Success"]:
+                # ======== Recorded by the coordinating thread, not concurrently by the hops
+                if vFingerprint is not None:
+                    vFingerprints[arg_Task] = vFingerprint
+                return "Successful"
+            return "Failed"
+
+        if vOrder is None:
+            self.show_Info("Error", self.show_ErrorMsg("InvalidTaskGraph", f"{arg_MediaType} ::> {arg_Lineage}"), "red")
+        else:
+            vPending = list(vOrder)
+            vRunning = {}
+            with ThreadPoolExecutor(max_workers = max(1, vParallel["MaxWorkers"]), thread_name_prefix = arg_MediaType) as vExecutor:
+                while vPending or vRunning:
+                    # ======== Submit the hops whose inputs are all settled, in topological order
+                    for vTask in list(vPending):
+                        if any(vState.get(vDep) in ("Failed", "Blocked") for vDep in vGraph[vTask]):
+                            vState[vTask] = "Blocked"
+                            vPending.remove(vTask)
+                        elif all(vDep in vState for vDep in vGraph[vTask]):
+                            vRunning[vExecutor.submit(run_Task, vTask)] = vTask
+                            vPending.remove(vTask)
+                    if not vRunning:
+                        break
+                    vDone, _ = wait(vRunning, return_when = FIRST_COMPLETED)
+                    for vFuture in vDone:
+                        vTask = vRunning.pop(vFuture)
+                        try:
+                            vState[vTask] = vFuture.result()
+                        except Exception as ExceptionError:
+                            self._Exception = ExceptionError
+                            vState[vTask] = "Failed"
+                        if vTask in vFingerprints:
+                            vMediaClass, vSource = vTask
+                            if self.set_DeltaVersion(arg_MediaType, vMediaClass, vSource, arg_Lineage[vSource], vFingerprints[vTask], "Fingerprints") is False:
+                                # ======== The hop runs again next time instead of being skipped as Unchanged
+                                self.show_Info("Fingerprint", f"{arg_MediaType}\\{vMediaClass} ::> {vSource} ::> Not Recorded ({self.clean_Exception()})", "red")
+            is_Success = all(vState.get(vTask) in ("Successful", "Unchanged") for vTask in vOrder)
+        # ======== Aggregated outcome of every hop
+        vSummary = {
+            "MediaType" : arg_MediaType,
+            "Total" : len(vGraph),
+            "Tasks" : {}
+        }
+        for vStatus in ("Successful", "Unchanged", "Failed", "Blocked"):
+            vSummary[vStatus] = list(vState.values()).count(vStatus)
+        for (vMediaClass, vSource), vStatus in vState.items():
+            vSummary["Tasks"][f"{vMediaClass}\\{vSource} ::> {arg_Lineage[vSource]}"] = vStatus
+            if vStatus in ("Failed", "Blocked"):
+                self.show_Info(vStatus, f"{arg_MediaType}\\{vMediaClass} ::> {vSource} ::> {arg_Lineage[vSource]}", "red")
+        self.App["Response"]["Summary"] = vSummary
+        if is_Success is True:
+            self.show_Info("Graph", "Successful", "green")
+        else:
+            self.show_Info("Graph", "Failed", "red")
+        vEndDT = datetime.now()
+        self.show_Info("Ended", f"{self.get_PHdatetime(vEndDT)}")
+        self.show_Info("Duration", f"{vEndDT - vStartDT}")
+        print('')
+        # ======== Check if this is a Testing Run
+        if self.AppConfig["Main"]["Switchboard"]["TestMode"] is True:
+            return is_Success
+        else:
+            return None
+
+    def Benchmark_Init (
+            self,
+            arg_Runs = 5
+        ):
+        """
+        ╔════════════════════════════════╗
+        ║ PROPER USAGE of INIT BENCHMARK ║
+        ╚════════════════════════════════╝
+        Times Data_Migration() with the session caches (Preflight, Imports, Secrets) cleared, e.g.,
+        DM.Benchmark_Init(10)
+        Modules already in sys.modules stay loaded, so the first import time of each module
+        in this session is reported separately from the init runs.
+        The pristine Response and the Switchboard of the session are kept.
+        """
+        import time
+        import statistics
+        # ======== Every Data_Migration() writes its defaults on the shared Switchboards
+        vAppSwitchboard = dict(self.AppConfig["Main"]["Switchboard"])
+        vLibSwitchboard = dict(self.LibConfig["Main"]["Switchboard"])
+        vSeconds = []
+        try:
+            # ======== A restart of the interpreter would end the benchmark
+            self.LibConfig["Main"]["Switchboard"]["SessionReuse"] = True
+            for vRun in range(arg_Runs):
+                Shared_MainLib._Preflight.clear()
+                Shared_MainLib._Imports.clear()
+                self.clear_Secrets()
+                self.AppConfig["Main"]["Switchboard"]["SilentMode"] = True
+                vStart = time.perf_counter()
+                Data_Migration()
+                vSeconds.append(time.perf_counter() - vStart)
+        finally:
+            self.AppConfig["Main"]["Switchboard"].update(vAppSwitchboard)
+            self.LibConfig["Main"]["Switchboard"].update(vLibSwitchboard)
+        vBenchmark = {
+            "Runs" : arg_Runs,
+            "Init" : {
+                "Minimum" : round(min(vSeconds), 4),
+                "Median" : round(statistics.median(vSeconds), 4),
+                "Maximum" : round(max(vSeconds), 4)
+            },
+            "Imports" : {vModule: round(vSecond, 4) for vModule, vSecond in Shared_MainLib._ImportTimes.items()}
+        }
+        self.show_Info("Init", f'Median {vBenchmark["Init"]["Median"]}s ({arg_Runs} runs)')
+        for vModule, vSecond in vBenchmark["Imports"].items():
+            self.show_Info("Import", f"{vModule} ::> {vSecond}s")
+        print('')
+        return vBenchmark
+
+    def Stream_Transfer (
+            self,
+            arg_MediaType,
+            arg_MediaClass,
+            arg_Source,
+            arg_Target = 'Auto'
+        ):
+        """
+        ╔═══════════════════════════╗
+        ║ PROPER USAGE of STREAMING ║
+        ╚═══════════════════════════╝
+        Incrementally moves the new files of a Blob layer with Auto Loader, e.g., LZ ::> RZ ::> BL
+        DM.Stream_Transfer("GA4", "Demo_GA4", "LZ")
+        DM.Stream_Transfer("GA4", "Demo_GA4", "RZ")
+        Each micro-batch goes through the same Quality Checks and Transformation of Start
+        and is appended on the target; the checkpoint keeps track of the processed files
+        A replayed micro-batch is written once: Delta targets skip it by its batch ID,
+        file targets (LZ/RZ) overwrite its own Batch-<ID> directory under the dated path.
+        A batch replayed after midnight lands in the new dated path and is duplicated
+        """
+        is_Success = False
+        from datetime import datetime
+        from pyspark import StorageLevel
+        vStartDT = datetime.now()
+        self.show_Info("Started", f"{self.get_PHdatetime(vStartDT)}")
+        try:
+            vStreaming = self.AppConfig["Main"]["Data"]["Streaming"]
+            if arg_Source not in vStreaming["Source"]:
+                raise MigrationError(
+                    self.show_ErrorMsg("SyntaxSource", arg_Source, ", ".join(vStreaming["Source"]))
+                )
+            if arg_Target == "Auto":
+                arg_Target = self.AppConfig["Main"]["Data"]["Lineage"][arg_Source]
+            self._MediaType = arg_MediaType
+            self._MediaClass = arg_MediaClass
+            self._Source = arg_Source
+            self._Target = arg_Target
+            vAppConfigMediaClass = self.AppConfig["Media"][arg_MediaType]["Class"][arg_MediaClass]
+            vAppConfigStageSource = self.AppConfig["Media"][arg_MediaType]["Stage"][arg_Source]
+            vAppConfigStageTarget = self.AppConfig["Media"][arg_MediaType]["Stage"][arg_Target]
+            if self.AppConfig["Main"]["Switchboard"]["DebugMode"] is True:
+                vPath_Mode = "Debug"
+            else:
+                vPath_Mode = "Live"
+            if "Directory" in self.AppConfig["Media"][arg_MediaType]["Common"]:
+                vPath_ParentDir = self.AppConfig["Media"][arg_MediaType]["Common"]["Directory"][vPath_Mode]
+            else:
+                vPath_ParentDir = vAppConfigMediaClass["Directory"][vPath_Mode]
+            # ======== Same layer names as Start, so batch and stream share their directories
+            vMediaClassSource = self.get_TableName(arg_MediaType, arg_MediaClass, arg_Source)
+            vMediaClassTarget = self.get_TableName(arg_MediaType, arg_MediaClass, arg_Target)
+            # ======== Source base directory, dated sub-directories are discovered by Auto Loader
+            self.get_AzureDFS(
+                vAppConfigStageSource["Secret"]["StorageAccount"]["Scope"],
+                vAppConfigStageSource["Secret"]["StorageAccount"]["Key"],
+                vAppConfigStageSource["Secret"]["StorageContainer"]["Scope"],
+                vAppConfigStageSource["Secret"]["StorageContainer"]["Key"],
+                self.get_MediaPath(vPath_ParentDir, arg_MediaType, vMediaClassSource, arg_Source)
+            )
+            if self._ReturnStatus is False:
+                raise MigrationError(
+                    self.show_ErrorMsg()
+                )
+            vSourcePath = self._ReturnValue
+            self.get_AzureDFS(
+                vAppConfigStageTarget["Secret"]["StorageAccount"]["Scope"],
+                vAppConfigStageTarget["Secret"]["StorageAccount"]["Key"],
+                vAppConfigStageTarget["Secret"]["StorageContainer"]["Scope"],
+                vAppConfigStageTarget["Secret"]["StorageContainer"]["Key"],
+                f'{vPath_ParentDir}/{arg_MediaType}/{vStreaming["Checkpoint"]}/{arg_MediaType}-{arg_MediaClass}-{arg_Source}-{arg_Target}'
+            )
+            if self._ReturnStatus is False:
+                raise MigrationError(
+                    self.show_ErrorMsg()
+                )
+            vCheckpointPath = self._ReturnValue
+            vPipelineCaller = f'{self.AppConfig["Main"]["Data"]["Label"][arg_Source]} - Stream'
+            # ======== Micro-batches are appended on the target
+            vTargetConfig = dict(vAppConfigStageTarget["Provider"])
+            vTargetConfig["Write"] = dict(vTargetConfig["Write"])
+            vTargetConfig["Write"]["Mode"] = "append"
+            vStreamID = f"{arg_MediaType}-{arg_MediaClass}-{arg_Source}-{arg_Target}"
+
+            def process_Batch (
+                    arg_Batch,
+                    arg_BatchID
+                ):
+                # ======== Same Quality Checks and Transformation as Start, per micro-batch
+                arg_Batch.persist(StorageLevel.MEMORY_AND_DISK)
+                self._TotalRows = arg_Batch.count()
+                if self._TotalRows != 0:
+                    vAssortedData, vDataLoad = self.process_Data(arg_Batch, vAppConfigMediaClass)
+                    vDataLoad = self.set_AuditColumns(vDataLoad, vPipelineCaller)
+                    vBatchPath = self.get_MediaPath(
+                        vPath_ParentDir,
+                        arg_MediaType,
+                        vMediaClassTarget,
+                        arg_Target,
+                        vTargetConfig["SubDir"]["Path"],
+                        vTargetConfig["SubDir"]["Extension"]
+                    )
+                    vBatchConfig = vTargetConfig
+                    if vTargetConfig["Format"] == "delta":
+                        # ======== Idempotent Delta write, a replayed batch is skipped
+                        vOptions = {"txnAppId" : vStreamID, "txnVersion" : arg_BatchID}
+                    else:
+                        # ======== Idempotent file write, a replayed batch overwrites its own directory
+                        vOptions = None
+                        vBatchPath = f"{vBatchPath}/Batch-{arg_BatchID:08d}"
+                        vBatchConfig = dict(vTargetConfig)
+                        vBatchConfig["Write"] = dict(vTargetConfig["Write"])
+                        vBatchConfig["Write"]["Mode"] = "overwrite"
+                    self.write_AzureBlob(
+                        vDataLoad,
+                        vAppConfigStageTarget["Secret"]["StorageAccount"]["Scope"],
+                        vAppConfigStageTarget["Secret"]["StorageAccount"]["Key"],
+                        vAppConfigStageTarget["Secret"]["StorageContainer"]["Scope"],
+                        vAppConfigStageTarget["Secret"]["StorageContainer"]["Key"],
+                        vBatchPath,
+                        vBatchConfig,
+                        None,
+                        vOptions
+                    )
+                    if self._ReturnStatus is False:
+                        arg_Batch.unpersist()
+                        # ======== Fail the query so the batch is replayed from the checkpoint
+                        raise MigrationError(
+                            self.show_ErrorMsg()
+                        )
+                    self.show_Info("Batch", f"{arg_BatchID} ::> {format(self._TotalRows, ',')} rows")
+                arg_Batch.unpersist()
+
+            vStream = spark.readStream.format("cloudFiles") \
+                .option("cloudFiles.format", vAppConfigStageSource["Provider"]["Format"]) \
+                .option("cloudFiles.schemaLocation", f"{vCheckpointPath}/_schema") \
+                .option("cloudFiles.maxFilesPerTrigger", vStreaming["MaxFilesPerTrigger"]) \
+                .load(vSourcePath)
+            vWriter = vStream.writeStream \
+                .foreachBatch(process_Batch) \
+                .option("checkpointLocation", vCheckpointPath) \
+                .queryName(vStreamID)
+            if vStreaming["Trigger"] == "AvailableNow":
+                # ======== Process all new files then stop
+                vQuery = vWriter.trigger(availableNow=True).start()
+                vQuery.awaitTermination()
+                self.show_Info("Stream", f"{vStreamID} ::> Caught Up")
+            else:
+                # ======== Keep running, e.g., "5 minutes"
+                vQuery = vWriter.trigger(processingTime=vStreaming["Trigger"]).start()
+                self.show_Info("Stream", f"{vStreamID} ::> Running every {vStreaming['Trigger']}")
+            is_Success = True
+        except Exception as ExceptionError:
+            self._Exception = ExceptionError
+            self.show_Info("Error", self.clean_Exception(), "red")
+        if is_Success is True:
+            self.show_Info("Stream", "Successful", "green")
+        else:
+            self.show_Info("Stream", "Failed", "red")
+        vEndDT = datetime.now()
+        self.show_Info("Ended", f"{self.get_PHdatetime(vEndDT)}")
+        self.show_Info("Duration", f"{vEndDT - vStartDT}")
+        print('')
+        # ======== Check if this is a Testing Run
+        if self.AppConfig["Main"]["Switchboard"]["TestMode"] is True:
+            return is_Success
+        else:
+            return None
+
 class Data_Specs:
     App = {
         "Metadata" : {
@@ -1526,7 +2553,11 @@ class Data_Specs:
                 "Integrity" : {
                     "Checksum" : None
                 }
-            }
+            },
+            "Target" : {
+                "Statistics" : {}
+            },
+            "DryRun" : {}
         }
     }
     AppConfig = {
@@ -1546,9 +2577,29 @@ class Data_Specs:
                 "IntegrityCheck" : False,
                 # ======== Suppress showing of display message
                 "SilentMode" : False,
+                # ======== Run_Transfer hands each written layer to the next hop in memory
+                # instead of reading it again from the Blob
+                "ChainLineage" : True,
+                # ======== Start only plans the transfer and estimates its cost, no Spark job is run
+                "DryRun" : False,
                 "TestMode" : False,
                 "DebugMode" : False
             },
+            # ======== Concurrent Media Classes in Run_Transfer, Read_TotalRows and Display_Layer
+            "Parallel" : {
+                "MaxWorkers" : 4,
+                # ======== FAIR scheduler pool prefix of each Media Class, None for the default pool
+                "Pool" : "Media",
+                # ======== Keep running the other Media Classes after a failure
+                "ContinueOnFailure" : True
+            },
+            # ======== Bounded display of Display_Layer and the DisplayTable switch
+            "Preview" : {
+                "Rows" : 1000,
+                # ======== Fraction of the source sampled before the limit, None takes the first rows
+                "Fraction" : None,
+                "Seed" : None
+            },
             "Data" : {
                 # ======== Source Layer            
                 "Source" : {"DS", "LZ", "RZ", "BL", "SL", "GL"},
@@ -1579,6 +2630,18 @@ class Data_Specs:
                     "Read" : "Read Only",
                     "Auto" : "Automatic"
                 },
+                # ======== Stream_Transfer settings
+                "Streaming" : {
+                    "Source" : {"LZ", "RZ"},
+                    # ======== Checkpoint directory under the Media Type
+                    "Checkpoint" : "_Checkpoint",
+                    # ======== "AvailableNow" to catch up then stop, or an interval, e.g., "5 minutes"
+                    "Trigger" : "AvailableNow",
+                    "MaxFilesPerTrigger" : 1000
+                },
+                # ======== Cache level of the source when several Spark actions scan it, None to disable
+                # e.g., "MEMORY_AND_DISK", "MEMORY_AND_DISK_DESER", "DISK_ONLY"
+                "StorageLevel" : "MEMORY_AND_DISK",
                 # ======== User-defined expressions used in Data Quality
                 "Expressions" :  {
                     "alphanumeric" : r'^[a-zA-Z0-9]+$'
@@ -1590,7 +2653,20 @@ class Data_Specs:
                     },
                     "Catalog" : {
                         "Enabled" : True,
-                        "Schema" : "Pipeline"
+                        "Schema" : "Pipeline",
+                        # ======== Last Delta version processed per Media Class and Target
+                        "Versions" : "Delta_Versions",
+                        # ======== Input fingerprint of the last successful hop of Run_Graph
+                        "Fingerprints" : "Graph_Fingerprints",
+                        # ======== Parallel hops commit to the same tables, conflicting commits are retried
+                        "Retry" : {
+                            "Maximum" : 5,
+                            "Delay" : 1,
+                            "Policy" : "Exponential",
+                            "Backoff" : 2,
+                            "MaxDelay" : 30,
+                            "Jitter" : True
+                        }
                     }
                 }
             }
@@ -1619,6 +2695,12 @@ class Data_Specs:
                             "Fetch_Offset" : 0,
                             "Fetch_Limit" : 100000
                         },
+                        # ======== Used by the "upsert" write mode of the Destination Zone
+                        "Upsert" : {
+                            "Keys" : {"Date", "RK-MediumCountry", "Source_Medium"},
+                            "Watermark" : "Date",
+                            "Lookback" : 3
+                        },
                         "Schema" : {
                             "Quality" : {
                                 "Duplicates" : {
@@ -1806,7 +2888,10 @@ class Data_Specs:
                         "Provider" : {
                             "Type" : "Azure/Blob",
                             "Format" : "delta",
+                            # ======== Write with Change Data Feed and read only the changes into the next layer
+                            "ChangeFeed" : False,
                             "Write" : {
+                                # ======== "overwrite", "append" or "merge" (on the Upsert Keys of the Media Class)
                                 "Mode" : "overwrite",
                                 "MaxRecordsPerFile" : 1000000,
                                 "OverwriteSchema" : "true"
@@ -1831,7 +2916,10 @@ class Data_Specs:
                         "Provider" : {
                             "Type" : "Azure/Blob",
                             "Format" : "delta",
+                            # ======== Write with Change Data Feed and read only the changes into the next layer
+                            "ChangeFeed" : False,
                             "Write" : {
+                                # ======== "overwrite", "append" or "merge" (on the Upsert Keys of the Media Class)
                                 "Mode" : "overwrite",
                                 "MaxRecordsPerFile" : 1000000,
                                 "OverwriteSchema" : "true"
@@ -1856,7 +2944,10 @@ class Data_Specs:
                         "Provider" : {
                             "Type" : "Azure/Blob",
                             "Format" : "delta",
+                            # ======== Write with Change Data Feed and read only the changes into the next layer
+                            "ChangeFeed" : False,
                             "Write" : {
+                                # ======== "overwrite", "append" or "merge" (on the Upsert Keys of the Media Class)
                                 "Mode" : "overwrite",
                                 "MaxRecordsPerFile" : 1000000,
                                 "OverwriteSchema" : "true"
@@ -1879,10 +2970,18 @@ class Data_Specs:
                     },
                     "DZ" : { # Datamart - Destination Zone
                         "Provider" : {
+                            # ======== "SQLServer" for generic JDBC or "SQLServer/Bulk" for the connector's bulk copy
                             "Type" : "SQLServer",
                             "Format" : "jdbc",
                             "Batch" : 10000,
+                            # ======== Used by "SQLServer/Bulk", requires the Apache Spark Connector for SQL Server
+                            "Bulk" : {
+                                "Format" : "com.microsoft.sqlserver.jdbc.spark",
+                                "TableLock" : "true",
+                                "ReliabilityLevel" : "BEST_EFFORT" # or "NO_DUPLICATES"
+                            },
                             "Write" : {
+                                # ======== "overwrite", "append" or "upsert" (needs the Upsert block of the Media Class)
                                 "Mode" : "overwrite"
                             },
                             "Port" : 1433,
@@ -1890,9 +2989,24 @@ class Data_Specs:
                             "Driver" : "com.microsoft.sqlserver.jdbc.SQLServerDriver",
                             "Retry" : {
                                 "Maximum" : 10, # Maximum number of retry attempts
-                                "Delay" : 5 # Delay between retries in seconds
+                                "Delay" : 5, # Delay of the first retry in seconds
+                                "Policy" : "Exponential", # "Fixed" or "Exponential"
+                                "Backoff" : 2,
+                                "MaxDelay" : 120,
+                                "Jitter" : True
                             },
-                            "Partition" : 40
+                            "Partition" : {
+                                "Minimum" : 1,
+                                "Maximum" : 40, # Budget of concurrent connections to SQL Server
+                                "RowsPerPartition" : 500000,
+                                "BytesPerPartition" : 134217728 # 128 MB
+                            },
+                            # ======== Load into a staging table, then move it into place in one transaction
+                            "Staging" : {
+                                "Enabled" : True,
+                                "Suffix" : "__Staging",
+                                "Slices" : 8 # Written and retried one at a time
+                            }
                         },
                         "Secret" : {
                             "DB_Server" : {
@@ -1957,6 +3071,13 @@ class Shared_MainLib:
                 "ExceptionAll" : False,
                 # ======== Suppress showing of display message
                 "SilentMode" : False,
+                # ======== Keep the Python session between inits and Start calls, no restartPython
+                "SessionReuse" : True,
+                # ======== Tag the Spark jobs of each stage and collect their shuffle & spill
+                # The Python listener receives every Spark event, including one per task
+                "SparkMetrics" : False,
+                # ======== Blob reads skip counting their rows
+                "DryRun" : False,
                 "TestMode" : False,
                 "DebugMode" : False
             },            
@@ -1974,6 +3095,74 @@ class Shared_MainLib:
                     "ServiceName" : {
                         "Scope" : "DemoVault",
                         "Key"   : "datadog-service-name"
+                    },
+                    # ======== Background log shipping, see start_Shipper
+                    "Shipper" : {
+                        "QueueSize" : 1000,
+                        "BatchSize" : 100,
+                        "Linger" : 1.0,
+                        "FlushTimeout" : 10,
+                        "Host" : None
+                    }
+                }
+            },
+            # ======== Modules checked in-process before use and their cluster library
+            # Install them on the cluster, they are never installed or upgraded at runtime
+            "Dependencies" : {
+                "CloudLog" : {
+                    "datadog_api_client" : "datadog-api-client"
+                },
+                "GA4" : {
+                    "google.analytics.data_v1beta" : "google-analytics-data",
+                    "google.oauth2" : "google-auth"
+                }
+            },
+            "Secrets" : {
+                # ======== Seconds a fetched secret is reused before asking the Secret Scope again
+                "TTL" : 900
+            },
+            "Retry" : {
+                # ======== SQL Server error numbers and messages that will never succeed on a retry
+                "Fatal" : {
+                    "Codes" : {
+                        102,    # Incorrect syntax
+                        207,    # Invalid column name
+                        208,    # Invalid object name
+                        229,    # Permission denied on object
+                        230,    # Permission denied on column
+                        245,    # Conversion failed
+                        262,    # Permission denied in database
+                        2601,   # Duplicate key row (unique index)
+                        2627,   # Duplicate key (constraint)
+                        8152,   # String or binary data would be truncated
+                        2628,   # String or binary data would be truncated
+                        18456   # Login failed
+                    },
+                    "Messages" : {
+                        "Incorrect syntax",
+                        "Invalid column name",
+                        "Invalid object name",
+                        "permission was denied",
+                        "Login failed",
+                        "would be truncated",
+                        "Conversion failed",
+                        "AnalysisException"
+                    }
+                },
+                # ======== Throttling, failover and deadlocks, always retried
+                "Transient" : {
+                    "Codes" : {
+                        -2,     # Timeout
+                        1205,   # Deadlock victim
+                        4060,   # Database unavailable
+                        10928,  # Resource limit reached
+                        10929,  # Resource limit reached
+                        40197,  # Service error processing the request
+                        40501,  # Service is busy
+                        40613,  # Database unavailable
+                        49918,  # Not enough resources
+                        49919,  # Too many operations
+                        49920   # Too many operations
                     }
                 }
             },
@@ -2028,6 +3217,9 @@ class Shared_MainLib:
                     "FailedDBWrite" : {
                         "Head" : "      Error ::> [App] Failed writing the Database"
                     },
+                    "FailedDBExec" : {
+                        "Head" : "      Error ::> [App] Failed executing the Database statements"
+                    },
                     "FailedCatalogWrite" : {
                         "Head" : "      Error ::> [App] Failed writing the Catalog"
                     },
@@ -2049,9 +3241,27 @@ class Shared_MainLib:
                     "InvalidTargetType" : {
                         "Head" : "      Error ::> [App] Invalid Target Type"
                     },
+                    "InvalidChangeFeed" : {
+                        "Head" : "      Error ::> [App] Change Feed reads need a 'merge' or 'append' Write Mode on the Target"
+                    },
+                    "InvalidDryRun" : {
+                        "Head" : "      Error ::> [App] A Dry Run cannot plan an API source without calling the API"
+                    },
+                    "MissingUpsertKeys" : {
+                        "Head" : "      Error ::> [App] A 'merge' or 'upsert' Write Mode needs the Upsert Keys of the Media Class"
+                    },
+                    "InvalidDateRange" : {
+                        "Head" : "      Error ::> [App] Invalid Date Range"
+                    },
+                    "InvalidTaskGraph" : {
+                        "Head" : "      Error ::> [App] The Lineage and Merge dependencies have a cycle"
+                    },
                     "InvalidTargetClass" : {
                         "Head" : "      Error ::> [App] Invalid Target Class"
                     },
+                    "MissingDependency" : {
+                        "Head" : "      Error ::> [App] Missing cluster library"
+                    },
                     "FailedDDLogger" : {
                         "Head" : "      Error ::> [Provider] Datadog failed logging error"
                     },
@@ -2062,13 +3272,27 @@ class Shared_MainLib:
             }
         }
     }
+    # ======== Importability of each Dependency, checked once per session
+    _Preflight = {}
+    # ======== Secret values and their expiry, shared by every instance of the session
+    _Secrets = {}
+    # ======== Datadog client, queue and sender thread of the session
+    _Shipper = {}
+    # ======== Spark_Listener registered on the SparkContext of the session
+    _Listener = None
+    # ======== Local properties written by setJobGroup
+    _JobGroupProperties = ("spark.jobGroup.id", "spark.job.description", "spark.job.interruptOnCancel")
+    # ======== Lazily-imported modules and names, resolved on first use and kept for the session
+    _Imports = {}
+    # ======== Seconds spent on the first import of each module
+    _ImportTimes = {}
 
     def __init__ (
             self
         ):
         import traceback
         self.InitSuccess = False
-        dbutils.library.restartPython()
+        self.restart_Python()
         try:
             # ======== Initialize Shared Library
             self._TotalRows = 0
@@ -2078,6 +3302,13 @@ class Shared_MainLib:
             self._PurgedColumns = 0
             self._UpdatedColumns = 0
             self._RenamedColumns = 0
+            self._TargetStats = {}
+            self._Spans = {}
+            # ======== Cache hits and misses of get_Secret on this instance
+            self._SecretStats = {
+                "Hits" : 0,
+                "Misses" : 0
+            }
             self._ErrorKey = False
             self._ErrorBody = False
             self._ErrorTail = False
@@ -2091,13 +3322,12 @@ class Shared_MainLib:
             # ======== Record the starting date & time
             self._Started = datetime.now()
             if self.LibConfig["Main"]["Switchboard"]["CloudLog"] is True:
-                try:
-                    %pip show datadog_api_client > /dev/null 2>&1
-                except Exception as ExceptionError:
-                    self._Exception = ExceptionError
-                    %pip install --upgrade datadog_api_client > /dev/null 2>&1
+                if self.check_Dependencies("CloudLog") is False:
+                    # ======== No Datadog client on the cluster, keep running without Cloud Log
+                    self.show_Info("Cloud Log", f"Disabled ::> Missing {self._ErrorTail}", "yellow")
+                    self.LibConfig["Main"]["Switchboard"]["CloudLog"] = False
             # ======== Get the current environment
-            self._Environment = dbutils.secrets.get(
+            self._Environment = self.get_Secret(
                     self.AppLib["Metadata"]["Environment"]["Scope"],
                     self.AppLib["Metadata"]["Environment"]["Key"]
                 )
@@ -2142,6 +3372,198 @@ class Shared_MainLib:
                 self.show_Info("Init", "Failed\r\n", "red")
         return
 
+    def check_Dependencies (
+            self,
+            arg_Group
+        ):
+        try:
+            # ======== Set error message that will be shown
+            self.reset_Status("MissingDependency")
+            import importlib.util
+            vMissing = []
+            for vModule, vPackage in self.LibConfig["Main"]["Dependencies"][arg_Group].items():
+                # ======== In-process lookup, no pip subprocess and no import of the module
+                if vModule not in Shared_MainLib._Preflight:
+                    try:
+                        Shared_MainLib._Preflight[vModule] = importlib.util.find_spec(vModule) is not None
+                    except ModuleNotFoundError:
+                        Shared_MainLib._Preflight[vModule] = False
+                if Shared_MainLib._Preflight[vModule] is False:
+                    vMissing.append(vPackage)
+            if vMissing:
+                self._ErrorTail = ", ".join(vMissing)
+            else:
+                self._ReturnStatus = True
+        except Exception as ExceptionError:
+            self._Exception = ExceptionError
+        return self._ReturnStatus
+
+    def start_Span (
+            self,
+            arg_Stage
+        ):
+        # ======== Start the wall-clock timer of a stage
+        import time
+        self._Spans[arg_Stage] = {"Started" : time.perf_counter()}
+        if self.LibConfig["Main"]["Switchboard"]["SparkMetrics"] is True:
+            # ======== Spark jobs of this thread are tagged with the job group of the stage
+            import uuid
+            vGroup = f"{arg_Stage}-{uuid.uuid4().hex[:12]}"
+            try:
+                self.start_SparkListener()
+                # ======== Job group of the notebook cell, restored by end_Span so the cell can still be cancelled
+                self._Spans[arg_Stage]["Previous"] = {
+                    vProperty: spark.sparkContext.getLocalProperty(vProperty) for vProperty in self._JobGroupProperties
+                }
+                spark.sparkContext.setJobGroup(vGroup, f'{self.AppLib["Metadata"]["Name"]} ::> {arg_Stage}')
+                self._Spans[arg_Stage]["Group"] = vGroup
+            except Exception as ExceptionError:
+                self._Exception = ExceptionError
+        return True
+
+    def end_Span (
+            self,
+            arg_Stage,
+            arg_Rows = None,
+            arg_DataFrame = None,
+            arg_Completed = True
+        ):
+        # ======== Stop the timer of a stage and record its rows and estimated bytes
+        import time
+        vSpan = self._Spans.get(arg_Stage)
+        if vSpan is None or "Started" not in vSpan:
+            return False
+        vSpan["Seconds"] = round(time.perf_counter() - vSpan.pop("Started"), 3)
+        if "Previous" in vSpan:
+            for vProperty, vValue in vSpan.pop("Previous").items():
+                spark.sparkContext.setLocalProperty(vProperty, vValue)
+        vSpan["Rows"] = arg_Rows
+        vSpan["Bytes"] = self.get_PlanBytes(arg_DataFrame) if arg_DataFrame is not None else None
+        vSpan["Completed"] = arg_Completed is True
+        return True
+
+    def start_SparkListener (
+            self
+        ):
+        # ======== Register the Spark_Listener once per session over the Py4J callback server
+        if Shared_MainLib._Listener is None:
+            ensure_callback_server_started = self.get_Import("pyspark.java_gateway", "ensure_callback_server_started")
+            ensure_callback_server_started(spark.sparkContext._gateway)
+            vListener = Spark_Listener()
+            spark.sparkContext._jsc.sc().addSparkListener(vListener)
+            Shared_MainLib._Listener = vListener
+        return Shared_MainLib._Listener
+
+    def get_SparkMetrics (
+            self
+        ):
+        # ======== Jobs, tasks, shuffle and spill of each stage, read from its job group
+        try:
+            vTracker = spark.sparkContext.statusTracker()
+            if Shared_MainLib._Listener is not None:
+                try:
+                    # ======== Stage completions are delivered asynchronously, let the listener catch up
+                    spark.sparkContext._jsc.sc().listenerBus().waitUntilEmpty(2000)
+                except Exception:
+                    pass
+            for vSpan in self._Spans.values():
+                if "Group" not in vSpan:
+                    continue
+                vJobIds = vTracker.getJobIdsForGroup(vSpan["Group"])
+                vStageIds = set()
+                for vJobId in vJobIds:
+                    vJobInfo = vTracker.getJobInfo(vJobId)
+                    if vJobInfo is not None:
+                        vStageIds.update(vJobInfo.stageIds)
+                vTasks = 0
+                for vStageId in vStageIds:
+                    vStageInfo = vTracker.getStageInfo(vStageId)
+                    if vStageInfo is not None:
+                        vTasks = vTasks + vStageInfo.numCompletedTasks
+                vSpan["Jobs"] = len(vJobIds)
+                vSpan["Stages"] = len(vStageIds)
+                vSpan["Tasks"] = vTasks
+                if Shared_MainLib._Listener is not None:
+                    vSpan.update(Shared_MainLib._Listener.pop_Metrics(vSpan.pop("Group")))
+                else:
+                    vSpan.pop("Group")
+            return True
+        except Exception as ExceptionError:
+            self._Exception = ExceptionError
+        return False
+
+    def get_PlanBytes (
+            self,
+            arg_DataFrame
+        ):
+        # ======== Estimated size from the optimized plan, no Spark job is triggered
+        try:
+            return int(str(arg_DataFrame._jdf.queryExecution().optimizedPlan().stats().sizeInBytes()))
+        except Exception:
+            return None
+
+    def get_Secret (
+            self,
+            arg_Scope,
+            arg_Key
+        ):
+        # ======== Secret from the session cache, fetched again from the Secret Scope once expired
+        import time
+        vKey = (arg_Scope, arg_Key)
+        vCached = Shared_MainLib._Secrets.get(vKey)
+        if vCached is not None and vCached[1] > time.monotonic():
+            self._SecretStats["Hits"] = self._SecretStats["Hits"] + 1
+            return vCached[0]
+        self._SecretStats["Misses"] = self._SecretStats["Misses"] + 1
+        vSecret = dbutils.secrets.get(scope=arg_Scope, key=arg_Key)
+        Shared_MainLib._Secrets[vKey] = (vSecret, time.monotonic() + self.LibConfig["Main"]["Secrets"]["TTL"])
+        return vSecret
+
+    def clear_Secrets (
+            self,
+            arg_Scope = None,
+            arg_Key = None
+        ):
+        # ======== Invalidate the cached secrets of a Scope, a single Key, or all of them, e.g., after a rotation
+        for vScope, vKey in list(Shared_MainLib._Secrets):
+            if (arg_Scope is None or vScope == arg_Scope) and (arg_Key is None or vKey == arg_Key):
+                Shared_MainLib._Secrets.pop((vScope, vKey), None)
+        return True
+
+    def get_Import (
+            self,
+            arg_Module,
+            arg_Name = None
+        ):
+        # ======== Module, or a name from it, loaded at most once per session
+        vKey = (arg_Module, arg_Name)
+        if vKey not in Shared_MainLib._Imports:
+            if arg_Module not in Shared_MainLib._Imports:
+                import sys
+                import time
+                import importlib
+                is_Loaded = arg_Module in sys.modules
+                vStart = time.perf_counter()
+                Shared_MainLib._Imports[arg_Module] = importlib.import_module(arg_Module)
+                # ======== Only a real first import is timed, a sys.modules lookup would overwrite it
+                if is_Loaded is False:
+                    Shared_MainLib._ImportTimes[arg_Module] = time.perf_counter() - vStart
+            if arg_Name is not None:
+                Shared_MainLib._Imports[vKey] = getattr(Shared_MainLib._Imports[arg_Module], arg_Name)
+            else:
+                Shared_MainLib._Imports[vKey] = Shared_MainLib._Imports[arg_Module]
+        return Shared_MainLib._Imports[vKey]
+
+    def restart_Python (
+            self
+        ):
+        # ======== Restart the interpreter only when the session is not reused
+        if self.LibConfig["Main"]["Switchboard"]["SessionReuse"] is True:
+            return False
+        self.flush_Shipper()
+        dbutils.library.restartPython()
+        return True
+
     def reset_Status (
             self,
             arg_ErrorKey = False,
@@ -2176,21 +3598,26 @@ class Shared_MainLib:
             # ======== Set error message that will be shown
             self.reset_Status("FailedDFS", arg_StoragePath)
             # ======== Get the Storage Account
-            vStorageAccount = dbutils.secrets.get(
-                scope=arg_AccountScope, 
-                key=arg_AccountKey
+            vStorageAccount = self.get_Secret(
+                arg_Scope=arg_AccountScope, 
+                arg_Key=arg_AccountKey
             )
             if vStorageAccount:
                 # ======== Get the Container Name
-                vStorageContainer = dbutils.secrets.get(
-                    scope=arg_ContainerScope, 
-                    key=arg_ContainerKey
+                vStorageContainer = self.get_Secret(
+                    arg_Scope=arg_ContainerScope, 
+                    arg_Key=arg_ContainerKey
                 )
                 if vStorageContainer:
                     # ======== Assemble the domain path, directory and file
                     vPath_Domain = f"abfss://{vStorageContainer}@{vStorageAccount}.dfs.core.windows.net"
                     # ======== Google/GA4/BL/GA4-Blog_Daily-BL
-                    self._ReturnValue = f"{vPath_Domain}/{arg_StoragePath}"
+                    if isinstance(arg_StoragePath, list):
+                        self._ReturnValue = [f"{vPath_Domain}/{vPath}" for vPath in arg_StoragePath]
+                    else:
+                        self._ReturnValue = f"{vPath_Domain}/{arg_StoragePath}"
+                    # ======== Keep the last resolved path, e.g., for the Catalog location
+                    self.DFS_Path = self._ReturnValue
                     self._ReturnStatus = True
         except Exception as ExceptionError:
             self._Exception = ExceptionError
@@ -2203,7 +3630,12 @@ class Shared_MainLib:
             arg_ContainerScope,
             arg_ContainerKey,
             arg_StoragePath,
-            arg_Config
+            arg_Config,
+            arg_PrunedColumns = None,
+            arg_ChangeFeed = False,
+            arg_LastVersion = None,
+            arg_Preview = None,
+            arg_Keys = None
         ):
         try:
             # ======== Get the Distributed File System Path
@@ -2218,15 +3650,82 @@ class Shared_MainLib:
                 retVal1 = self._ReturnValue
                 # ======== Set error message that will be shown
                 self.reset_Status("FailedBlobRead", self._ErrorTail) # get the Path from the previous call
-                retVal2 = spark.read.format(arg_Config["Format"]).load(retVal1)
+                if isinstance(retVal1, list):
+                    # ======== Skip the days without a directory
+                    vExistingPaths = []
+                    for vPath in retVal1:
+                        try:
+                            dbutils.fs.ls(vPath)
+                            vExistingPaths.append(vPath)
+                        except Exception:
+                            self.show_Info("Skipped", f"{vPath} ::> Not Existing", "yellow")
+                    if not retVal1:
+                        raise Exception("No directory in the date range")
+                    if not vExistingPaths:
+                        raise Exception(f"No existing directory from {retVal1[0]} to {retVal1[-1]}")
+                    # ======== Read all days in one scan
+                    retVal2 = spark.read.format(arg_Config["Format"]).load(vExistingPaths)
+                elif arg_ChangeFeed is True:
+                    # ======== Latest version of the source, recorded once the target is written
+                    self._SourceVersion = spark.sql(f"DESCRIBE HISTORY delta.`{retVal1}` LIMIT 1").first()["version"]
+                    if arg_LastVersion is None:
+                        # ======== First run, read the whole table
+                        retVal2 = spark.read.format("delta").load(retVal1)
+                    elif arg_LastVersion >= self._SourceVersion:
+                        # ======== No new version since the last run
+                        retVal2 = spark.read.format("delta").load(retVal1).limit(0)
+                    else:
+                        # ======== Only the inserted and updated rows after the last processed version,
+                        # up to the version that is recorded once the target is written
+                        from pyspark.sql import Window
+                        from pyspark.sql.functions import (
+                            col,
+                            row_number
+                        )
+                        retVal2 = spark.read.format("delta") \
+                            .option("readChangeFeed", "true") \
+                            .option("startingVersion", arg_LastVersion + 1) \
+                            .option("endingVersion", self._SourceVersion) \
+                            .load(retVal1) \
+                            .filter(col("_change_type").isin("insert", "update_postimage"))
+                        if arg_Keys:
+                            # ======== Latest change of each key, a merge fails on several source rows per key
+                            vLatest = Window.partitionBy(*[col(vKey) for vKey in arg_Keys]).orderBy(col("_commit_version").desc())
+                            retVal2 = retVal2.withColumn("_change_rank", row_number().over(vLatest)) \
+                                .filter(col("_change_rank") == 1) \
+                                .drop("_change_rank")
+                        retVal2 = retVal2.drop("_change_type", "_commit_version", "_commit_timestamp")
+                    self.show_Info("Change Feed", f"Versions {arg_LastVersion} ::> {self._SourceVersion}")
+                else:
+                    retVal2 = spark.read.format(arg_Config["Format"]).load(retVal1)
+                if arg_PrunedColumns:
+                    # ======== Projection at scan time, columnar formats only read the selected column chunks
+                    retVal2 = retVal2.select(*[vColumn for vColumn in retVal2.columns if vColumn not in arg_PrunedColumns])
+                if arg_Preview:
+                    # ======== Sample and limit at the scan, the rest of the plan only sees the previewed rows
+                    vPreviewRows = format(arg_Preview["Rows"], ",")
+                    if arg_Preview["Fraction"]:
+                        retVal2 = retVal2.sample(fraction=arg_Preview["Fraction"], seed=arg_Preview["Seed"])
+                        self.show_Info("Preview", f'{vPreviewRows} rows ::> Sampled {arg_Preview["Fraction"]:.2%}')
+                    else:
+                        self.show_Info("Preview", f"{vPreviewRows} rows ::> First Rows")
+                    retVal2 = retVal2.limit(arg_Preview["Rows"])
+                # ======== A single directory without a filter, window or limit in its plan
+                is_BareScan = not isinstance(retVal1, list) and not arg_Preview and \
+                    (arg_ChangeFeed is False or arg_LastVersion is None)
                 if retVal2:
-                    if self.LibConfig["Main"]["Switchboard"]["TestMode"] is False:
+                    if self.LibConfig["Main"]["Switchboard"]["TestMode"] is False and \
+                        self.LibConfig["Main"]["Switchboard"]["DryRun"] is False:
                         # Only fetch when there's no testing as Unit Testing is failing here
-                        from pyspark import StorageLevel
-                        retVal2.persist(StorageLevel.MEMORY_AND_DISK)
-                        self._TotalRows = retVal2.count()
-                        vTotalRows = format(self._TotalRows, ',')
-                        self.show_Info("Fetched", f"Blob Total Count ({vTotalRows} rows) ::> Successful")
+                        if is_BareScan is True:
+                            # ======== Counting the bare scan reads no column data,
+                            # it is answered from the Parquet footers and the Delta log statistics
+                            self._TotalRows = retVal2.count()
+                            vTotalRows = format(self._TotalRows, ',')
+                            self.show_Info("Fetched", f"Blob Total Count ({vTotalRows} rows) ::> Successful")
+                        else:
+                            # ======== Any other plan would be run in full, the count is left to the caller
+                            self.show_Info("Fetched", "Blob Total Count ::> Deferred")
                     # ======== Save Total Columns and Column Names
                     self._TotalColumns = len(retVal2.columns)
                     self._ColumnNames = [field.name for field in retVal2.schema.fields]
@@ -2244,7 +3743,9 @@ class Shared_MainLib:
             arg_ContainerScope,
             arg_ContainerKey,
             arg_StoragePath,
-            arg_Config
+            arg_Config,
+            arg_Keys = None,
+            arg_Options = None
         ):
         try:
             # ======== Get the Distributed File System Path
@@ -2259,11 +3760,39 @@ class Shared_MainLib:
                 retVal1 = self._ReturnValue
                 # ======== Set error message that will be shown
                 self.reset_Status("FailedBlobWrite", self._ErrorTail) # get the Path from the previous call
-                self._ReturnValue = arg_DataFrame.write.format(arg_Config["Format"]) \
-                    .mode(arg_Config["Write"]["Mode"]) \
+                vWriteMode = arg_Config["Write"]["Mode"]
+                if vWriteMode == "merge":
+                    from delta.tables import DeltaTable
+                    if DeltaTable.isDeltaTable(spark, retVal1):
+                        if not arg_Keys:
+                            # ======== Without keys the merge would replace the whole table
+                            raise Exception("The 'merge' Write Mode needs the Upsert Keys of the Media Class")
+                        # ======== Merge the rows on the keys instead of rewriting the table
+                        vCondition = " AND ".join([f"T.`{vKey}` = S.`{vKey}`" for vKey in arg_Keys])
+                        # ======== Updated rows keep the trail of their first insert
+                        vUpdateSet = {
+                            f"`{vColumn}`": f"S.`{vColumn}`" for vColumn in arg_DataFrame.columns if not vColumn.startswith("Row_Inserted")
+                        }
+                        DeltaTable.forPath(spark, retVal1).alias("T") \
+                            .merge(arg_DataFrame.alias("S"), vCondition) \
+                            .whenMatchedUpdate(set = vUpdateSet) \
+                            .whenNotMatchedInsertAll() \
+                            .execute()
+                        self._ReturnValue = None
+                        self._ReturnStatus = True
+                        return self._ReturnStatus
+                    # ======== First load of the target
+                    vWriteMode = "overwrite"
+                vWriter = arg_DataFrame.write.format(arg_Config["Format"]) \
+                    .mode(vWriteMode) \
                     .option("maxRecordsPerFile", arg_Config["Write"]["MaxRecordsPerFile"]) \
-                    .option("overwriteSchema", arg_Config["Write"]["OverwriteSchema"]) \
-                    .save(retVal1)
+                    .option("overwriteSchema", arg_Config["Write"]["OverwriteSchema"])
+                if arg_Config.get("ChangeFeed") is True:
+                    # ======== Let the next layer read this one as changes
+                    vWriter = vWriter.option("delta.enableChangeDataFeed", "true")
+                if arg_Options:
+                    vWriter = vWriter.options(**arg_Options)
+                self._ReturnValue = vWriter.save(retVal1)
                 self._ReturnStatus = True
         except Exception as ExceptionError:
             self._Exception = ExceptionError
@@ -2272,20 +3801,103 @@ class Shared_MainLib:
     def write_Catalog (
             self,
             arg_DataFrame,
-            arg_Table
+            arg_Table,
+            arg_Location = None,
+            arg_Format = "delta"
         ):
         try:
             # ======== Set error message that will be shown
             self.reset_Status("FailedCatalogWrite")
-            arg_DataFrame.write.format("delta") \
-            .mode("overwrite") \
-            .option("overwriteSchema", "true") \
-            .saveAsTable(arg_Table)
+            if arg_Location is None:
+                # ======== No physical copy of the layer, write a managed table
+                arg_DataFrame.write.format("delta") \
+                .mode("overwrite") \
+                .option("overwriteSchema", "true") \
+                .saveAsTable(arg_Table)
+            else:
+                # ======== Layer is already written, register an external table on top of it
+                is_Registered = False
+                if spark.catalog.tableExists(arg_Table):
+                    vLocation = None
+                    for vRow in spark.sql(f"DESCRIBE TABLE EXTENDED {arg_Table}").collect():
+                        if vRow["col_name"] == "Location":
+                            vLocation = vRow["data_type"]
+                            break
+                    # ======== Delta reads the latest version from its log, other formats need a fresh schema
+                    if arg_Format == "delta" and vLocation is not None and vLocation.rstrip('/') == arg_Location.rstrip('/'):
+                        is_Registered = True
+                    else:
+                        # ======== Drops the old managed copy or the external metadata only
+                        spark.sql(f"DROP TABLE IF EXISTS {arg_Table}")
+                if is_Registered is False:
+                    spark.sql(f"CREATE TABLE {arg_Table} USING {arg_Format} LOCATION '{arg_Location}'")
             self._ReturnStatus = True
         except Exception as ExceptionError:
             self._Exception = ExceptionError
         return self._ReturnStatus
     
+    def get_DeltaVersion (
+            self,
+            arg_MediaType,
+            arg_MediaClass,
+            arg_Source,
+            arg_Target,
+            arg_Table = "Versions"
+        ):
+        # ======== Last Delta version of the Source processed into the Target, None if never processed
+        try:
+            vVersionTable = f'{self.AppConfig["Main"]["Data"]["Audit"]["Catalog"]["Schema"]}.{self.AppConfig["Main"]["Data"]["Audit"]["Catalog"][arg_Table]}'
+            if spark.catalog.tableExists(vVersionTable):
+                vRow = spark.table(vVersionTable) \
+                    .filter(
+                        f"MediaType = '{arg_MediaType}' AND MediaClass = '{arg_MediaClass}' AND Source = '{arg_Source}' AND Target = '{arg_Target}'"
+                    ) \
+                    .select("Version") \
+                    .first()
+                if vRow is not None:
+                    return vRow["Version"]
+        except Exception as ExceptionError:
+            self._Exception = ExceptionError
+        return None
+
+    def set_DeltaVersion (
+            self,
+            arg_MediaType,
+            arg_MediaClass,
+            arg_Source,
+            arg_Target,
+            arg_Version,
+            arg_Table = "Versions"
+        ):
+        # ======== Record the Delta version of the Source processed into the Target
+        import time
+        vCatalog = self.AppConfig["Main"]["Data"]["Audit"]["Catalog"]
+        try:
+            vVersionTable = f'{vCatalog["Schema"]}.{vCatalog[arg_Table]}'
+            spark.sql(
+                f"CREATE TABLE IF NOT EXISTS {vVersionTable} "
+                f"(MediaType STRING, MediaClass STRING, Source STRING, Target STRING, Version BIGINT, Updated TIMESTAMP) USING DELTA"
+            )
+            for vAttempt in range(vCatalog["Retry"]["Maximum"]):
+                try:
+                    spark.sql(
+                        f"MERGE INTO {vVersionTable} AS T "
+                        f"USING (SELECT '{arg_MediaType}' AS MediaType, '{arg_MediaClass}' AS MediaClass, '{arg_Source}' AS Source, '{arg_Target}' AS Target) AS S "
+                        f"ON T.MediaType = S.MediaType AND T.MediaClass = S.MediaClass AND T.Source = S.Source AND T.Target = S.Target "
+                        f"WHEN MATCHED THEN UPDATE SET Version = {arg_Version}, Updated = current_timestamp() "
+                        f"WHEN NOT MATCHED THEN INSERT (MediaType, MediaClass, Source, Target, Version, Updated) "
+                        f"VALUES (S.MediaType, S.MediaClass, S.Source, S.Target, {arg_Version}, current_timestamp())"
+                    )
+                    return True
+                except Exception as ExceptionError:
+                    # ======== Only a commit conflict with another hop is worth a retry
+                    if "concurrent" not in str(ExceptionError).lower() or vAttempt == vCatalog["Retry"]["Maximum"] - 1:
+                        raise
+                    time.sleep(self.get_RetryDelay(vCatalog["Retry"], vAttempt))
+        except Exception as ExceptionError:
+            self._Exception = ExceptionError
+        return False
+
     def write_Database (
             self,
             arg_Source,
@@ -2294,37 +3906,390 @@ class Shared_MainLib:
             arg_DBUser,
             arg_DBPass,
             arg_DBTable,
-            arg_Config
+            arg_Config,
+            arg_TotalRows = None,
+            arg_Upsert = None
         ):
         # ======== Set error message that will be shown
         self.reset_Status("FailedDBWrite")
         import time
-        arg_Source = arg_Source.repartition(arg_Config["Partition"])
-        vRetryMaximum = arg_Config["Retry"]["Maximum"]
-        vRetryDelay = arg_Config["Retry"]["Delay"]
-        # ======== Retry until it reached the maximum
-        for vAttempt in range(vRetryMaximum):
+        import math
+        from pyspark import StorageLevel
+        """
+        ╔════════════════════════════════════╗
+        ║ PROPER USAGE of ADAPTIVE PARTITION ║
+        ╚════════════════════════════════════╝
+        "DZ" : {
+            "Provider" : {
+                "Partition" : 40 # Fixed number of partitions
+
+                <OR>
+
+                "Partition" : {
+                    "Minimum" : 1,
+                    "Maximum" : 40, # Budget of concurrent connections to the Database
+                    "RowsPerPartition" : 500000,
+                    "BytesPerPartition" : 134217728
+                }
+        """
+        # ======== Bulk copy uses the SQL Server connector instead of the generic JDBC writer
+        is_BulkCopy = arg_Config["Type"] == "SQLServer/Bulk"
+        if is_BulkCopy is True:
+            vFormat = arg_Config["Bulk"]["Format"]
+        else:
+            vFormat = arg_Config["Format"]
+        vProtocol = arg_Config["Type"].split('/')[0].lower()
+        vURL = f'{arg_Config["Format"]}:{vProtocol}://{arg_DBServer}:{arg_Config["Port"]};database={arg_DBName};user={arg_DBUser};password={arg_DBPass}'
+        vDBSchema, vDBName = arg_DBTable.split('.', 1)
+        vDBName = vDBName.strip('[]')
+        """
+        ╔═════════════════════════════════════╗
+        ║ PROPER USAGE of INCREMENTAL UPSERTS ║
+        ╚═════════════════════════════════════╝
+        "DZ" : {
+            "Provider" : {
+                "Write" : {
+                    "Mode" : "upsert"
+                }
+        "Media" : {
+            "<MediaType>" : {
+                "Class" : {
+                    "<MediaClass>" : {
+                        "Upsert" : {
+                            "Keys" : {"Date", "Source_Medium"}, # Column names on the Database
+                            "Watermark" : "Date", # Only rows on or after MAX(Watermark) - Lookback are loaded
+                            "Lookback" : 3 # Days to reload for late-arriving data
+                        }
+        """
+        is_Upsert = arg_Config["Write"]["Mode"] == "upsert"
+        if is_Upsert is True and (arg_Upsert is None or not arg_Upsert.get("Keys")):
+            # ======== Without keys the staged rows would be appended as duplicates
+            raise MigrationError(
+                self.show_ErrorMsg("MissingUpsertKeys", arg_DBTable)
+            )
+        is_TargetExists = True
+        if is_Upsert is True:
+            from pyspark.sql.functions import col, lit, date_sub
+            vWatermark, is_TargetExists = self.read_Watermark(
+                vURL,
+                arg_DBUser,
+                arg_DBPass,
+                arg_Config["Driver"],
+                arg_DBTable,
+                arg_Upsert["Watermark"]
+            )
+            if vWatermark is not None:
+                arg_Source = arg_Source.filter(
+                    col(arg_Upsert["Watermark"]) >= date_sub(lit(vWatermark), arg_Upsert["Lookback"])
+                )
+                # ======== Only the delta is loaded, the gross total no longer applies
+                arg_TotalRows = None
+                self._TargetStats["Watermark"] = str(vWatermark)
+                self.show_Info("Watermark", f"{arg_Upsert['Watermark']} >= {vWatermark} - {arg_Upsert['Lookback']} days")
+        vCurrentPartitions = arg_Source.rdd.getNumPartitions()
+        if isinstance(arg_Config["Partition"], dict):
+            vPartitionConfig = arg_Config["Partition"]
+            vPartitions = vPartitionConfig["Minimum"]
+            if arg_TotalRows:
+                vPartitions = max(vPartitions, math.ceil(arg_TotalRows / vPartitionConfig["RowsPerPartition"]))
             try:
-                self._ReturnValue = arg_Source.write.format(arg_Config["Format"]) \
-                    .mode(arg_Config["Write"]["Mode"]) \
-                    .option("batchsize", arg_Config["Batch"]) \
-                    .option("driver", arg_Config["Driver"]) \
-                    .option("url", f'{arg_Config["Format"]}:{arg_Config["Type"].lower()}://{arg_DBServer}:{arg_Config["Port"]};database={arg_DBName};user={arg_DBUser};password={arg_DBPass}') \
-                    .option("dbtable", arg_DBTable) \
-                    .option("user", arg_DBUser) \
-                    .option("password", arg_DBPass) \
-                    .save()
-                self._ReturnStatus = True
-                break  # Exit the loop if successful
+                # ======== Estimated size from the optimized plan, no Spark job is triggered
+                vEstimatedBytes = self.get_PlanBytes(arg_Source)
+                vPartitions = max(vPartitions, math.ceil(vEstimatedBytes / vPartitionConfig["BytesPerPartition"]))
+            except Exception:
+                pass
+            vPartitions = min(vPartitions, vPartitionConfig["Maximum"])
+        else:
+            vPartitions = arg_Config["Partition"]
+        if vPartitions < vCurrentPartitions:
+            # ======== Shrinking does not need a shuffle
+            arg_Source = arg_Source.coalesce(vPartitions)
+        elif vPartitions > vCurrentPartitions:
+            arg_Source = arg_Source.repartition(vPartitions)
+        self._TargetStats["Partitions"] = vPartitions
+        vRetryMaximum = arg_Config["Retry"]["Maximum"]
+        """
+        ╔════════════════════════════════╗
+        ║ PROPER USAGE of STAGING TABLES ║
+        ╚════════════════════════════════╝
+        "DZ" : {
+            "Provider" : {
+                "Staging" : {
+                    "Enabled" : True,
+                    "Suffix" : "__Staging",
+                    "Slices" : 8 # Written and retried one at a time
+                }
+        The data is loaded into <Schema>.[<Table><Suffix>] and moved into place in one transaction,
+        so a failed attempt never leaves the production table truncated or partial.
+        The rows are split into Slices by a hash of their values, a failed Slice is deleted
+        from the staging table and written again while the finished Slices are kept.
+        Upserts are always staged
+        """
+        vColumns = arg_Source.columns
+        is_Staged = is_Upsert is True or ("Staging" in arg_Config and arg_Config["Staging"]["Enabled"] is True)
+        if is_Staged is True:
+            from pyspark.sql.functions import col, lit, pmod, xxhash64
+            vStaging = arg_Config.get("Staging", {})
+            vSuffix = vStaging.get("Suffix", "__Staging")
+            vSlices = max(vStaging.get("Slices", 1), 1)
+            vWriteTable = f'{vDBSchema}.[{vDBName}{vSuffix}]'
+            # ======== The audit trail is left out of the hash, its timestamps change if a partition is recomputed
+            vHashColumns = [vColumn for vColumn in vColumns if not vColumn.startswith("Row_")] or vColumns
+            arg_Source = arg_Source.withColumn("_Slice", pmod(xxhash64(*[col(f"`{vColumn}`") for vColumn in vHashColumns]), lit(vSlices)))
+            # ======== Keep the partitions so a retry does not re-run the whole Spark lineage
+            arg_Source.persist(StorageLevel.MEMORY_AND_DISK)
+            # ======== The empty staging table is created first, then each Slice is appended
+            vWrites = [(None, arg_Source.limit(0), "overwrite")] + \
+                [(vSlice, arg_Source.filter(col("_Slice") == vSlice), "append") for vSlice in range(vSlices)]
+        else:
+            vWriteTable = arg_DBTable
+            vWrites = [(None, arg_Source, arg_Config["Write"]["Mode"])]
+        vWriteStarted = time.time()
+        self._TargetStats["Attempts"] = []
+        for vSlice, vWriteData, vWriteMode in vWrites:
+            # ======== Retry until it reached the maximum
+            for vAttempt in range(vRetryMaximum):
+                vAttemptStarted = time.time()
+                try:
+                    if vSlice is not None and vAttempt > 0:
+                        # ======== Rows committed by the failed attempt of this Slice are written again
+                        self.exec_Database(
+                            vURL,
+                            arg_DBUser,
+                            arg_DBPass,
+                            arg_Config["Driver"],
+                            [f"DELETE FROM {vWriteTable} WHERE [_Slice] = {vSlice}"]
+                        )
+                        if self._ReturnStatus is False:
+                            raise self._Exception
+                        self.reset_Status("FailedDBWrite")
+                    vWriter = vWriteData.write.format(vFormat) \
+                        .mode(vWriteMode) \
+                        .option("batchsize", arg_Config["Batch"]) \
+                        .option("driver", arg_Config["Driver"]) \
+                        .option("url", vURL) \
+                        .option("dbtable", vWriteTable) \
+                        .option("user", arg_DBUser) \
+                        .option("password", arg_DBPass)
+                    if is_BulkCopy is True:
+                        vWriter = vWriter \
+                            .option("tableLock", arg_Config["Bulk"]["TableLock"]) \
+                            .option("reliabilityLevel", arg_Config["Bulk"]["ReliabilityLevel"])
+                    self._ReturnValue = vWriter.save()
+                    self._ReturnStatus = True
+                    vAttemptStat = {
+                        "Attempt" : vAttempt + 1,
+                        "Seconds" : round(time.time() - vAttemptStarted, 3)
+                    }
+                    if vSlice is not None:
+                        vAttemptStat["Slice"] = vSlice
+                    self._TargetStats["Attempts"].append(vAttemptStat)
+                    break  # Exit the loop if successful
 
-            except Exception as ExceptionError:
-                self._Exception = ExceptionError
-                # ======== Show the error for each retry
-                self.show_Info("DB Error", self.clean_Exception(), "red")
-                self.show_Info("Target", f"{arg_DBTable} ::> Retrying in {vRetryDelay} seconds ({vAttempt+1} of {vRetryMaximum})")
-                if vAttempt < vRetryMaximum - 1:  # Check if more retries are left
-                    time.sleep(vRetryDelay)
+                except Exception as ExceptionError:
+                    self._Exception = ExceptionError
                     self._ReturnStatus = False
+                    vErrorClass = self.get_ErrorClass(ExceptionError)
+                    vRetryDelay = self.get_RetryDelay(arg_Config["Retry"], vAttempt)
+                    vAttemptStat = {
+                        "Attempt" : vAttempt + 1,
+                        "Seconds" : round(time.time() - vAttemptStarted, 3),
+                        "Error" : self.clean_Exception(ExceptionError),
+                        "Class" : vErrorClass
+                    }
+                    if vSlice is not None:
+                        vAttemptStat["Slice"] = vSlice
+                    self._TargetStats["Attempts"].append(vAttemptStat)
+                    vTarget = arg_DBTable if vSlice is None else f"{arg_DBTable} Slice {vSlice + 1} of {vSlices}"
+                    # ======== Show the error for each retry
+                    self.show_Info("DB Error", self.clean_Exception(), "red")
+                    if vErrorClass == "Fatal":
+                        # ======== Deterministic failure, retrying will not succeed
+                        self.show_Info("Target", f"{vTarget} ::> Not Retried ({vAttempt+1} of {vRetryMaximum})", "red")
+                        break
+                    if vAttempt < vRetryMaximum - 1:  # Check if more retries are left
+                        self.show_Info("Target", f"{vTarget} ::> Retrying in {vRetryDelay:.2f} seconds ({vAttempt+1} of {vRetryMaximum})")
+                        time.sleep(vRetryDelay)
+            if self._ReturnStatus is False:
+                # ======== The remaining Slices are not written
+                break
+        if self._ReturnStatus is True:
+            vWriteSeconds = time.time() - vWriteStarted
+            self._TargetStats["Seconds"] = round(vWriteSeconds, 3)
+            if arg_TotalRows and vWriteSeconds > 0:
+                self._TargetStats["RowsPerSecond"] = round(arg_TotalRows / vWriteSeconds, 2)
+        if is_Staged is True:
+            arg_Source.unpersist()
+            if self._ReturnStatus is True:
+                # ======== Explicit column lists, the _Slice column and the column order of the target do not matter
+                vInsert = ", ".join([f"[{vColumn}]" for vColumn in vColumns])
+                vCreate = f"SELECT {vInsert} INTO {arg_DBTable} FROM {vWriteTable}"
+                vAppend = f"INSERT INTO {arg_DBTable} ({vInsert}) SELECT {vInsert} FROM {vWriteTable}"
+                if is_Upsert is True and is_TargetExists is True:
+                    # ======== Set-based MERGE of the staged rows, the Inserted audit trail is kept on update
+                    vKeys = list(arg_Upsert["Keys"])
+                    vMatch = " AND ".join([f"T.[{vKey}] = S.[{vKey}]" for vKey in vKeys])
+                    vUpdate = ", ".join([f"T.[{vColumn}] = S.[{vColumn}]" for vColumn in vColumns if vColumn not in vKeys and not vColumn.startswith("Row_Inserted")])
+                    vValues = ", ".join([f"S.[{vColumn}]" for vColumn in vColumns])
+                    vMerge = f"MERGE INTO {arg_DBTable} WITH (HOLDLOCK) AS T USING {vWriteTable} AS S ON {vMatch}"
+                    if vUpdate:
+                        vMerge += f" WHEN MATCHED THEN UPDATE SET {vUpdate}"
+                    vMerge += f" WHEN NOT MATCHED BY TARGET THEN INSERT ({vInsert}) VALUES ({vValues});"
+                    vStatements = [vMerge]
+                elif is_Upsert is False and arg_Config["Write"]["Mode"] == "overwrite":
+                    # ======== Replaced in one transaction, the indexes, constraints and grants of the target are kept
+                    # Readers are blocked by the TRUNCATE lock until the commit and never see an empty table
+                    vStatements = [
+                        f"IF OBJECT_ID(N'{arg_DBTable}', N'U') IS NULL {vCreate} "
+                        f"ELSE BEGIN TRUNCATE TABLE {arg_DBTable}; {vAppend}; END"
+                    ]
+                else:
+                    # ======== Append, or the first load of an upsert, the target is created from staging when missing
+                    vStatements = [
+                        f"IF OBJECT_ID(N'{arg_DBTable}', N'U') IS NULL {vCreate} "
+                        f"ELSE {vAppend}"
+                    ]
+                vStatements.append(f"DROP TABLE {vWriteTable}")
+                self.exec_Database(
+                    vURL,
+                    arg_DBUser,
+                    arg_DBPass,
+                    arg_Config["Driver"],
+                    vStatements
+                )
+                if self._ReturnStatus is False:
+                    # ======== FailedDBExec is kept as the error of the write
+                    self.show_Info("DB Error", self.clean_Exception(), "red")
+        return self._ReturnStatus
+
+    def read_Watermark (
+            self,
+            arg_URL,
+            arg_DBUser,
+            arg_DBPass,
+            arg_Driver,
+            arg_DBTable,
+            arg_Column
+        ):
+        # ======== MAX(Watermark) of the target and whether the target exists
+        try:
+            vWatermark = spark.read.format("jdbc") \
+                .option("driver", arg_Driver) \
+                .option("url", arg_URL) \
+                .option("query", f'SELECT MAX([{arg_Column}]) AS Watermark FROM {arg_DBTable}') \
+                .option("user", arg_DBUser) \
+                .option("password", arg_DBPass) \
+                .load() \
+                .first()["Watermark"]
+        except Exception as ExceptionError:
+            # ======== Invalid object name (208), first load as the table is not existing yet
+            if 208 not in self.get_ErrorCodes(ExceptionError) and \
+                "Invalid object name" not in str(ExceptionError):
+                raise
+            return None, False
+        return vWatermark, True
+
+    def get_RetryDelay (
+            self,
+            arg_Retry,
+            arg_Attempt
+        ):
+        """
+        ╔══════════════════════════════╗
+        ║ PROPER USAGE of RETRY POLICY ║
+        ╚══════════════════════════════╝
+        "Retry" : {
+            "Maximum" : 10,
+            "Delay" : 5, # Delay of the first retry in seconds
+            "Policy" : "Exponential", # "Fixed" or "Exponential"
+            "Backoff" : 2, # Multiplier for each attempt
+            "MaxDelay" : 120,
+            "Jitter" : True # Randomize between zero and the computed delay
+        }
+        """
+        import random
+        vDelay = arg_Retry["Delay"]
+        match arg_Retry.get("Policy", "Fixed"):
+            case "Exponential":
+                vDelay = min(
+                    vDelay * (arg_Retry.get("Backoff", 2) ** arg_Attempt),
+                    arg_Retry.get("MaxDelay", vDelay)
+                )
+
+            case _:
+                pass
+        if arg_Retry.get("Jitter", False) is True:
+            # ======== Full jitter keeps parallel writers from retrying at the same time
+            vDelay = random.uniform(0, vDelay)
+        return vDelay
+
+    def get_ErrorCodes (
+            self,
+            arg_Exception
+        ):
+        # ======== SQL Server error numbers found in the Java cause chain of an error
+        vErrorCodes = set()
+        try:
+            vJavaError = getattr(arg_Exception, "java_exception", None)
+            while vJavaError is not None:
+                if "getErrorCode" in dir(vJavaError):
+                    vErrorCodes.add(vJavaError.getErrorCode())
+                vJavaError = vJavaError.getCause()
+        except Exception:
+            pass
+        return vErrorCodes
+
+    def get_ErrorClass (
+            self,
+            arg_Exception
+        ):
+        # ======== Classify an error as "Fatal" or "Transient" for the retry loop
+        vRetryConfig = self.LibConfig["Main"]["Retry"]
+        vErrorCodes = self.get_ErrorCodes(arg_Exception)
+        if vErrorCodes & vRetryConfig["Transient"]["Codes"]:
+            return "Transient"
+        if vErrorCodes & vRetryConfig["Fatal"]["Codes"]:
+            return "Fatal"
+        vMessage = str(arg_Exception).lower()
+        for vPattern in vRetryConfig["Fatal"]["Messages"]:
+            if vPattern.lower() in vMessage:
+                return "Fatal"
+        # ======== Unknown errors are retried
+        return "Transient"
+
+    def exec_Database (
+            self,
+            arg_URL,
+            arg_DBUser,
+            arg_DBPass,
+            arg_Driver,
+            arg_Statements
+        ):
+        vConnection = None
+        try:
+            # ======== Set error message that will be shown
+            self.reset_Status("FailedDBExec")
+            # ======== Run the statements through the JDBC driver of the cluster
+            spark.sparkContext._jvm.java.lang.Class.forName(arg_Driver)
+            vConnection = spark.sparkContext._jvm.java.sql.DriverManager.getConnection(arg_URL, arg_DBUser, arg_DBPass)
+            vConnection.setAutoCommit(False)
+            vStatement = vConnection.createStatement()
+            for vSQL in arg_Statements:
+                vStatement.execute(vSQL)
+            vConnection.commit()
+            vStatement.close()
+            self._ReturnStatus = True
+        except Exception as ExceptionError:
+            self._Exception = ExceptionError
+            if vConnection is not None:
+                try:
+                    # ======== Leave the tables as they were before the call
+                    vConnection.rollback()
+                except Exception:
+                    pass
+        finally:
+            if vConnection is not None:
+                vConnection.close()
         return self._ReturnStatus
         
     def call_GA4runReport (
@@ -2341,14 +4306,13 @@ class Shared_MainLib:
         ):
         try:
             self.reset_Status("FailedGA4Report")
-            from google.analytics.data_v1beta.types import (
-                Filter,
-                Metric,
-                Dimension, 
-                DateRange, 
-                RunReportRequest,
-                FilterExpression
-            )
+            # ======== Called for every page of the report, the types are resolved once
+            Filter = self.get_Import("google.analytics.data_v1beta.types", "Filter")
+            Metric = self.get_Import("google.analytics.data_v1beta.types", "Metric")
+            Dimension = self.get_Import("google.analytics.data_v1beta.types", "Dimension")
+            DateRange = self.get_Import("google.analytics.data_v1beta.types", "DateRange")
+            RunReportRequest = self.get_Import("google.analytics.data_v1beta.types", "RunReportRequest")
+            FilterExpression = self.get_Import("google.analytics.data_v1beta.types", "FilterExpression")
             # ======== Create the request credential
             vRequestParam = {
                 "property": f"properties/{arg_PropertyID}",
@@ -2415,12 +4379,8 @@ class Shared_MainLib:
         try:
             # ======== Set error message that will be shown
             self.reset_Status("FailedGA4RowCount")
-            from google.oauth2 import (
-                service_account
-            )
-            from google.analytics.data_v1beta import (
-                BetaAnalyticsDataClient
-            )
+            service_account = self.get_Import("google.oauth2.service_account")
+            BetaAnalyticsDataClient = self.get_Import("google.analytics.data_v1beta", "BetaAnalyticsDataClient")
             vCredentials = service_account.Credentials.from_service_account_info(
                 arg_Credentials
             )
@@ -2513,80 +4473,27 @@ class Shared_MainLib:
         try:
             # ======== Set error message that will be shown
             self.reset_Status("FailedTypeSet")
-            from pyspark.sql.types import (
-                StringType, 
-                IntegerType, # 32-bit signed integer; e.g., 42
-                LongType, # 64-bit signed integer; e.g., 1234567890123
-                FloatType, # 32-bit single-precision floating point number; e.g., 3.14
-                DoubleType, # 64-bit double-precision floating point number; e.g., 2.718281828459045
-                BooleanType, # boolean value; e.g., True or False
-                ByteType, # 8-bit signed integer; e.g., 127
-                ShortType, # 16-bit signed integer; e.g., 32767
-                BinaryType, # byte array; e.g., b'\x00\x01'
-                DateType, #  date without a time zone; e.g., date(2023, 10, 5)
-                TimestampType, # timestamp without a time zone; e.g., timestamp('2023-10-05 12:34:56')
-                TimestampNTZType, # timestamp without a time zone; e.g., timestamp('2023-10-05 12:34:56')
-                ArrayType, # array of elements of a specified data type; e.g., [1, 2, 3]
-                MapType, # map of key-value pairs, with specified data types for keys and values; e.g., {"key1": 1, "key2": 2}
-                StructType, # complex data type with multiple fields (like a row in a table)
-                StructField, # single field in a StructType
-                NullType # null value. Typically used internally and not explicitly
-            )
-            # ======== Set the correct data type
-            match arg_Type:
-                case "integer":
-                    self._ReturnValue = IntegerType()
-
-                case "long":
-                    self._ReturnValue = LongType()
-                
-                case "float":
-                    self._ReturnValue = FloatType()
-
-                case "double":
-                    self._ReturnValue = DoubleType()
-                
-                case "boolean":
-                    self._ReturnValue = BooleanType()
-                
-                case "byte":
-                    self._ReturnValue = ByteType()
-                
-                case "short":
-                    self._ReturnValue = ShortType()
-                
-                case "binary":
-                    self._ReturnValue = BinaryType()
-                
-                case "date":
-                    self._ReturnValue = DateType()
-                
-                case "timestamp":
-                    self._ReturnValue = TimestampType()
-                
-                case "timestamp_ntz":
-                    self._ReturnValue = TimestampNTZType()
-                
-                case "array":
-                    self._ReturnValue = ArrayType()
-                
-                case "map":
-                    self._ReturnValue = MapType()
-                
-                case "struct":
-                    self._ReturnValue = StructType()
-                
-                case "struct_field":
-                    self._ReturnValue = StructField()
-                
-                case "null":
-                    self._ReturnValue = NullType()
-
-                case "string":
-                    self._ReturnValue = StringType()
-
-                case _:
-                    self._ReturnValue = StringType()
+            vSparkTypes = {
+                "string" : "StringType",
+                "integer" : "IntegerType", # 32-bit signed integer; e.g., 42
+                "long" : "LongType", # 64-bit signed integer; e.g., 1234567890123
+                "float" : "FloatType", # 32-bit single-precision floating point number; e.g., 3.14
+                "double" : "DoubleType", # 64-bit double-precision floating point number; e.g., 2.718281828459045
+                "boolean" : "BooleanType", # boolean value; e.g., True or False
+                "byte" : "ByteType", # 8-bit signed integer; e.g., 127
+                "short" : "ShortType", # 16-bit signed integer; e.g., 32767
+                "binary" : "BinaryType", # byte array; e.g., b'\x00\x01'
+                "date" : "DateType", #  date without a time zone; e.g., date(2023, 10, 5)
+                "timestamp" : "TimestampType", # timestamp without a time zone; e.g., timestamp('2023-10-05 12:34:56')
+                "timestamp_ntz" : "TimestampNTZType", # timestamp without a time zone; e.g., timestamp('2023-10-05 12:34:56')
+                "array" : "ArrayType", # array of elements of a specified data type; e.g., [1, 2, 3]
+                "map" : "MapType", # map of key-value pairs, with specified data types for keys and values; e.g., {"key1": 1, "key2": 2}
+                "struct" : "StructType", # complex data type with multiple fields (like a row in a table)
+                "struct_field" : "StructField", # single field in a StructType
+                "null" : "NullType" # null value. Typically used internally and not explicitly
+            }
+            # ======== Set the correct data type, unknown types are strings
+            self._ReturnValue = self.get_Import("pyspark.sql.types", vSparkTypes.get(arg_Type, "StringType"))()
             self._ReturnStatus = True
             return self._ReturnValue
         except Exception as ExceptionError:
@@ -2600,32 +4507,124 @@ class Shared_MainLib:
             arg_Environment,
             arg_Payload
         ):
-        import os
-        from datadog_api_client import ApiClient, Configuration
-        from datadog_api_client.v2.api.logs_api import LogsApi
-        from datadog_api_client.v2.model.content_encoding import ContentEncoding
-        from datadog_api_client.v2.model.http_log import HTTPLog
-        from datadog_api_client.v2.model.http_log_item import HTTPLogItem
-        HTTP_Response = None
+        # ======== Queue the log for the background shipper, the job never waits on Datadog
         try:
-            # ======== Set the credentials on the environment
-            os.environ['DD_API_KEY'] = arg_KeyAPI
-            os.environ['DD_SITE'] = arg_SiteName
-            os.environ['ENV'] = arg_Environment
-            Request_Body = HTTPLog(
-                [
-                    HTTPLogItem(**arg_Payload)
-                ]
-            )
-            DD_Config = Configuration()
-            with ApiClient(DD_Config) as API_Client:
-                DD_Instance = LogsApi(API_Client)
-                # ======== Transfer the Payload to HTTP Request Body
-                HTTP_Response = DD_Instance.submit_log(body=Request_Body)
+            self.start_Shipper(arg_KeyAPI, arg_SiteName)
+            vPayload = dict(arg_Payload)
+            if "ddtags" not in vPayload:
+                vPayload["ddtags"] = f"env:{arg_Environment}"
+            HTTPLogItem = self.get_Import("datadog_api_client.v2.model.http_log_item", "HTTPLogItem")
+            Shared_MainLib._Shipper["Queue"].put_nowait(HTTPLogItem(**vPayload))
+            return True
         except Exception as ExceptionError:
+            # ======== Full queue or no client, the log is dropped instead of blocking the job
+            Shared_MainLib._Shipper["Dropped"] = Shared_MainLib._Shipper.get("Dropped", 0) + 1
             self._Exception = ExceptionError
-        return HTTP_Response
-    
+        return False
+
+    def start_Shipper (
+            self,
+            arg_KeyAPI,
+            arg_SiteName
+        ):
+        """
+        ╔═══════════════════════════════╗
+        ║ PROPER USAGE of CLOUD SHIPPER ║
+        ╚═══════════════════════════════╝
+        One Datadog client and one sender thread for the whole session
+        "Provider" : {
+            "Datadog" : {
+                "Shipper" : {
+                    "QueueSize" : 1000,    # Logs waiting to be sent; more are dropped, never blocking the job
+                    "BatchSize" : 100,     # Logs per submit_log call, sent gzip-encoded
+                    "Linger" : 1.0,        # Seconds to wait for more logs before sending a partial batch
+                    "FlushTimeout" : 10,   # Seconds flush_Shipper waits at exit
+                    "Host" : None          # Local HTTP stand-in, e.g., "http://localhost:8080"
+        """
+        import queue
+        import atexit
+        import threading
+        vLock = Shared_MainLib._Shipper.setdefault("Lock", threading.Lock())
+        with vLock:
+            if Shared_MainLib._Shipper.get("Thread") is not None and Shared_MainLib._Shipper["Thread"].is_alive():
+                return True
+            vConfig = self.LibConfig["Main"]["Provider"]["Datadog"]["Shipper"]
+            Configuration = self.get_Import("datadog_api_client", "Configuration")
+            ApiClient = self.get_Import("datadog_api_client", "ApiClient")
+            LogsApi = self.get_Import("datadog_api_client.v2.api.logs_api", "LogsApi")
+            if vConfig["Host"] is None:
+                vClientConfig = Configuration()
+                vClientConfig.server_variables["site"] = arg_SiteName
+            else:
+                vClientConfig = Configuration(host = vConfig["Host"])
+            # ======== Credentials on the client, not on os.environ
+            vClientConfig.api_key["apiKeyAuth"] = arg_KeyAPI
+            vClient = ApiClient(vClientConfig)
+            Shared_MainLib._Shipper.update({
+                "Queue" : queue.Queue(maxsize = vConfig["QueueSize"]),
+                "Client" : vClient,
+                "Logs" : LogsApi(vClient),
+                "Sent" : 0,
+                "Failed" : 0,
+                "Dropped" : Shared_MainLib._Shipper.get("Dropped", 0),
+                "Error" : None
+            })
+            Shared_MainLib._Shipper["Thread"] = threading.Thread(
+                target = self.run_Shipper,
+                name = "Cloud_Shipper",
+                daemon = True
+            )
+            Shared_MainLib._Shipper["Thread"].start()
+            if Shared_MainLib._Shipper.get("AtExit") is None:
+                atexit.register(self.flush_Shipper)
+                Shared_MainLib._Shipper["AtExit"] = True
+        return True
+
+    def run_Shipper (
+            self
+        ):
+        # ======== Sender thread: drains the queue in batches
+        import queue
+        vShipper = Shared_MainLib._Shipper
+        vConfig = self.LibConfig["Main"]["Provider"]["Datadog"]["Shipper"]
+        HTTPLog = self.get_Import("datadog_api_client.v2.model.http_log", "HTTPLog")
+        ContentEncoding = self.get_Import("datadog_api_client.v2.model.content_encoding", "ContentEncoding")
+        while True:
+            vBatch = [vShipper["Queue"].get()]
+            while len(vBatch) < vConfig["BatchSize"]:
+                try:
+                    vBatch.append(vShipper["Queue"].get(timeout = vConfig["Linger"]))
+                except queue.Empty:
+                    break
+            try:
+                vShipper["Logs"].submit_log(
+                    body = HTTPLog(vBatch),
+                    content_encoding = ContentEncoding.GZIP
+                )
+                vShipper["Sent"] = vShipper["Sent"] + len(vBatch)
+            except Exception as ExceptionError:
+                # ======== Kept on the shipper, self._Exception belongs to the job thread
+                vShipper["Failed"] = vShipper["Failed"] + len(vBatch)
+                vShipper["Error"] = str(ExceptionError)
+            finally:
+                for vItem in vBatch:
+                    vShipper["Queue"].task_done()
+
+    def flush_Shipper (
+            self,
+            arg_Timeout = None
+        ):
+        # ======== Wait until the queued logs are sent, e.g., before the notebook exits
+        import time
+        if Shared_MainLib._Shipper.get("Queue") is None:
+            return True
+        if arg_Timeout is None:
+            arg_Timeout = self.LibConfig["Main"]["Provider"]["Datadog"]["Shipper"]["FlushTimeout"]
+        vDeadline = time.monotonic() + arg_Timeout
+        while Shared_MainLib._Shipper["Queue"].unfinished_tasks > 0 and time.monotonic() < vDeadline:
+            time.sleep(0.05)
+        return Shared_MainLib._Shipper["Queue"].unfinished_tasks == 0
+
     def log_File (
             self,
             arg_LoggerName,
@@ -2708,12 +4707,14 @@ class Shared_MainLib:
                 vLogCloud["Caller"] = f"{arg_Caller}"
                 vResponse = self.fix_Dictionary(arg_Response)
                 vLogCloud["Response"] = vResponse
-                vLogCloud["service"] = dbutils.secrets.get (
+                # ======== Numeric, so the stage timings can be graphed in Datadog
+                vLogCloud["Stages"] = arg_Response["Header"]["App"]["Statistics"].get("Stages", {})
+                vLogCloud["service"] = self.get_Secret (
                         self.LibConfig["Main"]["Provider"]["Datadog"]["ServiceName"]["Scope"],
                         self.LibConfig["Main"]["Provider"]["Datadog"]["ServiceName"]["Key"]
                     )
                 self.log_Cloud (
-                    dbutils.secrets.get (
+                    self.get_Secret (
                         self.LibConfig["Main"]["Provider"]["Datadog"]["KeyAPI"]["Scope"],
                         self.LibConfig["Main"]["Provider"]["Datadog"]["KeyAPI"]["Key"]
                     ),
@@ -2834,12 +4835,13 @@ class Shared_MainLib:
                 if arg_Response is not None:
                     vResponse = self.fix_Dictionary(arg_Response)
                     vLogCloud["Response"] = vResponse
-                vLogCloud["service"] = dbutils.secrets.get (
+                    vLogCloud["Stages"] = arg_Response["Header"]["App"]["Statistics"].get("Stages", {})
+                vLogCloud["service"] = self.get_Secret (
                         self.LibConfig["Main"]["Provider"]["Datadog"]["ServiceName"]["Scope"],
                         self.LibConfig["Main"]["Provider"]["Datadog"]["ServiceName"]["Key"]
                     )
                 self.log_Cloud (
-                    dbutils.secrets.get (
+                    self.get_Secret (
                         self.LibConfig["Main"]["Provider"]["Datadog"]["KeyAPI"]["Scope"],
                         self.LibConfig["Main"]["Provider"]["Datadog"]["KeyAPI"]["Key"]
                     ),
@@ -2942,11 +4944,15 @@ class Shared_MainLib:
             arg_MediaClass,
             arg_DataLayer,
             arg_SubDir = None,
-            arg_Extension = None
+            arg_Extension = None,
+            arg_Date = None
         ):
         try:
             from datetime import datetime
-            vNow = datetime.now()
+            if arg_Date is None:
+                vNow = datetime.now()
+            else:
+                vNow = arg_Date
             vYear = vNow.year
             vMonth = vNow.strftime("%m")
             vDay = vNow.strftime("%d")
@@ -2979,6 +4985,41 @@ class Shared_MainLib:
             self._Exception = ExceptionError
         return False
 
+    def get_MediaPaths (
+            self,
+            arg_MediaParent,
+            arg_MediaType,
+            arg_MediaClass,
+            arg_DataLayer,
+            arg_SubDir,
+            arg_Extension,
+            arg_StartDate,
+            arg_EndDate
+        ):
+        # ======== Media Path of each day from StartDate to EndDate (YYYY-MM-DD)
+        try:
+            from datetime import datetime, timedelta
+            vDate = datetime.strptime(str(arg_StartDate), '%Y-%m-%d')
+            vEndDate = datetime.strptime(str(arg_EndDate), '%Y-%m-%d')
+            vMediaDirs = []
+            while vDate <= vEndDate:
+                vMediaDirs.append(
+                    self.get_MediaPath(
+                        arg_MediaParent,
+                        arg_MediaType,
+                        arg_MediaClass,
+                        arg_DataLayer,
+                        arg_SubDir,
+                        arg_Extension,
+                        vDate
+                    )
+                )
+                vDate += timedelta(days=1)
+            return vMediaDirs
+        except Exception as ExceptionError:
+            self._Exception = ExceptionError
+        return False
+
     def get_PHdatetime (
             self,
             arg_Convert = None
@@ -3084,3 +5125,73 @@ class Shared_MainLib:
 class MigrationError(Exception):
     # ======== Custom Error Exception for Data_Migration class
     pass
+
+class Spark_Listener:
+    # ======== SparkListener implemented over the Py4J callback server
+    # Sums the shuffle and spill of the completed Spark stages per job group
+    def __init__ (
+            self
+        ):
+        self.Groups = {}
+        self._StageGroups = {}
+        self._JobStages = {}
+
+    def onJobStart (
+            self,
+            arg_JobStart
+        ):
+        vProperties = arg_JobStart.properties()
+        vGroup = vProperties.getProperty("spark.jobGroup.id") if vProperties is not None else None
+        if vGroup is not None:
+            vStageIds = arg_JobStart.stageIds()
+            self._JobStages[arg_JobStart.jobId()] = [vStageIds.apply(vIndex) for vIndex in range(vStageIds.size())]
+            for vStageId in self._JobStages[arg_JobStart.jobId()]:
+                self._StageGroups[vStageId] = vGroup
+
+    def onJobEnd (
+            self,
+            arg_JobEnd
+        ):
+        # ======== Skipped stages never complete, forget them with their job
+        for vStageId in self._JobStages.pop(arg_JobEnd.jobId(), []):
+            self._StageGroups.pop(vStageId, None)
+
+    def onStageCompleted (
+            self,
+            arg_StageCompleted
+        ):
+        vStageInfo = arg_StageCompleted.stageInfo()
+        vGroup = self._StageGroups.pop(vStageInfo.stageId(), None)
+        vTaskMetrics = vStageInfo.taskMetrics()
+        if vGroup is not None and vTaskMetrics is not None:
+            vMetrics = self.Groups.setdefault(vGroup, {
+                "ShuffleRead" : 0,
+                "ShuffleWrite" : 0,
+                "Spill" : 0
+            })
+            vMetrics["ShuffleRead"] = vMetrics["ShuffleRead"] + vTaskMetrics.shuffleReadMetrics().totalBytesRead()
+            vMetrics["ShuffleWrite"] = vMetrics["ShuffleWrite"] + vTaskMetrics.shuffleWriteMetrics().bytesWritten()
+            vMetrics["Spill"] = vMetrics["Spill"] + vTaskMetrics.memoryBytesSpilled() + vTaskMetrics.diskBytesSpilled()
+
+    def pop_Metrics (
+            self,
+            arg_Group
+        ):
+        # ======== Metrics of a job group, removed once read
+        return self.Groups.pop(arg_Group, {
+            "ShuffleRead" : 0,
+            "ShuffleWrite" : 0,
+            "Spill" : 0
+        })
+
+    def __getattr__ (
+            self,
+            arg_Name
+        ):
+        # ======== Every other SparkListenerInterface event is ignored
+        if arg_Name.startswith("on"):
+            return lambda *arg_Event: None
+        raise AttributeError(arg_Name)
+
+    class Java:
+        implements = ["org.apache.spark.scheduler.SparkListenerInterface"]